@@ -1,76 +1,139 @@
+"""
+The package is laid out to be imported lazily: importing `sigmaepsilon.core`
+does no filesystem I/O and imports none of its submodules. The re-exported
+symbols, the package metadata (`__version__`, `__description__`) and the data
+paths (`SIGMAEPSILON_DATA_PATH`, `USER_DATA_PATH`, `EXAMPLES_PATH`) are resolved
+by a module-level `__getattr__` on first access and cached in the namespace
+of the package afterwards.
+"""
 import os
-from os.path import dirname, abspath
-import appdirs
 import warnings
-from typing import Optional
-from importlib.metadata import metadata
-
-from .wrapping import Wrapper
-from .typing import ishashable, issequence
-from .cp import classproperty
-from .infix import InfixOperator
-from .attr import attributor
-from .config import namespace_package_name
-
-__pkg_name__ = namespace_package_name(dirname(abspath(__file__)), 10)
-__pkg_metadata__ = metadata(__pkg_name__)
-__version__ = __pkg_metadata__["version"]
-__description__ = __pkg_metadata__["summary"]
-del __pkg_metadata__
+import importlib
+from os.path import dirname, abspath
+from typing import Optional, Any
 
 # catch annoying numpy/vtk future warning:
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
-# If available, a local vtk-data instance will be used for examples
-SIGMAEPSILON_DATA_PATH: Optional[str] = None
-if "SIGMAEPSILON_DATA_PATH" in os.environ:
-    SIGMAEPSILON_DATA_PATH = os.environ["SIGMAEPSILON_DATA_PATH"]
-    if not os.path.isdir(SIGMAEPSILON_DATA_PATH):
+# Set a parameter to control default print format for floats outside
+# of the plotter
+FLOAT_FORMAT = "{:.3e}"
+
+# the re-exported symbols and the submodules they live in
+_LAZY_IMPORTS = {
+    "Wrapper": ".wrapping",
+    "ishashable": ".typing",
+    "issequence": ".typing",
+    "classproperty": ".cp",
+    "InfixOperator": ".infix",
+    "attributor": ".attr",
+}
+
+
+def _get_pkg_name() -> str:
+    from .config import namespace_package_name
+
+    return namespace_package_name(dirname(abspath(__file__)), 10)
+
+
+def _get_pkg_metadata(key: str) -> str:
+    from .config import package_metadata
+
+    pkg_name = __getattr__("__pkg_name__")
+    return package_metadata(pkg_name, dirname(abspath(__file__)))[key]
+
+
+def _get_data_path() -> Optional[str]:
+    """
+    Returns the path of a local vtk-data instance, if available.
+    This is going to be used for examples.
+    """
+    if "SIGMAEPSILON_DATA_PATH" not in os.environ:
+        return None
+    data_path = os.environ["SIGMAEPSILON_DATA_PATH"]
+    if not os.path.isdir(data_path):
+        warnings.warn(f"SIGMAEPSILON_DATA_PATH: {data_path} is an invalid path")
+    if not os.path.isdir(os.path.join(data_path, "Data")):
         warnings.warn(
-            f"SIGMAEPSILON_DATA_PATH: {SIGMAEPSILON_DATA_PATH} is an invalid path"
+            f"SIGMAEPSILON_DATA_PATH: {os.path.join(data_path, 'Data')} does not exist"
         )
-    if not os.path.isdir(os.path.join(SIGMAEPSILON_DATA_PATH, "Data")):
+    return data_path
+
+
+def _get_user_data_path() -> str:
+    """
+    Returns the path of the user data directory and creates it if necessary.
+    """
+    # allow user to override the examples path
+    if "SIGMAEPSILON_USERDATA_PATH" in os.environ:  # pragma: no cover
+        user_data_path = os.environ["SIGMAEPSILON_USERDATA_PATH"]
+        if not os.path.isdir(user_data_path):
+            raise FileNotFoundError(
+                f"Invalid SIGMAEPSILON_USERDATA_PATH at {user_data_path}"
+            )
+        return user_data_path
+
+    import appdirs
+
+    user_data_path = appdirs.user_data_dir("SIGMAEPSILON")
+    try:
+        # Set up data directory
+        os.makedirs(user_data_path, exist_ok=True)
+    except Exception as e:
         warnings.warn(
-            f"SIGMAEPSILON_DATA_PATH: {os.path.join(SIGMAEPSILON_DATA_PATH, 'Data')} does not exist"
+            f'Unable to create `SIGMAEPSILON_USERDATA_PATH` at "{user_data_path}"\n'
+            f"Error: {e}\n\n"
+            "Override the default path by setting the environmental variable "
+            "`SIGMAEPSILON_USERDATA_PATH` to a writable path."
         )
+        user_data_path = ""
+    return user_data_path
 
-# allow user to override the examples path
-if "SIGMAEPSILON_USERDATA_PATH" in os.environ:  # pragma: no cover
-    USER_DATA_PATH = os.environ["SIGMAEPSILON_USERDATA_PATH"]
-    if not os.path.isdir(USER_DATA_PATH):
-        raise FileNotFoundError(
-            f"Invalid SIGMAEPSILON_USERDATA_PATH at {USER_DATA_PATH}"
-        )
-else:
-    USER_DATA_PATH = appdirs.user_data_dir("SIGMAEPSILON")
+
+def _get_examples_path() -> str:
+    """
+    Returns the path of the examples directory and creates it if necessary.
+    """
+    examples_path = os.path.join(__getattr__("USER_DATA_PATH"), "examples")
     try:
-        # Set up data directory
-        os.makedirs(USER_DATA_PATH, exist_ok=True)
+        os.makedirs(examples_path, exist_ok=True)
     except Exception as e:
         warnings.warn(
-            f'Unable to create `SIGMAEPSILON_USERDATA_PATH` at "{USER_DATA_PATH}"\n'
+            f'Unable to create `EXAMPLES_PATH` at "{examples_path}"\n'
             f"Error: {e}\n\n"
             "Override the default path by setting the environmental variable "
             "`SIGMAEPSILON_USERDATA_PATH` to a writable path."
         )
-        USER_DATA_PATH = ""
+        examples_path = ""
+    return examples_path
 
-EXAMPLES_PATH = os.path.join(USER_DATA_PATH, "examples")
-try:
-    os.makedirs(EXAMPLES_PATH, exist_ok=True)
-except Exception as e:
-    warnings.warn(
-        f'Unable to create `EXAMPLES_PATH` at "{EXAMPLES_PATH}"\n'
-        f"Error: {e}\n\n"
-        "Override the default path by setting the environmental variable "
-        "`SIGMAEPSILON_USERDATA_PATH` to a writable path."
-    )
-    EXAMPLES_PATH = ""
 
+# lazily resolved attributes of the package and the functions that compute them
+_LAZY_ATTRS = {
+    "__pkg_name__": _get_pkg_name,
+    "__version__": lambda: _get_pkg_metadata("version"),
+    "__description__": lambda: _get_pkg_metadata("summary"),
+    "SIGMAEPSILON_DATA_PATH": _get_data_path,
+    "USER_DATA_PATH": _get_user_data_path,
+    "EXAMPLES_PATH": _get_examples_path,
+}
 
-# Set a parameter to control default print format for floats outside
-# of the plotter
-FLOAT_FORMAT = "{:.3e}"
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_ATTRS:
+        value = _LAZY_ATTRS[name]()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache the value, the next access will not end up here
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_ATTRS))
 
 
 __all__ = [
@@ -4,15 +4,94 @@ Multiple solutions on how to enforce an abstract class property
 on an object. Generic types like 'List[int]' are not allowed, 
 because the don't work well with the isinstance()-like methods.
 """
+import os
+import warnings
 from typing import Callable
+from types import MappingProxyType
+from weakref import WeakKeyDictionary, WeakSet
 
-__all__ = ['abstract_class_property', 'setproperty']
+__all__ = [
+    'abstract_class_property',
+    'setproperty',
+    'get_validation_mode',
+    'set_validation_mode',
+]
+
+_NotFound = object()
+
+# The available validation modes:
+#   'always' : every instance is validated
+#   'class'  : class-level attributes are validated once per class, the rest
+#              for every instance
+#   'first'  : only the first instance of every class is validated
+#   'off'    : no validation
+VALIDATION_MODES = ('always', 'class', 'first', 'off')
+
+_validation_mode = os.environ.get('SIGMAEPSILON_ACP_VALIDATION', 'always')
+if _validation_mode not in VALIDATION_MODES:  # pragma: no cover
+    warnings.warn(
+        f'Invalid SIGMAEPSILON_ACP_VALIDATION "{_validation_mode}", '
+        f'it must be one of {VALIDATION_MODES}. Falling back to "always".'
+    )
+    _validation_mode = 'always'
+
+# the classes that have had an instance validated in the 'first' mode
+_validated_classes = WeakSet()
+
+# The abstract class properties collected from the MRO for every class,
+# and the ones among them that are not satisfied on the class itself.
+# Every class gets its own entry, subclasses don't reuse the tables of
+# their parents.
+_absclsprops_cache = WeakKeyDictionary()
+_instance_absclsprops_cache = WeakKeyDictionary()
 
 
 def abstract_class_property(**kwargs) -> Callable:
     return abstract_class_property_B(**kwargs)
 
 
+def get_validation_mode() -> str:
+    """
+    Returns the global validation mode of abstract class properties.
+    """
+    return _validation_mode
+
+
+def set_validation_mode(mode: str) -> None:
+    """
+    Sets the global validation mode of abstract class properties. The initial
+    value is taken from the environment variable `SIGMAEPSILON_ACP_VALIDATION`,
+    or it is `'always'` if the variable is not set.
+
+    Parameters
+    ----------
+    mode: str
+        One of the following:
+
+        * 'always' : every instance is validated
+        * 'class' : attributes available on the class with the correct type
+          are validated once per class, the rest for every instance
+        * 'first' : only the first instance of every class is validated
+        * 'off' : no validation at all
+
+    Notes
+    -----
+    The mode can also be set for a class (and its subclasses) using the class
+    attribute `__absclsprops_mode__`, which takes precedence over the global
+    setting.
+    """
+    global _validation_mode
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f'Invalid validation mode "{mode}", it must be one '
+                         f'of {VALIDATION_MODES}')
+    _validation_mode = mode
+    _validated_classes.clear()
+
+
+def _get_validation_mode(cls) -> str:
+    return getattr(cls, '__absclsprops_mode__', None) or _validation_mode
+
+
 def setproperty(**kwargs):
     def decorator(cls):
         for key, value in kwargs.items():
@@ -84,6 +163,12 @@ def abstract_class_property_B(**kwargs) -> Callable:
     Decorator function to decorate objects with abstract
     class properties. Leaves behind another decorator
     that takes a class as its input.
+
+    The abstract properties are collected from the MRO of a class only once,
+    when the first instance is created. By default, every instance is
+    validated against them. The validation can be relaxed or turned off
+    globally using :func:`~sigmaepsilon.core.acp.set_validation_mode`, or
+    for a class by setting the class attribute `__absclsprops_mode__`.
     """
 
     def abstractor(WrappedClass):
@@ -98,22 +183,55 @@ def abstract_class_property_B(**kwargs) -> Callable:
             _dummy_: None
 
             def __init__(self, *args, **kwargs):
-                WrappedClass.__init__(self)
-                self.__check_absclsprops__()
+                WrappedClass.__init__(self, *args, **kwargs)
+                cls = self.__class__
+                mode = _get_validation_mode(cls)
+                if mode == 'off':
+                    return
+                elif mode == 'first':
+                    if cls not in _validated_classes:
+                        self.__check_absclsprops__()
+                        _validated_classes.add(cls)
+                else:
+                    self.__check_absclsprops__()
                 return
 
             @classmethod
             def __absclsprops__(cls):
                 """
                 Collects the abstracts class properties and their
-                expected types based on the MRO of the class.
+                expected types based on the MRO of the class. The result
+                is computed once for every class.
+                """
+                res = _absclsprops_cache.get(cls, None)
+                if res is None:
+                    t = cls.__mro__
+                    l = [ti.__dict__.get('__annotations__', {}) for ti in t]
+                    res = dict()
+                    for d in l:
+                        for key, value in d.items():
+                            res[key] = value
+                    res = MappingProxyType(res)
+                    _absclsprops_cache[cls] = res
+                return res
+
+            @classmethod
+            def __instance_absclsprops__(cls):
+                """
+                Returns the abstract class properties that are not available
+                on the class with the correct type, hence they must be
+                validated for every instance. The class-level attributes are
+                validated only once, when this is called for the first time.
                 """
-                t = cls.__mro__
-                l = [ti.__dict__.get('__annotations__', {}) for ti in t]
-                res = dict()
-                for d in l:
-                    for key, value in d.items():
-                        res[key] = value
+                res = _instance_absclsprops_cache.get(cls, None)
+                if res is None:
+                    res = dict()
+                    for key, value in cls.__absclsprops__().items():
+                        clsvalue = getattr(cls, key, _NotFound)
+                        if clsvalue is _NotFound or not isinstance(clsvalue, value):
+                            res[key] = value
+                    res = MappingProxyType(res)
+                    _instance_absclsprops_cache[cls] = res
                 return res
 
             def __check_absclsprops__(self):
@@ -122,7 +240,11 @@ def abstract_class_property_B(**kwargs) -> Callable:
                 the anstract annotations. Returns True if every attribute is
                 a type-correct declaration.
                 """
-                props = self.__class__.__absclsprops__()
+                cls = self.__class__
+                if _get_validation_mode(cls) == 'class':
+                    props = cls.__instance_absclsprops__()
+                else:
+                    props = cls.__absclsprops__()
                 for key, value in props.items():
                     if not hasattr(self, key):
                         raise AttributeError(f'required attribute {key} not present '
@@ -1,6 +1,19 @@
-import toml
 import os
-from typing import Union, Iterable
+import json
+import tempfile
+import functools
+from types import MappingProxyType
+from typing import Union, Iterable, Mapping, Optional
+
+__all__ = [
+    "find_pyproject_toml",
+    "load_pyproject_config",
+    "namespace_package_name",
+    "package_metadata",
+]
+
+# the metadata fields stored for a package
+_METADATA_FIELDS = ("name", "version", "summary")
 
 
 def find_pyproject_toml(start_dir: str = None, max_depth: int = 10) -> Union[str, None]:
@@ -61,6 +74,8 @@ def load_pyproject_config(
         One or more section of the config file. If not specified, the entire content is returned.
         Default is None.
     """
+    import toml
+
     if not filepath:
         filepath = find_pyproject_toml()
 
@@ -85,7 +100,10 @@ def load_pyproject_config(
 def namespace_package_name(start_dir: str = None, max_depth: int = 10) -> str:
     """
     Returns the name of the SigmaEpsilon namespace package.
-    
+
+    The result is memoized, the directory walk is only performed once per
+    interpreter for every distinct set of arguments.
+
     Parameters
     ----------
     start_dir: str, Optional
@@ -100,9 +118,6 @@ def namespace_package_name(start_dir: str = None, max_depth: int = 10) -> str:
 
     if not isinstance(start_dir, str):
         raise TypeError("start_dir must be a string")
-    
-    current_dir = start_dir
-    depth = 0
 
     if not isinstance(max_depth, int):
         raise TypeError("max_depth must be an integer")
@@ -110,11 +125,19 @@ def namespace_package_name(start_dir: str = None, max_depth: int = 10) -> str:
     if not max_depth >= 0:
         raise ValueError("max_depth must be a positive integer")
 
-    while depth <= max_depth:        
+    return _namespace_package_name(start_dir, max_depth)
+
+
+@functools.lru_cache(maxsize=None)
+def _namespace_package_name(start_dir: str, max_depth: int) -> Union[str, None]:
+    current_dir = start_dir
+    depth = 0
+
+    while depth <= max_depth:
         parent_dir_path, current_dir_name = os.path.split(current_dir)
         parent_dir_name = os.path.split(parent_dir_path)[-1]
-        
-        if os.path.isdir(current_dir) and parent_dir_name=="sigmaepsilon":
+
+        if os.path.isdir(current_dir) and parent_dir_name == "sigmaepsilon":
             return ".".join([parent_dir_name, current_dir_name])
 
         parent_dir = os.path.dirname(current_dir)
@@ -123,3 +146,121 @@ def namespace_package_name(start_dir: str = None, max_depth: int = 10) -> str:
         depth += 1
 
     return None
+
+
+@functools.lru_cache(maxsize=None)
+def package_metadata(
+    package_name: str, install_path: str = None, cache_path: str = None
+) -> Mapping[str, str]:
+    """
+    Returns the name, the version and the summary of an installed distribution
+    as a read-only mapping.
+
+    Looking up the metadata of a distribution scans every `*.dist-info` folder
+    on `sys.path`. To avoid paying this more than necessary, the result is
+    memoized per interpreter and can optionally be persisted in a small JSON
+    file, keyed by the installation path and its modification time.
+
+    Parameters
+    ----------
+    package_name: str
+        The name of the distribution, eg. 'sigmaepsilon.core'.
+    install_path: str, Optional
+        The folder of the installed package. It is used to invalidate the
+        on-disk cache. Default is None.
+    cache_path: str, Optional
+        The path of a JSON file to persist the metadata in. If not provided,
+        the environment variable `SIGMAEPSILON_METADATA_CACHE` is used if it is set,
+        otherwise nothing is persisted. Default is None.
+
+    Example
+    -------
+    >>> from sigmaepsilon.core.config import package_metadata
+    >>> package_metadata("sigmaepsilon.core")["version"]  # doctest: +SKIP
+    '1.2.2'
+    """
+    if cache_path is None:
+        cache_path = os.environ.get("SIGMAEPSILON_METADATA_CACHE", None)
+
+    if not cache_path:
+        return MappingProxyType(_read_package_metadata(package_name)[0])
+
+    key = f"{package_name}@{install_path}"
+    cache = _load_metadata_cache(cache_path)
+    entry = cache.get(key, None)
+    if entry is not None and _metadata_cache_entry_is_valid(entry, install_path):
+        return MappingProxyType(entry["metadata"])
+
+    metadata, dist_path = _read_package_metadata(package_name)
+    cache[key] = {
+        "install_path": [install_path, _mtime(install_path)],
+        "dist_path": [dist_path, _mtime(dist_path)],
+        "metadata": metadata,
+    }
+    _dump_metadata_cache(cache_path, cache)
+    return MappingProxyType(metadata)
+
+
+def _read_package_metadata(package_name: str) -> tuple[dict, Optional[str]]:
+    """
+    Reads the metadata of a distribution and returns it with the path
+    of its metadata folder (or `None` if it is not available).
+    """
+    from importlib.metadata import distribution
+
+    dist = distribution(package_name)
+    metadata = {field: dist.metadata[field] for field in _METADATA_FIELDS}
+    dist_path = getattr(dist, "_path", None)
+    return metadata, (str(dist_path) if dist_path is not None else None)
+
+
+def _mtime(path: Optional[str]) -> Optional[int]:
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _metadata_cache_entry_is_valid(entry: dict, install_path: Optional[str]) -> bool:
+    try:
+        cached_install_path, install_mtime = entry["install_path"]
+        dist_path, dist_mtime = entry["dist_path"]
+    except (KeyError, TypeError, ValueError):
+        return False
+    if cached_install_path != install_path:
+        return False
+    if install_mtime != _mtime(install_path):
+        return False
+    if dist_path is not None and dist_mtime != _mtime(dist_path):
+        return False
+    return True
+
+
+def _load_metadata_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _dump_metadata_cache(cache_path: str, cache: dict) -> None:
+    """
+    Writes the cache to a temporary file first, which is then moved to its
+    final place, so that concurrent readers never see a half-written file.
+    Failing to persist the cache is not an error.
+    """
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(os.path.abspath(cache_path))
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -3,14 +3,14 @@ Class property borrowed from the astropy package.
 """
 import functools
 import threading
+from typing import Iterable, Optional
+from weakref import WeakKeyDictionary
 
 _NotFound = object()
 
-__all__ = ["classproperty"]
+__all__ = ["classproperty", "ClassPropertyMeta", "cachedproperty"]
+
 
-# TODO: This can still be made to work for setters by implementing an
-# accompanying metaclass that supports it; we just don't need that right
-# this moment
 class classproperty(property):
     """
     Similar to `property`, but allows class-level properties.  That is,
@@ -20,10 +20,12 @@ class classproperty(property):
     (it is implicit through use of this decorator).
     
     .. note::
-        classproperty only works for *read-only* properties.  It does not
-        currently allow writeable/deletable properties, due to subtleties of how
-        Python descriptors work.  In order to implement such properties on a class,
-        a metaclass for that class must be implemented.
+        Due to subtleties of how Python descriptors work, a setter or a deleter
+        only takes effect if the class is created by
+        :class:`~sigmaepsilon.core.cp.ClassPropertyMeta` (or a subclass of it),
+        defining a property with a setter or a deleter in other classes raises
+        a `TypeError`. Class-level properties can't be set or deleted through
+        instances.
         
     Parameters
     ----------
@@ -39,7 +41,23 @@ class classproperty(property):
         of an attribute).  This is analogous to `lazyproperty`.  The ``lazy``
         argument can also be used when `classproperty` is used as a decorator
         (see the third example below).  When used in the decorator syntax this
-        *must* be passed in as a keyword argument.
+        *must* be passed in as a keyword argument. The cached values are held
+        for as long as the class is alive, reading a cached value never acquires
+        a lock. Cached values can be reset using :func:`invalidate` and
+        :func:`invalidate_all`.
+    fset: callable, optional
+        The function that sets the value of the property, taking the class and
+        the value as arguments. It can also be defined using the `setter`
+        decorator.
+    fdel: callable, optional
+        The function that deletes the property, taking the class as its sole
+        argument. It can also be defined using the `deleter` decorator.
+    depends_on: Iterable[str], optional
+        The names of the class attributes the value of a lazy property depends
+        on. If the class is created by :class:`~sigmaepsilon.core.cp.ClassPropertyMeta`,
+        the cached values are invalidated when any of these attributes is
+        set or deleted on the class. The cached values are also invalidated
+        when the setter or the deleter of the property runs.
         
     Examples
     --------
@@ -58,9 +76,8 @@ class classproperty(property):
         >>> foo_instance._bar_internal = 2
         >>> foo_instance.bar  # Ignores instance attributes
         2
-    As previously noted, a `classproperty` is limited to implementing
-    read-only attributes::
-        >>> class Foo:
+    Writeable class-level properties require the companion metaclass::
+        >>> class Foo(metaclass=ClassPropertyMeta):
         ...     _bar_internal = 1
         ...     @classproperty
         ...     def bar(cls):
@@ -69,10 +86,9 @@ class classproperty(property):
         ...     def bar(cls, value):
         ...         cls._bar_internal = value
         ...
-        Traceback (most recent call last):
-        ...
-        NotImplementedError: classproperty can only be read-only; use a
-        metaclass to implement modifiable class-level properties
+        >>> Foo.bar = 2
+        >>> Foo.bar
+        2
     When the ``lazy`` option is used, the getter is only called once::
         >>> class Foo:
         ...     @classproperty(lazy=True)
@@ -95,27 +111,72 @@ class classproperty(property):
         1
         >>> FooSub.bar
         1
+    A cached value can be reset for a class, then the getter is called
+    again on the next access::
+        >>> vars(Foo)["bar"].invalidate(Foo)
+        >>> Foo.bar
+        Performing complicated calculation
+        1
+    With the companion metaclass, cached values are invalidated automatically
+    if a class attribute they depend on changes::
+        >>> class Foo(metaclass=ClassPropertyMeta):
+        ...     _bar_internal = 1
+        ...     @classproperty(lazy=True, depends_on=["_bar_internal"])
+        ...     def bar(cls):
+        ...         print("Performing complicated calculation")
+        ...         return cls._bar_internal
+        ...
+        >>> Foo.bar
+        Performing complicated calculation
+        1
+        >>> Foo._bar_internal = 2
+        >>> Foo.bar
+        Performing complicated calculation
+        2
     """
 
-    def __new__(cls, fget=None, doc=None, lazy=False):
+    def __new__(
+        cls, fget=None, doc=None, lazy=False, fset=None, fdel=None, depends_on=None
+    ):
         if fget is None:
             # Being used as a decorator--return a wrapper that implements
             # decorator syntax
             def wrapper(func):
-                return cls(func, lazy=lazy)
+                return cls(
+                    func,
+                    doc=doc,
+                    lazy=lazy,
+                    fset=fset,
+                    fdel=fdel,
+                    depends_on=depends_on,
+                )
 
             return wrapper
 
         return super().__new__(cls)
 
-    def __init__(self, fget, doc=None, lazy=False):
+    def __init__(
+        self,
+        fget,
+        doc: Optional[str] = None,
+        lazy: bool = False,
+        fset=None,
+        fdel=None,
+        depends_on: Optional[Iterable[str]] = None,
+    ):
         self._lazy = lazy
+        self._doc = doc
+        self._depends_on = frozenset(depends_on or ())
         if lazy:
-            self._lock = threading.RLock()  # Protects _cache
-            self._cache = {}
+            self._lock = threading.RLock()  # Protects writes to _cache
+            # the classes are referenced weakly, so that dynamically created
+            # classes are not kept alive by the cache
+            self._cache = WeakKeyDictionary()
         fget = self._wrap_fget(fget)
+        fset = self._unwrap_classmethod(fset)
+        fdel = self._unwrap_classmethod(fdel)
 
-        super().__init__(fget=fget, doc=doc)
+        super().__init__(fget=fget, fset=fset, fdel=fdel, doc=doc)
 
         # There is a buglet in Python where self.__doc__ doesn't
         # get set properly on instances of property subclasses if
@@ -125,6 +186,17 @@ class classproperty(property):
         if doc is not None:
             self.__doc__ = doc
 
+    def __set_name__(self, owner, name):
+        if (self.fset is not None or self.fdel is not None) and not isinstance(
+            owner, ClassPropertyMeta
+        ):
+            # assigning to the class would silently replace the property
+            raise TypeError(
+                f"classproperty '{name}' of '{owner.__name__}' has a setter or "
+                "a deleter, which requires the class to be created by "
+                "ClassPropertyMeta."
+            )
+
     def __get__(self, obj, objtype):
         if self._lazy:
             val = self._cache.get(objtype, _NotFound)
@@ -142,25 +214,69 @@ class classproperty(property):
             val = self.fget.__wrapped__(objtype)
         return val
 
+    def __set__(self, obj, value):
+        raise AttributeError(
+            "classproperty can only be set on the class, not on its instances"
+        )
+
+    def __delete__(self, obj):
+        raise AttributeError(
+            "classproperty can only be deleted on the class, not on its instances"
+        )
+
+    @property
+    def depends_on(self) -> frozenset:
+        """
+        Returns the names of the class attributes the property depends on.
+        """
+        return self._depends_on
+
+    def invalidate(self, cls: type) -> None:
+        """
+        Removes the cached value of a lazy property for a class, if there is any.
+        """
+        if self._lazy:
+            with self._lock:
+                self._cache.pop(cls, None)
+
+    def invalidate_all(self) -> None:
+        """
+        Removes the cached values of a lazy property for all classes.
+        """
+        if self._lazy:
+            with self._lock:
+                self._cache.clear()
+
+    def _copy(self, **kwargs) -> "classproperty":
+        params = dict(
+            fget=self.fget.__wrapped__,
+            doc=self._doc,
+            lazy=self._lazy,
+            fset=self.fset,
+            fdel=self.fdel,
+            depends_on=self._depends_on,
+        )
+        params.update(kwargs)
+        return type(self)(**params)
+
     def getter(self, fget):
-        return super().getter(self._wrap_fget(fget))
+        return self._copy(fget=fget)
 
     def setter(self, fset):
-        raise NotImplementedError(
-            "classproperty can only be read-only; use a metaclass to "
-            "implement modifiable class-level properties"
-        )
+        return self._copy(fset=fset)
 
     def deleter(self, fdel):
-        raise NotImplementedError(
-            "classproperty can only be read-only; use a metaclass to "
-            "implement modifiable class-level properties"
-        )
+        return self._copy(fdel=fdel)
+
+    @staticmethod
+    def _unwrap_classmethod(func):
+        if isinstance(func, classmethod):
+            func = func.__func__
+        return func
 
     @staticmethod
     def _wrap_fget(orig_fget):
-        if isinstance(orig_fget, classmethod):
-            orig_fget = orig_fget.__func__
+        orig_fget = classproperty._unwrap_classmethod(orig_fget)
 
         # Using stock functools.wraps instead of the fancier version
         # found later in this module, which is overkill for this purpose
@@ -170,3 +286,281 @@ class classproperty(property):
             return orig_fget(obj.__class__)
 
         return fget
+
+
+def _find_classproperty(cls: type, name: str) -> Optional[classproperty]:
+    """
+    Returns the classproperty called `name` in the MRO of a class, or `None`.
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            value = klass.__dict__[name]
+            return value if isinstance(value, classproperty) else None
+    return None
+
+
+def _invalidate_subtree(prop: classproperty, cls: type) -> None:
+    """
+    Invalidates the cached values of a lazy property for a class and all
+    of its subclasses, since they inherit the attributes of the class.
+    """
+    prop.invalidate(cls)
+    for subclass in cls.__subclasses__():
+        _invalidate_subtree(prop, subclass)
+
+
+def _invalidate_dependents(cls: type, name: str) -> None:
+    """
+    Invalidates the cached values of the lazy class-level properties
+    of a class that depend on the attribute `name`.
+    """
+    seen = set()
+    for klass in cls.__mro__:
+        for key, value in klass.__dict__.items():
+            if key in seen:
+                continue
+            seen.add(key)
+            if isinstance(value, classproperty) and name in value.depends_on:
+                _invalidate_subtree(value, cls)
+
+
+class ClassPropertyMeta(type):
+    """
+    Companion metaclass of :class:`~sigmaepsilon.core.cp.classproperty`, that
+    makes class-level properties writeable and deletable and keeps the cached
+    values of lazy class-level properties up to date.
+
+    When an attribute of a class is set or deleted,
+
+    (a) the setter or the deleter of a classproperty with the same name is
+        called, if there is one. An `AttributeError` is raised if the property
+        is read-only.
+    (b) the cached values of the lazy classproperties of the class that depend
+        on the attribute are invalidated, for the class and all of its
+        subclasses.
+
+    Reading a class-level property is not affected by the metaclass.
+
+    To use it alongside other metaclasses, combine them by inheritance,
+    eg. `class Meta(ClassPropertyMeta, ABCMeta): ...`.
+
+    See also
+    --------
+    :class:`~sigmaepsilon.core.cp.classproperty`
+    """
+
+    def __setattr__(cls, name, value):
+        prop = _find_classproperty(cls, name)
+        if prop is None:
+            super().__setattr__(name, value)
+        else:
+            if prop.fset is None:
+                raise AttributeError(f"can't set read-only classproperty '{name}'")
+            prop.fset(cls, value)
+            _invalidate_subtree(prop, cls)
+        _invalidate_dependents(cls, name)
+
+    def __delattr__(cls, name):
+        prop = _find_classproperty(cls, name)
+        if prop is None:
+            super().__delattr__(name)
+        else:
+            if prop.fdel is None:
+                raise AttributeError(
+                    f"can't delete read-only classproperty '{name}'"
+                )
+            prop.fdel(cls)
+            _invalidate_subtree(prop, cls)
+        _invalidate_dependents(cls, name)
+
+
+class cachedproperty:
+    """
+    Instance-level counterpart of a lazy :class:`~sigmaepsilon.core.cp.classproperty`.
+    The value is computed on first access and stored in the instance, either
+    in its `__dict__` or in a slot. The names of the attributes the value
+    depends on can be declared and the cached value is invalidated when any
+    of them is set or deleted on the instance.
+
+    When the value is stored in the `__dict__` of the instance, subsequent
+    reads don't call the descriptor at all, just like with
+    :func:`functools.cached_property`. Classes without a `__dict__` must
+    declare a slot to store the value in.
+
+    .. note::
+        Dependency tracking hooks the `__setattr__` and `__delattr__` methods
+        of the class defining the property. Changes made to the dependencies
+        in place (eg. modifying an array) are not detected, use
+        :func:`invalidate` in such cases.
+
+    Parameters
+    ----------
+    fget: callable
+        The function that computes the value of the property.
+    depends_on: Iterable[str], optional
+        The names of the attributes the value depends on.
+    slot: str, optional
+        The name of a slot to store the value in. If not provided, the value
+        is stored in the `__dict__` of the instance.
+
+    Examples
+    --------
+    ::
+        >>> class Foo:
+        ...     def __init__(self, a):
+        ...         self.a = a
+        ...     @cachedproperty(depends_on=["a"])
+        ...     def bar(self):
+        ...         print("Performing complicated calculation")
+        ...         return self.a * 2
+        ...
+        >>> foo = Foo(1)
+        >>> foo.bar
+        Performing complicated calculation
+        2
+        >>> foo.bar
+        2
+        >>> foo.a = 2
+        >>> foo.bar
+        Performing complicated calculation
+        4
+    Storing the value in a slot::
+        >>> class Foo:
+        ...     __slots__ = ("a", "_bar")
+        ...     def __init__(self, a):
+        ...         self.a = a
+        ...     @cachedproperty(depends_on=["a"], slot="_bar")
+        ...     def bar(self):
+        ...         return self.a * 2
+    """
+
+    def __new__(cls, fget=None, depends_on=None, slot=None):
+        if fget is None:
+            # Being used as a decorator--return a wrapper that implements
+            # decorator syntax
+            def wrapper(func):
+                return cls(func, depends_on=depends_on, slot=slot)
+
+            return wrapper
+
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        fget,
+        depends_on: Optional[Iterable[str]] = None,
+        slot: Optional[str] = None,
+    ):
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+        self._depends_on = frozenset(depends_on or ())
+        self._slot_name = slot
+        self._slot = None
+        self.name = None
+
+    @property
+    def depends_on(self) -> frozenset:
+        """
+        Returns the names of the attributes the property depends on.
+        """
+        return self._depends_on
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        if self._slot_name is not None:
+            for klass in owner.__mro__:
+                if self._slot_name in klass.__dict__:
+                    self._slot = klass.__dict__[self._slot_name]
+                    break
+            if self._slot is None:
+                raise TypeError(
+                    f"'{owner.__name__}' has no slot called '{self._slot_name}'"
+                )
+        if self._depends_on:
+            _track_dependencies(owner, self)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self._slot is not None:
+            value = self._get_from_slot(obj)
+            if value is _NotFound:
+                value = self.fget(obj)
+                self._slot.__set__(obj, value)
+            return value
+        if self.name is None:
+            raise TypeError(
+                "Cannot use cachedproperty instance without calling "
+                "__set_name__ on it."
+            )
+        # the value is not in the __dict__ of the instance yet, otherwise
+        # we wouldn't be here
+        try:
+            cache = obj.__dict__
+        except AttributeError:
+            raise TypeError(
+                f"'{type(obj).__name__}' instances have no '__dict__' to cache "
+                f"'{self.name}' in, specify a slot to store the value in."
+            ) from None
+        value = self.fget(obj)
+        cache[self.name] = value
+        return value
+
+    def _get_from_slot(self, obj):
+        try:
+            return self._slot.__get__(obj, type(obj))
+        except AttributeError:
+            return _NotFound
+
+    def invalidate(self, obj) -> None:
+        """
+        Removes the cached value from an instance, if there is any.
+        """
+        if self._slot is not None:
+            if self._get_from_slot(obj) is not _NotFound:
+                self._slot.__delete__(obj)
+        else:
+            cache = getattr(obj, "__dict__", None)
+            if cache is not None:
+                cache.pop(self.name, None)
+
+
+def _track_dependencies(owner: type, prop: cachedproperty) -> None:
+    """
+    Registers the dependencies of a cachedproperty in its owner class and
+    hooks the `__setattr__` and `__delattr__` methods of the class to
+    invalidate the cached values if a dependency changes.
+    """
+    if "__cachedproperty_deps__" not in owner.__dict__:
+        inherited = getattr(owner, "__cachedproperty_deps__", None)
+        deps = dict(inherited) if inherited else {}
+        type.__setattr__(owner, "__cachedproperty_deps__", deps)
+        if inherited is None:
+            # the hooks are inherited by the subclasses
+            _hook_attribute_access(owner)
+
+    deps = owner.__dict__["__cachedproperty_deps__"]
+    for name in prop.depends_on:
+        deps[name] = deps.get(name, ()) + (prop,)
+
+
+def _hook_attribute_access(owner: type) -> None:
+    orig_setattr = owner.__setattr__
+    orig_delattr = owner.__delattr__
+
+    def __setattr__(self, name, value):
+        orig_setattr(self, name, value)
+        dependents = type(self).__cachedproperty_deps__.get(name, None)
+        if dependents:
+            for prop in dependents:
+                prop.invalidate(self)
+
+    def __delattr__(self, name):
+        orig_delattr(self, name)
+        dependents = type(self).__cachedproperty_deps__.get(name, None)
+        if dependents:
+            for prop in dependents:
+                prop.invalidate(self)
+
+    type.__setattr__(owner, "__setattr__", __setattr__)
+    type.__setattr__(owner, "__delattr__", __delattr__)
@@ -13,19 +13,151 @@ Examples
 
 from functools import partial
 import os
+import sys
+import errno
+import base64
+import mmap
+import asyncio
+import argparse
+import time
+import json
 import shutil
-from urllib.request import urlretrieve
+import hashlib
+import tempfile
+import threading
+import warnings
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import url2pathname, getproxies, proxy_bypass
+from urllib.parse import urlsplit, urlunsplit, urljoin, unquote
+from urllib.error import HTTPError, URLError
 import zipfile
-from typing import Optional
-from types import ModuleType
+from types import MappingProxyType
+from typing import (
+    Optional,
+    Iterable,
+    List,
+    Tuple,
+    Callable,
+    IO,
+    Any,
+    Dict,
+    Union,
+)
 
 from .thirdparty import import_package
 from . import EXAMPLES_PATH, SIGMAEPSILON_DATA_PATH as DATA_PATH
 
-pyvista: Optional[ModuleType] = import_package("pyvista")
+try:
+    import fcntl
 
+    def _lock_fd(fd: int, blocking: bool = True) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
 
-__all__ = ["download_file", "delete_downloads"]
+    def _unlock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+except ImportError:  # pragma: no cover
+    import msvcrt
+
+    fcntl = None
+
+    def _lock_fd(fd: int, blocking: bool = True) -> None:
+        if not blocking:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return
+        while True:
+            try:
+                # blocks for about 10 seconds before raising an error
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+__all__ = [
+    "download_file",
+    "download_files",
+    "adownload_file",
+    "adownload_files",
+    "open_archive",
+    "LazyArchive",
+    "map_file",
+    "MappedFile",
+    "prefetch",
+    "register_retriever",
+    "unregister_retriever",
+    "get_retrievers",
+    "mirror_retriever",
+    "get_cache_entry",
+    "delete_downloads",
+    "prune_downloads",
+    "get_cache_policy",
+    "set_cache_policy",
+]
+
+# the base url of the data repository
+DATA_URL = "https://github.com/sigma-epsilon/sigmaepsilon.data/raw/main"
+# the size of the chunks in bytes a file is streamed to the disk with
+CHUNK_SIZE = 64 * 1024
+# the number of times a failed download is retried
+MAX_RETRIES = 3
+# the delay in seconds before the first retry, doubled after every attempt
+RETRY_BACKOFF = 0.5
+# the timeout of http requests in seconds
+TIMEOUT = 30
+# the maximum number of redirects followed by an http request
+MAX_REDIRECTS = 5
+# the strategies of populating the examples directory from local sources,
+# in the order they are tried by the 'auto' strategy
+POPULATE_STRATEGIES = ("hardlink", "reflink", "symlink", "copy")
+# the default strategy, one of POPULATE_STRATEGIES or 'auto'
+POPULATE_STRATEGY = os.environ.get("SIGMAEPSILON_POPULATE_STRATEGY", "auto")
+# the request code of the ioctl that clones a file on Linux
+_FICLONE = 0x40049409
+# http status codes of failures that are worth retrying
+_RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+# the name of the manifest of the downloaded files in the examples directory
+MANIFEST_FILENAME = ".manifest.json"
+# the name of the lock file of the manifest in the examples directory
+MANIFEST_LOCK_FILENAME = ".manifest.lock"
+# the name of the directory of the lock files in the examples directory
+LOCKS_DIRNAME = ".locks"
+# the prefix of the temporary files and directories in the examples directory
+_TMP_PREFIX = ".tmp"
+# the access times of the files in the manifest are updated if they are
+# older than this many seconds
+ACCESS_TIME_RESOLUTION = 60
+
+# the eviction policies of the examples directory
+CACHE_POLICIES = ("lru", "lfu")
+
+_cache_policy = os.environ.get("SIGMAEPSILON_CACHE_POLICY", "lru")
+if _cache_policy not in CACHE_POLICIES:  # pragma: no cover
+    warnings.warn(
+        f'Invalid SIGMAEPSILON_CACHE_POLICY "{_cache_policy}", '
+        f'it must be one of {CACHE_POLICIES}. Falling back to "lru".'
+    )
+    _cache_policy = "lru"
+
+_cache_max_size = os.environ.get("SIGMAEPSILON_CACHE_MAX_SIZE", None)
+if _cache_max_size is not None:  # pragma: no cover
+    try:
+        _cache_max_size = int(_cache_max_size)
+    except ValueError:
+        warnings.warn(
+            f'Invalid SIGMAEPSILON_CACHE_MAX_SIZE "{_cache_max_size}", '
+            "it must be an integer. The size of the cache is not limited."
+        )
+        _cache_max_size = None
+
+_manifest_lock = threading.RLock()
+# path of a manifest -> (modification time, size, entries)
+_manifest_state = {}
 
 
 def _check_examples_path():
@@ -38,101 +170,1174 @@ def _check_examples_path():
         )
 
 
-def _decompress(filename):
+class _FileLock:
+    """
+    An exclusive lock on a file, which is held across threads and processes.
+    The lock files are never deleted, since that would allow two parties to
+    lock two different files of the same path.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquires the lock and returns True. If `blocking` is False and the
+        lock is held by someone else, it returns False immediately.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock_fd(fd, blocking)
+        except OSError:
+            os.close(fd)
+            if blocking:
+                raise
+            return False
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        try:
+            _unlock_fd(fd)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "_FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+def _lock_path(name: str) -> str:
+    return os.path.join(EXAMPLES_PATH, LOCKS_DIRNAME, os.path.basename(name) + ".lock")
+
+
+def _is_reserved(name: str) -> bool:
+    """
+    Returns True if `name` is reserved for the bookkeeping of the examples
+    directory (the manifest, the locks and the temporary files), hence no
+    dataset can be stored under it.
+    """
+    name = os.path.basename(os.path.normpath(name))
+    reserved = (MANIFEST_FILENAME, MANIFEST_LOCK_FILENAME, LOCKS_DIRNAME)
+    return name in reserved or name.startswith(_TMP_PREFIX)
+
+
+def _check_filename(filename: str) -> None:
+    if _is_reserved(filename):
+        raise ValueError(
+            f'"{filename}" is a reserved name of the examples directory, '
+            "it can't be downloaded."
+        )
+
+
+def _remove_path(local_path: str) -> None:
+    if os.path.islink(local_path) or os.path.isfile(local_path):
+        os.remove(local_path)
+    elif os.path.isdir(local_path):
+        shutil.rmtree(local_path, ignore_errors=True)
+
+
+def _reflink(path: str, local_path: str) -> None:
+    """
+    Creates a copy-on-write clone of a file, which shares the blocks of
+    the original until one of them is modified. Only supported on Linux
+    filesystems like Btrfs and XFS, an OSError is raised otherwise.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported.")
+    with open(path, "rb") as source, open(local_path, "wb") as target:
+        fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+
+
+def _hardlink_path(path: str, local_path: str) -> None:
+    if os.path.isdir(path):
+        shutil.copytree(path, local_path, copy_function=os.link)
+    else:
+        os.link(path, local_path)
+
+
+def _reflink_path(path: str, local_path: str) -> None:
+    if os.path.isdir(path):
+        shutil.copytree(path, local_path, copy_function=_reflink)
+    else:
+        _reflink(path, local_path)
+
+
+def _symlink_path(path: str, local_path: str) -> None:
+    os.symlink(os.path.abspath(path), local_path, os.path.isdir(path))
+
+
+def _copy_path(path: str, local_path: str) -> None:
+    if os.path.isdir(path):
+        shutil.copytree(path, local_path)
+    else:
+        shutil.copy(path, local_path)
+
+
+_POPULATE_FUNCTIONS = {
+    "hardlink": _hardlink_path,
+    "reflink": _reflink_path,
+    "symlink": _symlink_path,
+    "copy": _copy_path,
+}
+
+
+def _populate_strategies(strategy: Union[str, Iterable[str], None]) -> Tuple[str]:
+    if strategy is None:
+        strategy = POPULATE_STRATEGY
+    if isinstance(strategy, str):
+        strategy = POPULATE_STRATEGIES if strategy == "auto" else (strategy,)
+    strategy = tuple(strategy)
+    for name in strategy:
+        if name not in _POPULATE_FUNCTIONS:
+            raise ValueError(
+                f'Invalid strategy "{name}", it must be "auto" or one '
+                f"of {POPULATE_STRATEGIES}"
+            )
+    if len(strategy) == 0:
+        raise ValueError("At least one strategy must be specified.")
+    return strategy
+
+
+def _populate(
+    path: str, local_path: str, strategy: Union[str, Iterable[str], None] = None
+) -> str:
+    """
+    Populates `local_path` from a file or a directory on the local filesystem
+    and returns the name of the strategy that succeeded.
+
+    The strategies are tried in order, a strategy fails if it is not
+    supported, eg. hard links can't span filesystems and reflinks need a
+    filesystem that supports copy-on-write. The result is created at a
+    temporary path next to `local_path` first, which is renamed to
+    `local_path` in the end, so that `local_path` never refers to an
+    incomplete file or directory.
+    """
+    strategies = _populate_strategies(strategy)
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(local_path), prefix=_TMP_PREFIX)
+    try:
+        tmp_path = os.path.join(tmp_dir, os.path.basename(local_path))
+        for i, name in enumerate(strategies):
+            try:
+                _POPULATE_FUNCTIONS[name](path, tmp_path)
+                break
+            except OSError:
+                _remove_path(tmp_path)
+                if i == len(strategies) - 1:
+                    raise
+        if os.path.isdir(local_path) and not os.path.islink(local_path):
+            _remove_path(local_path)
+        os.replace(tmp_path, local_path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return name
+
+
+def _is_archive(filename: str) -> bool:
+    return os.path.splitext(filename)[1].lower() == ".zip"
+
+
+def _member_path(dest_dir: str, name: str) -> str:
+    """
+    Returns the path a member of an archive is extracted to, and makes sure
+    that it is inside `dest_dir`.
+    """
+    dest_dir = os.path.abspath(dest_dir)
+    path = os.path.normpath(os.path.join(dest_dir, name))
+    if not path.startswith(dest_dir + os.sep):
+        raise ValueError(f"Invalid member {name} in archive.")
+    return path
+
+
+def _extract_members(
+    zip_ref: zipfile.ZipFile,
+    members: List[zipfile.ZipInfo],
+    dest_dir: str,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """
+    Extracts members of an archive to `dest_dir` by streaming their contents
+    in chunks. If `progress` is provided, it is called with the number of
+    extracted bytes and the total number of bytes after every chunk.
+    """
+    total = sum(info.file_size for info in members)
+    done = 0
+    if progress is not None:
+        progress(done, total)
+    for info in members:
+        path = _member_path(dest_dir, info.filename)
+        if info.is_dir():
+            os.makedirs(path, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with zip_ref.open(info, "r") as source, open(path, "wb") as target:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                target.write(chunk)
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, total)
+
+
+def _decompress(filename, progress: Optional[Callable[[int, int], None]] = None):
+    """
+    Extracts an archive to a temporary directory next to it first, and
+    moves the extracted items to the examples directory one by one.
+    """
+    _check_examples_path()
+    tmp_dir = tempfile.mkdtemp(dir=EXAMPLES_PATH, prefix=_TMP_PREFIX)
+    try:
+        with zipfile.ZipFile(filename, "r") as zip_ref:
+            members = []
+            for info in zip_ref.infolist():
+                if _is_reserved(info.filename.split("/")[0]):
+                    warnings.warn(
+                        f"Skipping the member {info.filename} of {filename}, "
+                        "it has a reserved name."
+                    )
+                    continue
+                members.append(info)
+            _extract_members(zip_ref, members, tmp_dir, progress)
+        for name in os.listdir(tmp_dir):
+            local_path = os.path.join(EXAMPLES_PATH, name)
+            if os.path.isdir(local_path):
+                _remove_path(local_path)
+            os.replace(os.path.join(tmp_dir, name), local_path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _manifest_path() -> str:
+    return os.path.join(EXAMPLES_PATH, MANIFEST_FILENAME)
+
+
+def _load_manifest() -> dict:
+    """
+    Returns the entries of the manifest of the downloaded files, keyed by
+    the names of the files. The manifest is only read again if it has been
+    modified since it was read the last time, possibly by another process.
+    The returned dictionary must not be modified.
+    """
+    path = _manifest_path()
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+    state = _manifest_state.get(path, None)
+    if state is not None and state[0] == key:
+        return state[1]
+    try:
+        with open(path, "r") as f:
+            files = json.load(f)["files"]
+        if not isinstance(files, dict):
+            files = {}
+    except (OSError, ValueError, KeyError, TypeError):
+        files = {}
+    _manifest_state[path] = (key, files)
+    return files
+
+
+def _dump_manifest(files: dict) -> None:
+    """
+    Writes the manifest to a temporary file first, which is then moved to
+    its final place, so that concurrent readers never see a half-written file.
+    """
+    path = _manifest_path()
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=_TMP_PREFIX, suffix=".json"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": 1, "files": files}, f, indent=1)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    stat = os.stat(path)
+    _manifest_state[path] = ((stat.st_mtime_ns, stat.st_size), files)
+
+
+def _update_manifest(func: Callable[[dict], None]) -> None:
+    """
+    Calls `func` with a copy of the entries of the manifest, and saves the
+    entries after `func` modified them. The manifest is locked meanwhile,
+    so that concurrent updates of other threads or processes are not lost.
+    """
+    lock_path = os.path.join(EXAMPLES_PATH, MANIFEST_LOCK_FILENAME)
+    with _manifest_lock, _FileLock(lock_path):
+        files = dict(_load_manifest())
+        func(files)
+        _dump_manifest(files)
+
+
+def _file_hash(path: str) -> str:
+    """
+    Returns the SHA-256 hash of a file.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(partial(f.read, 1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _directory_size(path: str) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return size
+
+
+def _record_file(
+    filename: str,
+    local_path: str,
+    url: Optional[str],
+    extracted_path: Optional[str] = None,
+    strategy: Optional[str] = None,
+) -> None:
+    """
+    Records a downloaded file in the manifest. Directories are recorded
+    without a hash. For an archive, the path of the extracted contents is
+    recorded as well, if it has been extracted. The strategy is the way
+    the file got to the examples directory (eg. 'download' or 'hardlink').
+    """
+    if os.path.isfile(local_path):
+        sha256, size = _file_hash(local_path), os.path.getsize(local_path)
+    else:
+        sha256, size = None, _directory_size(local_path)
+    if extracted_path is not None:
+        size += _directory_size(extracted_path)
+        extracted_path = os.path.relpath(extracted_path, EXAMPLES_PATH)
+    now = time.time()
+    entry = {
+        "path": os.path.relpath(local_path, EXAMPLES_PATH),
+        "extracted": extracted_path,
+        "sha256": sha256,
+        "size": size,
+        "url": url,
+        "strategy": strategy,
+        "created": now,
+        "accessed": now,
+        "hits": 1,
+    }
+
+    def update(files):
+        files[os.path.basename(filename)] = entry
+
+    _update_manifest(update)
+
+
+def _forget_file(filename: str) -> None:
+    """
+    Removes a file from the manifest.
+    """
+    _update_manifest(lambda files: files.pop(os.path.basename(filename), None))
+
+
+def _touch_file(filename: str, entry: dict) -> None:
+    """
+    Updates the access time and the number of hits of a file in the
+    manifest, if the recorded access time is older than
+    `ACCESS_TIME_RESOLUTION`. Accesses within this period are counted once.
+    """
+    now = time.time()
+    if now - entry.get("accessed", 0) < ACCESS_TIME_RESOLUTION:
+        return
+
+    def update(files):
+        name = os.path.basename(filename)
+        if name in files:
+            hits = files[name].get("hits", 0) + 1
+            files[name] = dict(files[name], accessed=now, hits=hits)
+
+    _update_manifest(update)
+
+
+def _remove_entry(entry: dict) -> None:
+    """
+    Removes the files of an entry of the manifest. The caller must hold the
+    lock of the file.
+    """
+    _remove_path(os.path.join(EXAMPLES_PATH, entry["path"]))
+    if entry.get("extracted", None) is not None:
+        _remove_path(os.path.join(EXAMPLES_PATH, entry["extracted"]))
+
+
+def _verify_file(local_path: str, entry: dict) -> bool:
+    """
+    Returns True if a file exists and its hash matches the one in its entry.
+    """
+    extracted_path = entry.get("extracted", None)
+    if extracted_path is not None:
+        if not os.path.exists(os.path.join(EXAMPLES_PATH, extracted_path)):
+            return False
+    if entry.get("sha256", None) is None:
+        return os.path.exists(local_path)
+    try:
+        return _file_hash(local_path) == entry["sha256"]
+    except OSError:
+        return False
+
+
+def _lookup_file(
+    filename: str, verify: bool = False, extract: bool = True, locked: bool = False
+) -> Optional[str]:
+    """
+    Returns the local path of a downloaded file using the manifest, or
+    `None` if the file is not in the manifest. If `verify` is True, the
+    hash of the file is checked and `None` is returned if it is missing or
+    corrupted. In this case, the file is also removed and forgotten if the
+    caller holds its lock, which is indicated by `locked`.
+
+    For archives, the path of the extracted contents is returned if `extract`
+    is True, and `None` if the archive has not been extracted yet.
+    """
+    entry = _load_manifest().get(os.path.basename(filename), None)
+    if entry is None:
+        return None
+    local_path = os.path.join(EXAMPLES_PATH, entry["path"])
+    if verify and not _verify_file(local_path, entry):
+        if locked:
+            _forget_file(filename)
+            _remove_entry(entry)
+        return None
+    if extract and _is_archive(filename):
+        if entry.get("extracted", None) is None:
+            return None
+        local_path = os.path.join(EXAMPLES_PATH, entry["extracted"])
+    _touch_file(filename, entry)
+    return local_path
+
+
+def get_cache_policy() -> Tuple[Optional[int], str]:
+    """
+    Returns the maximum size of the examples directory in bytes (`None`
+    if the size is not limited) and the eviction policy.
+
+    See also
+    --------
+    :func:`~sigmaepsilon.core.downloads.set_cache_policy`
+    """
+    return _cache_max_size, _cache_policy
+
+
+def set_cache_policy(max_size: Optional[int] = None, policy: str = "lru") -> None:
+    """
+    Sets the maximum size of the examples directory and the eviction policy.
+    If the size of the downloaded files exceeds the limit after a download,
+    files are evicted until the limit is met, except the one that has just
+    been downloaded. The initial values are taken from the environment
+    variables `SIGMAEPSILON_CACHE_MAX_SIZE` and `SIGMAEPSILON_CACHE_POLICY`.
+
+    Parameters
+    ----------
+    max_size: int, Optional
+        The maximum size of the downloaded files in bytes, or `None` for no
+        limit. Default is None.
+    policy: str, Optional
+        The eviction policy, either `'lru'` to evict the least recently used
+        files first, or `'lfu'` to evict the least frequently used files
+        first. Default is `'lru'`.
+
+    See also
+    --------
+    :func:`~sigmaepsilon.core.downloads.prune_downloads`
+
+    Examples
+    --------
+    Limit the size of the downloaded files to 1 GB.
+
+    >>> from sigmaepsilon.core.downloads import set_cache_policy
+    >>> set_cache_policy(max_size=2**30, policy="lru")  # doctest:+SKIP
+    """
+    global _cache_max_size, _cache_policy
+    if policy not in CACHE_POLICIES:
+        raise ValueError(
+            f'Invalid cache policy "{policy}", it must be one of {CACHE_POLICIES}'
+        )
+    if max_size is not None and max_size < 0:
+        raise ValueError("The maximum size of the cache must be non-negative.")
+    _cache_max_size = max_size
+    _cache_policy = policy
+
+
+def _eviction_key(policy: str) -> Callable[[tuple], tuple]:
+    if policy == "lfu":
+        return lambda item: (item[1].get("hits", 0), item[1].get("accessed", 0))
+    return lambda item: item[1].get("accessed", 0)
+
+
+def prune_downloads(
+    max_size: Optional[int] = None,
+    policy: Optional[str] = None,
+    keep: Iterable[str] = (),
+) -> List[str]:
+    """
+    Evicts downloaded files until their total size is at most `max_size`
+    and returns the names of the evicted files. The sizes and the access
+    statistics of the files are taken from the manifest of the examples
+    directory.
+
+    Parameters
+    ----------
+    max_size: int, Optional
+        The target size in bytes. If not specified, the limit set by
+        :func:`~sigmaepsilon.core.downloads.set_cache_policy` is used, and
+        nothing happens if there is no limit. Default is None.
+    policy: str, Optional
+        The eviction policy, `'lru'` or `'lfu'`. If not specified, the policy
+        set by :func:`~sigmaepsilon.core.downloads.set_cache_policy` is used.
+        Default is None.
+    keep: Iterable[str], Optional
+        The names of files that must not be evicted. Default is an empty tuple.
+        Files that are being retrieved or extracted by another thread or
+        process at the time are not evicted either.
+
+    Returns
+    -------
+    List[str]
+        The names of the evicted files in the order of eviction.
+
+    See also
+    --------
+    :func:`~sigmaepsilon.core.downloads.delete_downloads`
+
+    Examples
+    --------
+    Keep at most 100 MB of the most recently used files.
+
+    >>> from sigmaepsilon.core.downloads import prune_downloads
+    >>> prune_downloads(100 * 2**20, "lru")  # doctest:+SKIP
+    """
     _check_examples_path()
-    zip_ref = zipfile.ZipFile(filename, "r")
-    zip_ref.extractall(EXAMPLES_PATH)
-    return zip_ref.close()
+    if max_size is None:
+        max_size = _cache_max_size
+    if max_size is None:
+        return []
+    if policy is None:
+        policy = _cache_policy
+    if policy not in CACHE_POLICIES:
+        raise ValueError(
+            f'Invalid cache policy "{policy}", it must be one of {CACHE_POLICIES}'
+        )
+    keep = set(os.path.basename(name) for name in keep)
+    evicted = []
+
+    def update(files):
+        total = sum(entry.get("size", None) or 0 for entry in files.values())
+        candidates = sorted(files.items(), key=_eviction_key(policy))
+        for name, entry in candidates:
+            if total <= max_size:
+                break
+            if name in keep:
+                continue
+            # files that someone else is working on are skipped
+            lock = _FileLock(_lock_path(name))
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                _remove_entry(entry)
+            finally:
+                lock.release()
+            del files[name]
+            total -= entry.get("size", None) or 0
+            evicted.append(name)
+
+    with _manifest_lock:
+        if len(_load_manifest()) > 0:
+            _update_manifest(update)
+    return evicted
 
 
 def _get_vtk_file_url(filename):
-    return f"https://github.com/sigma-epsilon/sigmaepsilon.data/raw/main/{filename}"
+    return f"{DATA_URL}/{filename}"
+
+
+def _data_path_retriever(filename: str) -> Optional[str]:
+    """
+    Returns the path of a file in the local data repository at
+    `SIGMAEPSILON_DATA_PATH`, or `None` if the variable is not set.
+    """
+    if DATA_PATH is None:
+        return None
+    if not os.path.isdir(DATA_PATH):
+        raise FileNotFoundError(
+            f"Data repository path does not exist at:\n\n{DATA_PATH}"
+        )
+    if not os.path.isdir(os.path.join(DATA_PATH, "Data")):
+        raise FileNotFoundError(
+            f'Data repository does not have "Data" folder at:\n\n{DATA_PATH}'
+        )
+    return os.path.join(DATA_PATH, "Data", filename)
+
+
+def _repository_retriever(filename: str) -> str:
+    """
+    Returns the url of a file in the online data repository.
+    """
+    return _get_vtk_file_url(filename)
+
+
+def mirror_retriever(location: str) -> Callable[[str], str]:
+    """
+    Returns a retriever that serves files from a mirror of the data
+    repository, which can be a local directory, a `file://` url or the
+    base url of an HTTP server.
+
+    Parameters
+    ----------
+    location: str
+        The location of the mirror.
+
+    See also
+    --------
+    :func:`~sigmaepsilon.core.downloads.register_retriever`
+
+    Examples
+    --------
+    >>> from sigmaepsilon.core.downloads import mirror_retriever, register_retriever
+    >>> retriever = mirror_retriever("/shared/sigmaepsilon-data")
+    >>> register_retriever(retriever)  # doctest:+SKIP
+    """
+    if _is_url(location):
+        location = location.rstrip("/")
+
+        def retriever(filename: str) -> str:
+            return f"{location}/{filename}"
+
+    else:
+
+        def retriever(filename: str) -> str:
+            return os.path.join(location, filename)
+
+    retriever.__name__ = retriever.__qualname__ = f"mirror_retriever({location!r})"
+    return retriever
+
+
+# the ordered list of retrievers
+_retrievers: List[Callable[[str], Optional[str]]] = [
+    _data_path_retriever,
+    _repository_retriever,
+]
+_retrievers_lock = threading.Lock()
+
+# a mirror of the data repository, tried before the other retrievers
+if os.environ.get("SIGMAEPSILON_DATA_MIRROR", None):  # pragma: no cover
+    _retrievers.insert(0, mirror_retriever(os.environ["SIGMAEPSILON_DATA_MIRROR"]))
+
+
+def get_retrievers() -> List[Callable[[str], Optional[str]]]:
+    """
+    Returns the registered retrievers in the order they are tried.
+    """
+    return list(_retrievers)
+
+
+def register_retriever(
+    retriever: Callable[[str], Optional[str]], index: int = 0
+) -> Callable[[str], Optional[str]]:
+    """
+    Registers a retriever and returns it, hence the function can be used as a
+    decorator.
+
+    A retriever is a function that takes the name of a file and returns the
+    location of the file, which can be an HTTP(S) url, a `file://` url or a
+    path on the local filesystem, or `None` if it can't serve the file. The
+    retrievers are tried in order, until one of them provides a location
+    the file can be retrieved from. Files at HTTP(S) urls are downloaded,
+    files on the local filesystem are copied to the examples directory.
+
+    Parameters
+    ----------
+    retriever: Callable
+        The retriever to register.
+    index: int, Optional
+        The position of the retriever in the list of retrievers. By default,
+        the retriever is tried before the ones registered earlier.
+
+    See also
+    --------
+    :func:`~sigmaepsilon.core.downloads.mirror_retriever`
+    :func:`~sigmaepsilon.core.downloads.unregister_retriever`
+
+    Examples
+    --------
+    >>> from sigmaepsilon.core.downloads import register_retriever
+    >>> @register_retriever
+    ... def local_meshes(filename):  # doctest:+SKIP
+    ...     if filename.endswith(".vtk"):
+    ...         return f"/scratch/meshes/{filename}"
+    """
+    with _retrievers_lock:
+        _retrievers.insert(index, retriever)
+    return retriever
+
+
+def unregister_retriever(retriever: Callable[[str], Optional[str]]) -> None:
+    """
+    Removes a retriever from the list of retrievers.
+    """
+    with _retrievers_lock:
+        _retrievers.remove(retriever)
+
+
+def _is_url(location: str) -> bool:
+    # single letters are drive letters on Windows
+    return len(urlsplit(location).scheme) > 1
+
+
+# http connections of the threads, keyed by scheme and host
+_connections = threading.local()
+
+
+def _get_proxy(scheme: str, netloc: str) -> Optional[str]:
+    """
+    Returns the url of the proxy configured in the environment for a host
+    (eg. with the `HTTP_PROXY`, `HTTPS_PROXY` and `NO_PROXY` variables),
+    or `None` if the host is to be accessed directly.
+    """
+    proxy = getproxies().get(scheme, None)
+    if not proxy or proxy_bypass(netloc.rpartition("@")[2]):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    return proxy
+
+
+def _proxy_headers(proxy: str) -> dict:
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    token = base64.b64encode(credentials.encode()).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _get_connection(
+    scheme: str, netloc: str
+) -> Tuple[http.client.HTTPConnection, Optional[dict]]:
+    """
+    Returns a connection of the current thread to a host, which is reused
+    by subsequent requests to the same host, with the headers of the proxy
+    the requests are forwarded by.
 
+    If the requests are forwarded by an http proxy, the headers are a
+    dictionary and the requests must use absolute urls. Otherwise the
+    headers are `None`, and the connection is either direct or tunneled
+    through the proxy (for https).
+    """
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    proxy = _get_proxy(scheme, netloc)
+    key = (scheme, netloc, proxy)
+    value = pool.get(key, None)
+    if value is None:
+        if proxy is None:
+            target_scheme, target_netloc = scheme, netloc
+        else:
+            proxy_parts = urlsplit(proxy)
+            target_netloc = proxy_parts.netloc.rpartition("@")[2]
+            # tunneled connections are encrypted end to end
+            target_scheme = "https" if scheme == "https" else proxy_parts.scheme
+        if target_scheme == "https":
+            connection = http.client.HTTPSConnection(target_netloc, timeout=TIMEOUT)
+        else:
+            connection = http.client.HTTPConnection(target_netloc, timeout=TIMEOUT)
+        headers = None
+        if proxy is not None:
+            if scheme == "https":
+                parts = urlsplit(f"//{netloc}")
+                connection.set_tunnel(parts.hostname, parts.port, _proxy_headers(proxy))
+            else:
+                headers = _proxy_headers(proxy)
+        value = pool[key] = (connection, headers)
+    return value
+
+
+def _http_open(
+    url: str, headers: dict
+) -> Tuple[http.client.HTTPResponse, http.client.HTTPConnection]:
+    """
+    Sends a GET request on a pooled connection, follows redirects and returns
+    the response with the connection. Responses with an error status raise
+    an :class:`~urllib.error.HTTPError`. The proxies configured in the
+    environment are respected.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        connection, proxy_headers = _get_connection(parts.scheme, parts.netloc)
+        if proxy_headers is None:
+            target = parts.path or "/"
+            if parts.query:
+                target += "?" + parts.query
+            request_headers = headers
+        else:
+            # a forwarding proxy expects the absolute url of the resource
+            target = urlunsplit(parts._replace(path=parts.path or "/", fragment=""))
+            request_headers = dict(headers, **proxy_headers)
+        try:
+            try:
+                connection.request("GET", target, headers=request_headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                # the connection has been closed by the server meanwhile
+                connection.close()
+                connection.request("GET", target, headers=request_headers)
+                response = connection.getresponse()
+            if response.status in (301, 302, 303, 307, 308) or response.status >= 400:
+                response.read()
+        except BaseException:
+            # eg. a timeout, the connection is in an unknown state and it
+            # can't be reused, closing it makes the next request reconnect
+            connection.close()
+            raise
 
-def _http_request(url):
-    return urlretrieve(url)
+        if response.status in (301, 302, 303, 307, 308):
+            url = urljoin(url, response.getheader("Location"))
+            continue
+        if response.status >= 400:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        return response, connection
+    raise HTTPError(url, 310, "Too many redirects", None, None)
 
 
-def _repo_file_request(repo_path, filename):
-    return os.path.join(repo_path, "Data", filename), None
+def _validator_path(part_path: str) -> str:
+    return part_path + ".validator"
 
 
-def _retrieve_file(retriever, filename):
+def _response_validator(response: http.client.HTTPResponse) -> Optional[str]:
+    """
+    Returns the validator of the content of a response, that can be sent in
+    an If-Range header, which is the entity tag if it is a strong one, or
+    the date of the last modification otherwise.
+    """
+    etag = response.getheader("ETag", None)
+    if etag is not None and not etag.startswith("W/"):
+        return etag
+    return response.getheader("Last-Modified", None)
+
+
+def _read_validator(part_path: str) -> Optional[str]:
+    try:
+        with open(_validator_path(part_path), "r") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+
+def _write_validator(part_path: str, validator: Optional[str]) -> None:
+    path = _validator_path(part_path)
+    if validator is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    with open(path, "w") as f:
+        f.write(validator)
+
+
+def _stream_to_file(url: str, part_path: str) -> None:
+    """
+    Streams the content at `url` to `part_path` in chunks. If `part_path`
+    already exists, the download is resumed using an HTTP range request,
+    and started over if the server doesn't support range requests.
+
+    The validator of the content (its ETag or modification date) is saved
+    next to the partial file, and it is sent in an If-Range header when the
+    download is resumed, so that the server sends the whole content again if
+    it has changed meanwhile. Partial files without a validator are started
+    over, since their source is unknown.
+    """
+    offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+    validator = _read_validator(part_path) if offset > 0 else None
+    if validator is not None:
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+    else:
+        offset, headers = 0, {}
+
+    try:
+        response, connection = _http_open(url, headers)
+    except HTTPError as e:
+        if e.code == 416 and offset > 0:
+            # the partial file is already complete
+            e.close()
+            return
+        raise
+
+    try:
+        if offset > 0 and response.status == 206:
+            mode = "ab"
+        else:
+            mode = "wb"
+        content_length = response.getheader("Content-Length", None)
+        received = 0
+        with open(part_path, mode) as f:
+            if mode == "wb":
+                _write_validator(part_path, _response_validator(response))
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                received += len(chunk)
+        if content_length is not None and received < int(content_length):
+            raise http.client.IncompleteRead(b"", int(content_length) - received)
+    except BaseException:
+        # the connection is in an unknown state, it can't be reused
+        connection.close()
+        raise
+
+
+def _http_request(url: str, local_path: str) -> Tuple[str, None]:
+    """
+    Downloads the file at `url` to `local_path`.
+
+    The content is streamed to a partial file next to `local_path`, which
+    is renamed once the download is complete. Failed attempts are retried
+    `MAX_RETRIES` times with exponential backoff, and every retry resumes
+    the download where the previous attempt stopped.
+    """
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    part_path = local_path + ".part"
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            _stream_to_file(url, part_path)
+            break
+        except HTTPError as e:
+            if e.code not in _RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                raise
+        except (URLError, OSError, http.client.HTTPException):
+            if attempt == MAX_RETRIES:
+                raise
+        time.sleep(RETRY_BACKOFF * 2**attempt)
+    os.replace(part_path, local_path)
+    _write_validator(part_path, None)
+    return local_path, None
+
+
+def _fetch(
+    location: str, local_path: str, strategy: Union[str, Iterable[str], None] = None
+) -> str:
+    """
+    Retrieves the file at `location` (a url or a path) to `local_path` and
+    returns the strategy used, which is 'download' for urls, and one of
+    `POPULATE_STRATEGIES` for files on the local filesystem.
+    """
+    parts = urlsplit(location)
+    if parts.scheme in ("http", "https"):
+        _http_request(location, local_path)
+        return "download"
+    if parts.scheme == "file":
+        path = url2pathname(parts.path)
+    else:
+        path = location
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No such file or directory: {path}")
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    return _populate(path, local_path, strategy)
+
+
+def _retrieve(
+    retrievers: Iterable[Callable],
+    filename: str,
+    local_path: str,
+    strategy: Union[str, Iterable[str], None] = None,
+) -> Tuple[str, str]:
+    """
+    Tries the retrievers in order and returns the location of the file
+    retrieved to `local_path` and the strategy used. If none of them
+    succeeds, the error of the last attempt is raised.
+    """
+    # invalid strategies are reported before trying anything
+    _populate_strategies(strategy)
+    error = None
+    for retriever in retrievers:
+        try:
+            location = retriever(filename)
+            if location is None:
+                continue
+            return location, _fetch(location, local_path, strategy)
+        except (OSError, http.client.HTTPException) as e:
+            error = e
+    if error is not None:
+        raise error
+    raise FileNotFoundError(f"None of the retrievers can serve {filename}.")
+
+
+def _retrieve_file(
+    retriever,
+    filename,
+    verify: bool = False,
+    extract: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+    strategy: Union[str, Iterable[str], None] = None,
+):
     """
     Retrieve file and cache it in sigmaepsilon.core.EXAMPLES_PATH.
 
+    Only one thread or process retrieves a file at a time, the others wait
+    for it to finish and reuse the file. Files are published atomically,
+    they are moved to their final place only once they are complete.
+
     Parameters
     ----------
-    retriever: str or callable
-        If str, it is treated as a url.
-        If callable, the function must take no arguments and must
-        return a tuple like (file_path, resp), where file_path is
-        the path to the file to use.
+    retriever: str or Iterable[Callable]
+        If str, it is treated as the location of the file, a url or a path.
+        Otherwise it is a sequence of retrievers to try in order, see
+        :func:`~sigmaepsilon.core.downloads.register_retriever`.
     filename: str
         The name of the file.
-
-    Notes
-    -----
-    You must have `PyVista` installed to handle zip files.
+    verify: bool, Optional
+        If True, the hash of a previously downloaded file is checked against
+        the one recorded in the manifest, and the file is downloaded again if
+        they don't match. Default is False.
+    extract: bool, Optional
+        If True, zip archives are extracted to the examples directory and
+        the path of the extracted contents (the path of the archive without
+        the extension) is returned. Default is True.
+    progress: Callable, Optional
+        A function that is called with the number of extracted bytes and the
+        total number of bytes to extract while an archive is extracted.
+        Default is None.
+    strategy: str or Iterable[str], Optional
+        The strategy of populating the examples directory from files on
+        the local filesystem, see
+        :func:`~sigmaepsilon.core.downloads.download_file`. Default is None.
     """
     _check_examples_path()
+    _check_filename(filename)
     # First check if file has already been downloaded
-    local_path = os.path.join(EXAMPLES_PATH, os.path.basename(filename))
-    local_path_no_zip = local_path.replace(".zip", "")
-    if os.path.isfile(local_path_no_zip) or os.path.isdir(local_path_no_zip):
-        return local_path_no_zip, None
+    cached_path = _lookup_file(filename, verify, extract)
+    if cached_path is not None:
+        return cached_path, None
+    with _FileLock(_lock_path(filename)):
+        # the file might have been downloaded by someone else meanwhile
+        cached_path = _lookup_file(filename, verify, extract, locked=True)
+        if cached_path is not None:
+            return cached_path, None
+        return _retrieve_file_locked(
+            retriever, filename, verify, extract, progress, strategy
+        )
+
+
+def _retrieve_file_locked(
+    retriever,
+    filename,
+    verify: bool = False,
+    extract: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+    strategy: Union[str, Iterable[str], None] = None,
+):
+    name = os.path.basename(filename)
+    local_path = os.path.join(EXAMPLES_PATH, name)
     if isinstance(retriever, str):
-        retriever = partial(_http_request, retriever)
-    saved_file, resp = retriever()
-    # new_name = saved_file.replace(os.path.basename(saved_file), os.path.basename(filename))
-    # Make sure folder exists!
-    if not os.path.isdir(os.path.dirname((local_path))):
-        os.makedirs(os.path.dirname((local_path)))
-    if DATA_PATH is None:
-        shutil.move(saved_file, local_path)
+        location = retriever
+        retriever = [lambda _: location]
+    entry = _load_manifest().get(name, None)
+    if entry is not None and os.path.exists(local_path):
+        # an archive that has been downloaded, but has not been extracted
+        url, strategy = entry.get("url", None), entry.get("strategy", None)
+    elif not verify and os.path.exists(local_path):
+        # downloaded before the manifest existed, the source is unknown
+        url, strategy = None, None
     else:
-        if os.path.isdir(saved_file):
-            shutil.copytree(saved_file, local_path)
-        else:
-            shutil.copy(saved_file, local_path)
-    if pyvista:
-        if pyvista.get_ext(local_path) in [".zip"]:
-            _decompress(local_path)
-            local_path = local_path[:-4]
-    return local_path, resp
+        url, strategy = _retrieve(retriever, filename, local_path, strategy)
 
+    extracted_path = None
+    if extract and _is_archive(name):
+        _decompress(local_path, progress)
+        extracted_path = local_path[:-4]
+    _record_file(filename, local_path, url, extracted_path, strategy)
+    if _cache_max_size is not None:
+        prune_downloads(keep=(filename,))
+    return extracted_path or local_path, None
 
-def _download_file(filename):
-    if DATA_PATH is None:
-        url = _get_vtk_file_url(filename)
-        retriever = partial(_http_request, url)
-    else:
-        if not os.path.isdir(DATA_PATH):
-            raise FileNotFoundError(
-                f"Data repository path does not exist at:\n\n{DATA_PATH}"
-            )
-        if not os.path.isdir(os.path.join(DATA_PATH, "Data")):
-            raise FileNotFoundError(
-                f'Data repository does not have "Data" folder at:\n\n{DATA_PATH}'
-            )
-        retriever = partial(_repo_file_request, DATA_PATH, filename)
-    return _retrieve_file(retriever, filename)
+
+def _download_file(
+    filename,
+    verify: bool = False,
+    extract: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+    strategy: Union[str, Iterable[str], None] = None,
+):
+    return _retrieve_file(
+        get_retrievers(), filename, verify, extract, progress, strategy
+    )
 
 
-def _download_and_read(filename):
-    saved_file, _ = _download_file(filename)
+def _download_and_read(
+    filename,
+    verify: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+    strategy: Union[str, Iterable[str], None] = None,
+):
+    saved_file, _ = _download_file(
+        filename, verify, progress=progress, strategy=strategy
+    )
     return saved_file
 
 
-def download_file(filename: str) -> str:
+def download_file(
+    filename: str,
+    verify: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+    strategy: Union[str, Iterable[str], None] = None,
+) -> str:
     """
     Downloads a data file and returns the path of it on
     your local filesystem.
 
+    Downloaded files are recorded in a manifest in the examples directory
+    with their hashes, sizes, source urls and access times, which is used
+    to look up files that have already been downloaded.
+
+    Zip archives are extracted to the examples directory and the path of the
+    extracted contents is returned. To access the members of an archive
+    without extracting all of them, use
+    :func:`~sigmaepsilon.core.downloads.open_archive`.
+
     Parameters
     ----------
     filename: str
         The name of the file to download with extension included.
+    verify: bool, Optional
+        If True, the hash of a previously downloaded file is checked against
+        the one recorded in the manifest, and the file is downloaded again if
+        it is missing or corrupted. Default is False.
+    progress: Callable, Optional
+        A function that is called with the number of extracted bytes and the
+        total number of bytes to extract while an archive is extracted.
+        Default is None.
+    strategy: str or Iterable[str], Optional
+        The strategy of populating the examples directory from files on the
+        local filesystem (eg. from `SIGMAEPSILON_DATA_PATH` or a mirror
+        directory). It is one of 'hardlink', 'reflink' (a copy-on-write clone),
+        'symlink' and 'copy', a sequence of them to try in order, or 'auto',
+        which tries them in this order. The default is taken from the
+        environment variable `SIGMAEPSILON_POPULATE_STRATEGY`, or it is 'auto'
+        if the variable is not set. The strategy used is recorded in the
+        manifest, see :func:`~sigmaepsilon.core.downloads.get_cache_entry`.
+        Linked files share their contents with the sources, they must not be
+        modified.
 
     Returns
     -------
@@ -148,7 +1353,531 @@ def download_file(filename: str) -> str:
     >>> from sigmaepsilon.core.downloads import download_file
     >>> download_file("stand.vtk")
     """
-    return _download_and_read(filename)
+    return _download_and_read(filename, verify, progress, strategy)
+
+
+def get_cache_entry(filename: str) -> Optional[MappingProxyType]:
+    """
+    Returns the record of a downloaded file in the manifest of the examples
+    directory, or `None` if the file has not been downloaded. The record
+    has the following fields:
+
+    * path : the path of the file relative to the examples directory
+    * extracted : the path of the extracted contents of an archive
+    * sha256 : the SHA-256 hash of the file
+    * size : the size of the file in bytes
+    * url : the location the file has been retrieved from
+    * strategy : how the file got to the examples directory, 'download'
+      for downloaded files and one of 'hardlink', 'reflink', 'symlink' and
+      'copy' for files from the local filesystem
+    * created, accessed : the time of creation and of the last access
+    * hits : the number of accesses
+
+    Example
+    --------
+    >>> from sigmaepsilon.core.downloads import download_file, get_cache_entry
+    >>> download_file("stand.vtk")  # doctest:+SKIP
+    >>> get_cache_entry("stand.vtk")["strategy"]  # doctest:+SKIP
+    'download'
+    """
+    entry = _load_manifest().get(os.path.basename(filename), None)
+    return None if entry is None else MappingProxyType(entry)
+
+
+class LazyArchive:
+    """
+    Lazy access to the members of a downloaded zip archive. Members can be
+    read directly from the archive, or extracted to the examples directory
+    one by one when they are first needed, hence using a few members of a
+    large archive doesn't require extracting all of it.
+
+    Instances are returned by :func:`~sigmaepsilon.core.downloads.open_archive`
+    and can be used as context managers.
+
+    Parameters
+    ----------
+    path: str
+        The path of the archive.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "r")
+
+    def namelist(self) -> List[str]:
+        """
+        Returns the names of the members of the archive.
+        """
+        return self._zip.namelist()
+
+    def open(self, member: str) -> IO[bytes]:
+        """
+        Returns a file object that streams the content of a member of the
+        archive without extracting it.
+        """
+        return self._zip.open(member, "r")
+
+    def read(self, member: str) -> bytes:
+        """
+        Returns the content of a member of the archive without extracting it.
+        """
+        return self._zip.read(member)
+
+    def extract(
+        self, member: str, progress: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """
+        Extracts a member (a file or a folder) of the archive to the examples
+        directory, if it has not been extracted yet, and returns its path.
+
+        Parameters
+        ----------
+        member: str
+            The name of a member of the archive.
+        progress: Callable, Optional
+            A function that is called with the number of extracted bytes and
+            the total number of bytes to extract. Default is None.
+        """
+        name = member.rstrip("/")
+        if _is_reserved(name.split("/")[0]):
+            raise ValueError(f"The member {member!r} has a reserved name.")
+        local_path = _member_path(EXAMPLES_PATH, name)
+        if os.path.exists(local_path):
+            return local_path
+        with _FileLock(_lock_path(self.path)):
+            if os.path.exists(local_path):
+                return local_path
+            members = [
+                info
+                for info in self._zip.infolist()
+                if info.filename.rstrip("/") == name
+                or info.filename.startswith(name + "/")
+            ]
+            if len(members) == 0:
+                raise KeyError(f"There is no item named {member!r} in the archive")
+            tmp_dir = tempfile.mkdtemp(dir=EXAMPLES_PATH, prefix=_TMP_PREFIX)
+            try:
+                _extract_members(self._zip, members, tmp_dir, progress)
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                os.replace(_member_path(tmp_dir, name), local_path)
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        return local_path
+
+    def close(self) -> None:
+        """
+        Closes the archive.
+        """
+        self._zip.close()
+
+    def __enter__(self) -> "LazyArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+
+def open_archive(filename: str, verify: bool = False) -> LazyArchive:
+    """
+    Downloads a zip archive without extracting it and returns a
+    :class:`~sigmaepsilon.core.downloads.LazyArchive` to access its members.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the archive to download with extension included.
+    verify: bool, Optional
+        If True, the hash of a previously downloaded archive is verified.
+        See :func:`~sigmaepsilon.core.downloads.download_file` for the details.
+        Default is False.
+
+    Example
+    --------
+    >>> from sigmaepsilon.core.downloads import open_archive
+    >>> with open_archive("meshes.zip") as archive:  # doctest:+SKIP
+    ...     path = archive.extract("meshes/stand.vtk")
+    """
+    if not _is_archive(filename):
+        raise ValueError(f"{filename} is not a zip archive.")
+    path, _ = _download_file(filename, verify, extract=False)
+    return LazyArchive(path)
+
+
+def download_files(
+    filenames: Iterable[str],
+    max_workers: Optional[int] = None,
+    verify: bool = False,
+    strategy: Union[str, Iterable[str], None] = None,
+) -> List[str]:
+    """
+    Downloads several data files concurrently using a pool of threads and
+    returns the paths of them on your local filesystem, in the order of the
+    filenames.
+
+    Downloads are streamed to the disk in chunks, failed downloads are
+    retried with exponential backoff and resumed where they stopped, if the
+    server supports range requests.
+
+    Parameters
+    ----------
+    filenames: Iterable[str]
+        The names of the files to download with extensions included.
+    max_workers: int, Optional
+        The maximum number of concurrent downloads. If not specified,
+        the default of :class:`concurrent.futures.ThreadPoolExecutor`
+        is used.
+    verify: bool, Optional
+        If True, the hashes of previously downloaded files are verified.
+        See :func:`~sigmaepsilon.core.downloads.download_file` for the details.
+        Default is False.
+    strategy: str or Iterable[str], Optional
+        The strategy of populating the examples directory from files on the
+        local filesystem. See :func:`~sigmaepsilon.core.downloads.download_file`
+        for the details. Default is None.
+
+    Returns
+    -------
+    List[str]
+        The paths to the files on your filesystem.
+
+    See also
+    --------
+    :func:`~sigmaepsilon.core.downloads.download_file`
+
+    Example
+    --------
+    >>> from sigmaepsilon.core.downloads import download_files
+    >>> download_files(["stand.vtk", "bunny.obj"], max_workers=4)  # doctest:+SKIP
+    """
+    filenames = list(filenames)
+    unique_filenames = list(dict.fromkeys(filenames))
+    if len(unique_filenames) == 0:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths = executor.map(
+            partial(_download_and_read, verify=verify, strategy=strategy),
+            unique_filenames,
+        )
+        paths = dict(zip(unique_filenames, paths))
+    return [paths[filename] for filename in filenames]
+
+
+async def adownload_file(
+    filename: str,
+    verify: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+    strategy: Union[str, Iterable[str], None] = None,
+) -> str:
+    """
+    The asynchronous counterpart of
+    :func:`~sigmaepsilon.core.downloads.download_file`.
+
+    The file is retrieved in a worker thread of the running event loop, the
+    loop is not blocked by the network and disk I/O, nor by waiting for
+    another thread or process that retrieves the same file. The cache and
+    the locks are shared with the synchronous functions.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file to download with extension included.
+    verify: bool, Optional
+        If True, the hash of a previously downloaded file is verified.
+        Default is False.
+    progress: Callable, Optional
+        A function that is called with the number of extracted bytes and the
+        total number of bytes to extract while an archive is extracted. It is
+        called from the worker thread. Default is None.
+    strategy: str or Iterable[str], Optional
+        The strategy of populating the examples directory from files on the
+        local filesystem. Default is None.
+
+    See :func:`~sigmaepsilon.core.downloads.download_file` for the details.
+
+    Returns
+    -------
+    str
+        A path to a file on your filesystem.
+
+    Example
+    --------
+    >>> import asyncio
+    >>> from sigmaepsilon.core.downloads import adownload_file
+    >>> asyncio.run(adownload_file("stand.vtk"))  # doctest:+SKIP
+    """
+    return await asyncio.to_thread(
+        _download_and_read, filename, verify, progress, strategy
+    )
+
+
+async def adownload_files(
+    filenames: Iterable[str],
+    max_workers: Optional[int] = None,
+    verify: bool = False,
+    strategy: Union[str, Iterable[str], None] = None,
+) -> List[str]:
+    """
+    The asynchronous counterpart of
+    :func:`~sigmaepsilon.core.downloads.download_files`.
+
+    The files are retrieved concurrently in the worker threads of the running
+    event loop, without blocking the loop.
+
+    Parameters
+    ----------
+    filenames: Iterable[str]
+        The names of the files to download with extensions included.
+    max_workers: int, Optional
+        The maximum number of concurrent downloads. If not specified, it is
+        only limited by the default executor of the event loop.
+    verify: bool, Optional
+        If True, the hashes of previously downloaded files are verified.
+        Default is False.
+    strategy: str or Iterable[str], Optional
+        The strategy of populating the examples directory from files on the
+        local filesystem. Default is None.
+
+    See :func:`~sigmaepsilon.core.downloads.download_files` for the details.
+
+    Returns
+    -------
+    List[str]
+        The paths to the files on your filesystem.
+
+    Example
+    --------
+    >>> import asyncio
+    >>> from sigmaepsilon.core.downloads import adownload_files
+    >>> asyncio.run(adownload_files(["stand.vtk", "bunny.obj"]))  # doctest:+SKIP
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("'max_workers' must be greater than 0.")
+    filenames = list(filenames)
+    unique_filenames = list(dict.fromkeys(filenames))
+    if len(unique_filenames) == 0:
+        return []
+    semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+
+    async def retrieve(filename):
+        if semaphore is None:
+            return await adownload_file(filename, verify, strategy=strategy)
+        async with semaphore:
+            return await adownload_file(filename, verify, strategy=strategy)
+
+    paths = await asyncio.gather(*map(retrieve, unique_filenames))
+    paths = dict(zip(unique_filenames, paths))
+    return [paths[filename] for filename in filenames]
+
+
+class MappedFile:
+    """
+    A read-only memory map of a downloaded file. The pages of the file are
+    loaded on demand and shared by all the processes that map the same file,
+    hence the contents of the file are not copied into the memory of the
+    process.
+
+    Instances are returned by :func:`~sigmaepsilon.core.downloads.map_file`
+    and can be used as context managers.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            if self.size > 0:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # empty files can't be mapped
+                self._mmap = None
+
+    @property
+    def mmap(self) -> Optional[mmap.mmap]:
+        """
+        Returns the underlying :class:`mmap.mmap` object, or `None` if the
+        file is empty.
+        """
+        return self._mmap
+
+    def memoryview(self) -> memoryview:
+        """
+        Returns a read-only memoryview of the contents of the file. The map
+        can't be closed while a memoryview of it is alive.
+        """
+        if self._mmap is None:
+            return memoryview(b"")
+        return memoryview(self._mmap)
+
+    def asarray(
+        self,
+        dtype: Any = "uint8",
+        offset: int = 0,
+        shape: Optional[Tuple[int, ...]] = None,
+        order: str = "C",
+    ) -> Any:
+        """
+        Returns a read-only :class:`numpy.memmap` of the file. The arguments
+        are passed on to :class:`numpy.memmap`.
+
+        Notes
+        -----
+        You must have `NumPy` installed to use this function.
+        """
+        np = import_package("numpy")
+        if np is None:  # pragma: no cover
+            raise ImportError("You must have NumPy installed to use this function.")
+        return np.memmap(
+            self.path, dtype=dtype, mode="r", offset=offset, shape=shape, order=order
+        )
+
+    def close(self) -> None:
+        """
+        Closes the map. Raises a :class:`BufferError` if memoryviews of the
+        map are still alive.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap is None or self._mmap.closed
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+
+def map_file(filename: str, verify: bool = False) -> MappedFile:
+    """
+    Downloads a data file if necessary, and returns a read-only memory map
+    of it, which gives access to the contents of the file without reading
+    all of it into memory.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file to download with extension included.
+    verify: bool, Optional
+        If True, the hash of a previously downloaded file is verified.
+        See :func:`~sigmaepsilon.core.downloads.download_file` for the details.
+        Default is False.
+
+    See also
+    --------
+    :class:`~sigmaepsilon.core.downloads.MappedFile`
+
+    Example
+    --------
+    >>> from sigmaepsilon.core.downloads import map_file
+    >>> with map_file("coords.bin") as mapped:  # doctest:+SKIP
+    ...     coords = mapped.asarray(dtype="float64").reshape(-1, 3)
+    """
+    path = _download_and_read(filename, verify)
+    if os.path.isdir(path):
+        raise IsADirectoryError(f"{filename} is not a file, it can't be mapped.")
+    return MappedFile(path)
+
+
+def prefetch(
+    filenames: Iterable[str], max_workers: Optional[int] = None, verify: bool = False
+) -> Dict[str, Union[str, Exception]]:
+    """
+    Warms the cache by retrieving files concurrently. Unlike
+    :func:`~sigmaepsilon.core.downloads.download_files`, failing to retrieve
+    a file doesn't stop the others from being retrieved.
+
+    The function can also be called from the command line, eg.::
+
+        python -m sigmaepsilon.core.downloads --mirror /shared/data -f files.txt
+
+    Parameters
+    ----------
+    filenames: Iterable[str]
+        The names of the files to retrieve with extensions included.
+    max_workers: int, Optional
+        The maximum number of concurrent downloads. Default is None.
+    verify: bool, Optional
+        If True, the hashes of previously downloaded files are verified.
+        Default is False.
+
+    Returns
+    -------
+    Dict[str, Union[str, Exception]]
+        The local paths of the files, or the errors raised while retrieving
+        them, keyed by the names of the files.
+    """
+    filenames = list(dict.fromkeys(filenames))
+    if len(filenames) == 0:
+        return {}
+
+    def retrieve(filename):
+        try:
+            return _download_and_read(filename, verify)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(filenames, executor.map(retrieve, filenames)))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    The command line interface of :func:`~sigmaepsilon.core.downloads.prefetch`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m sigmaepsilon.core.downloads",
+        description="Retrieves data files to the local cache.",
+    )
+    parser.add_argument("filenames", nargs="*", help="the names of the files")
+    parser.add_argument(
+        "-f",
+        "--from-file",
+        help="a file with the names of the files to retrieve, one per line",
+    )
+    parser.add_argument(
+        "-m",
+        "--mirror",
+        action="append",
+        default=[],
+        help="a mirror directory or url to try first, can be repeated",
+    )
+    parser.add_argument("-j", "--jobs", type=int, help="the number of workers")
+    parser.add_argument("--verify", action="store_true", help="verify cached files")
+    args = parser.parse_args(argv)
+
+    filenames = list(args.filenames)
+    if args.from_file is not None:
+        with open(args.from_file, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    filenames.append(line)
+    for location in reversed(args.mirror):
+        register_retriever(mirror_retriever(location))
+
+    failed = False
+    for filename, result in prefetch(filenames, args.jobs, args.verify).items():
+        if isinstance(result, Exception):
+            failed = True
+            print(f"{filename}: failed ({result})", file=sys.stderr)
+        else:
+            print(f"{filename}: {result}")
+    return 1 if failed else 0
 
 
 def delete_downloads() -> bool:
@@ -156,9 +1885,14 @@ def delete_downloads() -> bool:
     Delete all downloaded examples to free space or update the files.
     Returns `True` if the operation was succesful, or `False` if it wasn't.
 
+    Files that are being retrieved or extracted by another thread or process
+    at the time are not deleted, in which case the result is `False`. The
+    manifest and the lock files are kept, since others might hold them.
+
     See also
     --------
     :func:`~sigmaepsilon.core.downloads.download_file`
+    :func:`~sigmaepsilon.core.downloads.prune_downloads`
 
     Examples
     --------
@@ -169,7 +1903,48 @@ def delete_downloads() -> bool:
     True
     """
     _check_examples_path()
-    shutil.rmtree(EXAMPLES_PATH)
-    os.makedirs(EXAMPLES_PATH)
-    return True
+    skipped = []
+
+    def update(files):
+        # the items of the examples directory grouped by the names of the
+        # files they belong to, whose locks are held while they are worked on
+        owned = {}
+        for name, entry in files.items():
+            owned[name] = [entry["path"]]
+            if entry.get("extracted", None) is not None:
+                owned[name].append(entry["extracted"])
+        tracked = set(path for paths in owned.values() for path in paths)
+        items = sorted(os.listdir(EXAMPLES_PATH))
+        for item in items:
+            if item in tracked or _is_reserved(item):
+                continue
+            if item.endswith(".part"):
+                # the partial download of a file
+                owner = item[: -len(".part")]
+            elif item.endswith(".part.validator"):
+                owner = item[: -len(".part.validator")]
+            elif item + ".zip" in items or item + ".zip" in files:
+                # the extracted contents of an archive
+                owner = item + ".zip"
+            else:
+                owner = item
+            owned.setdefault(owner, []).append(item)
+        for name, paths in owned.items():
+            lock = _FileLock(_lock_path(name))
+            if not lock.acquire(blocking=False):
+                skipped.append(name)
+                continue
+            try:
+                for path in paths:
+                    _remove_path(os.path.join(EXAMPLES_PATH, path))
+            finally:
+                lock.release()
+            files.pop(name, None)
+
+    os.makedirs(EXAMPLES_PATH, exist_ok=True)
+    _update_manifest(update)
+    return len(skipped) == 0
+
 
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
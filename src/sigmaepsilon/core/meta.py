@@ -1,14 +1,119 @@
 # -*- coding: utf-8 -*-
+import os
 from abc import ABCMeta
+from weakref import WeakKeyDictionary
 
 
-__all__ = ["ABCMeta_Weak", "ABCMeta_Strong", "ABCMeta_Safe"]
+__all__ = [
+    "ABCMeta_Weak",
+    "ABCMeta_Strong",
+    "ABCMeta_Safe",
+    "checks_enabled",
+    "set_checks_enabled",
+]
+
+
+def _checks_enabled_by_default() -> bool:
+    """
+    The checks are enabled unless Python runs with the `-O` flag. The
+    environment variable `SIGMAEPSILON_METACLASS_CHECKS` overrides this
+    in both directions.
+    """
+    value = os.environ.get("SIGMAEPSILON_METACLASS_CHECKS", None)
+    if value is None:
+        return __debug__
+    return value.strip().lower() not in ("0", "false", "off", "no")
+
+
+_checks_enabled = _checks_enabled_by_default()
+
+
+# For every class used as a base of a safe class, the names accessible on it
+# that a safe subclass is not allowed to define. The tables are computed when
+# a class is first used as a base, and are dropped when the class or one of
+# its bases is modified. Only classes whose modifications can be tracked have
+# a table, see `_is_trackable`. Attributes added to the metaclasses after the
+# tables have been computed are not taken into account.
+_base_attribute_names = WeakKeyDictionary()
 
 
 def _is_callable(n, v):
     return callable(v) and ("__" not in n)
 
 
+def checks_enabled() -> bool:
+    """
+    Returns `True` if the checks of :class:`~sigmaepsilon.core.meta.ABCMeta_Strong`
+    and :class:`~sigmaepsilon.core.meta.ABCMeta_Safe` are performed when a class
+    is created.
+    """
+    return _checks_enabled
+
+
+def set_checks_enabled(enabled: bool) -> None:
+    """
+    Turns the checks of :class:`~sigmaepsilon.core.meta.ABCMeta_Strong` and
+    :class:`~sigmaepsilon.core.meta.ABCMeta_Safe` on or off for the whole process.
+    With the checks turned off, these metaclasses behave like `ABCMeta`, which
+    saves the scanning work at class creation in production.
+
+    By default, the checks are on, unless Python runs with the `-O` flag.
+    The default can be overridden by setting the environment variable
+    `SIGMAEPSILON_METACLASS_CHECKS` to `0` or `1`. Classes created before
+    calling this function are not checked again.
+
+    Example
+    -------
+    >>> from sigmaepsilon.core.meta import set_checks_enabled
+    >>> set_checks_enabled(False)
+    """
+    global _checks_enabled
+    _checks_enabled = bool(enabled)
+
+
+def _is_trackable(base: type) -> bool:
+    """
+    Returns `True` if all the modifications of a class that affect the names
+    accessible on it go through :class:`~sigmaepsilon.core.meta.ABCMeta_Weak`,
+    that is, every class in its MRO but `object` is an instance of it, and
+    the metaclass doesn't serve attributes dynamically with `__getattr__`.
+    """
+    return not hasattr(type(base), "__getattr__") and all(
+        isinstance(cls, ABCMeta_Weak) for cls in base.__mro__[:-1]
+    )
+
+
+def _get_shadowed_names(base: type, names: set) -> set:
+    """
+    Returns the items of `names` that are accessible on a class, including
+    the inherited ones and those of its metaclass. The result is the same as
+    `{name for name in names if hasattr(base, name)}`, which is used for
+    classes that are not trackable.
+    """
+    if not _is_trackable(base):
+        return {name for name in names if hasattr(base, name)}
+    base_names = _base_attribute_names.get(base, None)
+    if base_names is None:
+        base_names = frozenset(
+            name
+            for name in set(dir(base)) | set(dir(type(base)))
+            if "__" not in name
+        )
+        _base_attribute_names[base] = base_names
+    return names & base_names
+
+
+def _forget_base_attribute_names(cls: type) -> None:
+    """
+    Drops the tables of a class and its subclasses after it has been modified.
+    """
+    stack = [cls]
+    while stack:
+        cls = stack.pop()
+        _base_attribute_names.pop(cls, None)
+        stack.extend(type.__subclasses__(cls))
+
+
 class ABCMeta_Weak(ABCMeta):
     """
     Standard python metaclass. It follows weak abstraction in the meaning, that
@@ -28,6 +133,16 @@ class ABCMeta_Weak(ABCMeta):
     :class:`~sigmaepsilon.core.abstract.ABC_Weak`
     """
 
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if "__" not in name or name == "__bases__":
+            _forget_base_attribute_names(cls)
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        if "__" not in name or name == "__bases__":
+            _forget_base_attribute_names(cls)
+
     @staticmethod
     def _get_cls_methods(namespace: dict, nomagic: bool = False) -> set:
         """
@@ -92,21 +207,26 @@ class ABCMeta_Strong(ABCMeta_Weak):
 
     def __new__(metaclass, name, bases, namespace, *args, **kwargs):
         cls = super().__new__(metaclass, name, bases, namespace, *args, **kwargs)
+        if not _checks_enabled:
+            return cls
+        # ABCMeta already collected the names that are still abstract in the
+        # new class, hence the abstracts of a base that are neither implemented
+        # nor delayed are the ones that are still abstract, but are not defined
+        # in the namespace.
+        cls_abstracts = cls.__abstractmethods__
+        if not cls_abstracts:
+            return cls
         cls_methods = metaclass._get_cls_methods(namespace)
         for base in bases:
-            base_abstracts = set()
-            for method_name in getattr(base, "__abstractmethods__", set()):
-                value = getattr(cls, method_name, None)
-                if getattr(value, "__isabstractmethod__", False):
-                    base_abstracts.add(method_name)
-            for abstract in base_abstracts:
-                if abstract not in cls_methods:
-                    err_str = (
-                        f"Can't create abstract class {name}!"
-                        f" {name} must implement abstract method {abstract} of"
-                        f" class {base.__name__}."
-                    )
-                    raise TypeError(err_str)
+            base_abstracts = getattr(base, "__abstractmethods__", frozenset())
+            missing = (base_abstracts & cls_abstracts) - cls_methods
+            for abstract in sorted(missing):
+                err_str = (
+                    f"Can't create abstract class {name}!"
+                    f" {name} must implement abstract method {abstract} of"
+                    f" class {base.__name__}."
+                )
+                raise TypeError(err_str)
         return cls
 
 
@@ -126,14 +246,18 @@ class ABCMeta_Safe(ABCMeta_Weak):
 
     def __new__(metaclass, name, bases, namespace, *args, **kwargs):
         cls = super().__new__(metaclass, name, bases, namespace, *args, **kwargs)
+        if not _checks_enabled:
+            return cls
         cls_methods = metaclass._get_cls_methods(namespace, nomagic=True)
+        if not cls_methods:
+            return cls
         for base in bases:
-            for method in cls_methods:
-                if hasattr(base, method):
-                    err_str = (
-                        f"Can't create abstract class {name}!"
-                        f" Method {method} is already implemented in class"
-                        f" {base.__name__}."
-                    )
-                    raise TypeError(err_str)
+            shadowed = _get_shadowed_names(base, cls_methods)
+            for method in sorted(shadowed):
+                err_str = (
+                    f"Can't create abstract class {name}!"
+                    f" Method {method} is already implemented in class"
+                    f" {base.__name__}."
+                )
+                raise TypeError(err_str)
         return cls
@@ -1,10 +1,241 @@
 # -*- coding: utf-8 -*-
+import functools
+import types
+import threading
 from inspect import signature, Parameter
-from typing import Any
-from typing import Generic as _GenericAlias
+from typing import (
+    Any,
+    Union,
+    NamedTuple,
+    Hashable,
+    Callable,
+    Optional,
+    Tuple,
+    List,
+    Iterable,
+    get_origin,
+    get_args,
+)
+from weakref import WeakKeyDictionary
 
 
-__all__ = ["Signature"]
+__all__ = ["Signature", "CompiledSignature", "normalize_type", "Dispatcher"]
+
+
+# The results of inspecting functions, keyed weakly by the function objects.
+_function_data_cache = WeakKeyDictionary()
+
+# The maximum number of entries of the caches keyed by types and signatures,
+# which keep their keys alive.
+CACHE_SIZE = 4096
+
+
+def normalize_type(tp: Any) -> Union[Any, frozenset]:
+    """
+    Returns the normalized form of a type annotation, which is `Any` for
+    `Any` and a frozenset of the accepted types otherwise. A union like
+    `Union[int, str]` or `int | str` results in `frozenset({int, str})`, every
+    other annotation `tp` in `frozenset({tp})`.
+
+    Raises a `TypeError` if the annotation is not hashable (eg. `[int]`).
+    """
+    try:
+        return _normalize_type_cached(tp)
+    except TypeError:
+        # an unhashable annotation, the error is raised by frozenset below
+        return _normalize_type(tp)
+
+
+def _normalize_type(tp: Any) -> Union[Any, frozenset]:
+    if tp is Any:
+        return Any
+    origin = get_origin(tp)
+    if origin is Union or origin is types.UnionType:
+        return frozenset(get_args(tp))
+    return frozenset((tp,))
+
+
+_normalize_type_cached = functools.lru_cache(maxsize=CACHE_SIZE)(_normalize_type)
+
+
+def _compatible_annotations(type1: Any, type2: Any) -> bool:
+    """
+    Returns `True` if the annotation `type2` satisfies the annotation `type1`.
+    Unlike :func:`_compatible_types`, it works with annotations that can't be
+    normalized, which are compared by equality.
+    """
+    try:
+        return _compatible_types(normalize_type(type1), normalize_type(type2))
+    except TypeError:
+        return type1 is Any or type1 == type2
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _compatible_types(type1: Hashable, type2: Hashable) -> bool:
+    """
+    Returns `True` if the normalized type `type2` satisfies the normalized
+    type `type1`.
+    """
+    if type1 is Any:
+        return True
+    if type2 is Any:
+        return False
+    return type2 <= type1
+
+
+class CompiledSignature(NamedTuple):
+    """
+    A compact, hashable and immutable representation of a
+    :class:`~sigmaepsilon.core.signature.Signature`, where the domain types
+    and the result type are normalized by
+    :func:`~sigmaepsilon.core.signature.normalize_type`.
+    """
+
+    name: str
+    arity: int
+    dtype: tuple
+    rtype: Any
+    attrs: frozenset
+    isabstract: bool
+
+    def compatible_function(self, other: "CompiledSignature") -> bool:
+        """
+        Returns True if two instances are compatible in terms of
+        domain type and result type. The result is cached.
+        """
+        return _compatible_signatures(self.dtype, self.rtype, other.dtype, other.rtype)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _compatible_signatures(dtype1, rtype1, dtype2, rtype2) -> bool:
+    for type1, type2 in zip(dtype1, dtype2):
+        if not _compatible_types(type1, type2):
+            return False
+    return _compatible_types(rtype1, rtype2)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _compile(name, arity, dtype, rtype, attrs, isabstract) -> CompiledSignature:
+    return CompiledSignature(
+        name,
+        arity,
+        tuple(normalize_type(t) for t in dtype),
+        normalize_type(rtype),
+        attrs,
+        isabstract,
+    )
+
+
+def _inspect_function(funcobj) -> tuple:
+    """
+    Returns the name, the arity, the domain types and the result type of a
+    function. The results are cached for functions that support weak
+    references, so that `inspect.signature` is only called once for them.
+
+    Annotations given as strings (eg. with `from __future__ import
+    annotations`) are evaluated. If that fails, they are kept as strings.
+    """
+    try:
+        return _function_data_cache[funcobj]
+    except KeyError:
+        pass
+    except TypeError:  # pragma: no cover
+        # the object doesn't support weak references
+        return _inspect_function_evaluated(funcobj)
+
+    data = _inspect_function_evaluated(funcobj)
+    _function_data_cache[funcobj] = data
+    return data
+
+
+def _inspect_function_evaluated(funcobj) -> tuple:
+    try:
+        return _inspect_function_uncached(funcobj, eval_str=True)
+    except Exception:
+        # eg. a forward reference, errors not related to the evaluation of
+        # the annotations are raised again here
+        return _inspect_function_uncached(funcobj)
+
+
+def _inspect_function_uncached(funcobj, eval_str: bool = False) -> tuple:
+    sig = signature(funcobj, eval_str=eval_str)
+    params = sig.parameters
+    if "args" in params or "kwargs" in params:
+        raise TypeError("Operation can only have a finite number of arguments!")
+    if "self" in params or "cls" in params:
+        arity = len(params) - 1
+    else:
+        arity = len(params)
+
+    if arity == 0:
+        dtype = (Any,)
+    else:
+        dtype = []
+        for pname, param in params.items():
+            if pname not in ["self", "cls"]:
+                if param.annotation is not Parameter.empty:
+                    dtype.append(param.annotation)
+                else:
+                    dtype.append(Any)
+        dtype = tuple(dtype)
+
+    if sig.return_annotation is not Parameter.empty:
+        rtype = sig.return_annotation
+    else:
+        rtype = Any
+
+    return funcobj.__name__, arity, dtype, rtype
+
+
+def _type_distance(tp: Hashable, cls: type) -> Optional[float]:
+    """
+    Returns the distance of `cls` from the normalized type `tp` along the
+    method resolution order of `cls`, or `None` if `tp` doesn't accept
+    instances of `cls`. Abstract base classes that `cls` is only a virtual
+    subclass of (like `numbers.Number` for `float`) are considered farther
+    than the actual base classes of `cls`, except for `object`, and the more
+    derived ones (like `numbers.Integral`) closer than their bases. `Any`
+    accepts everything, but is considered the farthest.
+    """
+    mro = cls.__mro__
+    if tp is Any:
+        return len(mro)
+    for i, base in enumerate(mro):
+        if base in tp:
+            return i
+    # 'issubclass' caches its results for abstract base classes
+    distance = None
+    for t in tp:
+        try:
+            if not issubclass(cls, t):
+                continue
+        except TypeError:
+            continue
+        d = len(mro) - 2 + 1 / (1 + len(t.__mro__))
+        if distance is None or d < distance:
+            distance = d
+    return distance
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _accepts_types(arity: int, dtype: tuple, types: Tuple[type, ...]) -> bool:
+    """
+    Returns True if arguments of the specified types are acceptable for a
+    function of the specified arity and normalized domain types.
+    """
+    if len(types) != arity:
+        return False
+    for tp, cls in zip(dtype, types):
+        if tp is not Any:
+            for t in tp:
+                if isinstance(t, str):
+                    raise TypeError(
+                        f"Unable to check the arguments, the annotation {t!r} "
+                        "couldn't be evaluated."
+                    )
+        if _type_distance(tp, cls) is None:
+            return False
+    return True
 
 
 class Signature(dict):
@@ -12,6 +243,10 @@ class Signature(dict):
     A class to differentiate between function declarations using their
     type signatures. It helps to decide if an implementation satisfies
     some requirements imposed on a class.
+
+    Inspecting a function is only done once for every function object, and
+    compatibility checks are performed on the compiled form of the signatures
+    (see :func:`compile`), the results of which are cached.
     """
 
     __abckey__ = "isabstractoperation"
@@ -27,36 +262,17 @@ class Signature(dict):
         else:
             sig = Signature(**kwargs)
 
-        sig["name"] = funcobj.__name__
+        name, arity, dtype, rtype = _inspect_function(funcobj)
+
+        sig["name"] = name
         if len(attrs) > 0:
             sig["attrs"] = frozenset(attrs)
         else:
             sig["attrs"] = frozenset()
 
-        params = signature(funcobj).parameters
-        if "args" in params or "kwargs" in params:
-            raise TypeError("Operation can only have a finite number of arguments!")
-        if "self" in params or "cls" in params:
-            sig["arity"] = len(params) - 1
-        else:
-            sig["arity"] = len(params)
-
-        if sig["arity"] == 0:
-            sig["dtype"] = [Any]
-        else:
-            sig["dtype"] = []
-            for pname, param in params.items():
-                if pname not in ["self", "cls"]:
-                    if param.annotation is not Parameter.empty:
-                        sig["dtype"].append(param.annotation)
-                    else:
-                        sig["dtype"].append(Any)
-
-        annotations = funcobj.__annotations__
-        if "return" in annotations:
-            sig["rtype"] = annotations["return"]
-        else:
-            sig["rtype"] = Any
+        sig["arity"] = arity
+        sig["dtype"] = list(dtype)
+        sig["rtype"] = rtype
 
         return sig
 
@@ -77,44 +293,42 @@ class Signature(dict):
 
         return sig
 
+    def compile(self) -> CompiledSignature:
+        """
+        Returns the compiled form of the signature. Signatures with the same
+        content share the same compiled instance. Raises a `TypeError` if an
+        annotation of the signature is not hashable.
+        """
+        return _compile(
+            self.get("name", None),
+            self.get("arity", None),
+            tuple(self.get("dtype", ())),
+            self.get("rtype", Any),
+            self.get("attrs", frozenset()),
+            self.isabstract,
+        )
+
     def compatible_function(self, other: "Signature") -> bool:
         """
         Returns True if two instances are compatible in terms of
         domain type and result type.
+
+        A domain or result type of `self` is satisfied by the corresponding
+        type of `other` if it is `Any`, or if the types accepted by `other`
+        are all accepted by `self` (eg. `int` satisfies `Union[int, str]`).
         """
         if not isinstance(other, Signature):
             return False
-
-        # check domain types
-        for type1, type2 in zip(self["dtype"], other["dtype"]):
-            if type1 == Any:
-                continue
-            elif isinstance(type1, _GenericAlias):
-                if not isinstance(type2, _GenericAlias):
-                    typeargs = type1.__dict__["__args__"]
-                    if type2 not in typeargs:
-                        return False
-                else:
-                    if type1 != type2:
-                        return False
-            else:
-                if type1 != type2:
-                    return False
-
-        # check result type
-        if isinstance(self["rtype"], _GenericAlias):
-            if not isinstance(other["rtype"], _GenericAlias):
-                typeargs = self["rtype"].__dict__["__args__"]
-                if not other["rtype"] in typeargs:
-                    return False
-            else:
-                if self["rtype"] != other["rtype"]:
-                    return False
-        elif self["rtype"] != Any:
-            if self["rtype"] != other["rtype"]:
+        try:
+            return self.compile().compatible_function(other.compile())
+        except TypeError:
+            # some annotations can't be compiled, they are compared one by one
+            pairs = zip(self.get("dtype", ()), other.get("dtype", ()))
+            if not all(_compatible_annotations(t1, t2) for t1, t2 in pairs):
                 return False
-
-        return True
+            return _compatible_annotations(
+                self.get("rtype", Any), other.get("rtype", Any)
+            )
 
     def accepts_property(self, other: "Signature") -> bool:
         """
@@ -178,18 +392,210 @@ class Signature(dict):
             return False
 
         # check result type
-        if isinstance(self["rtype"], _GenericAlias):
-            if not isinstance(type(value), _GenericAlias):
-                typeargs = self["rtype"].__dict__["__args__"]
-                if not type(value) in typeargs:
-                    return False
+        try:
+            rtype = normalize_type(self["rtype"])
+        except TypeError:
+            # an unhashable annotation is not a type
+            return False
+        return rtype is Any or type(value) in rtype
+
+    def accepts_parameters(self, *args) -> bool:
+        """
+        Returns True if the positional arguments `args` are acceptable for a
+        function with this signature. The number of arguments must match the
+        arity, and the type of every argument must be accepted by the
+        corresponding domain type, where `Any` accepts everything, a `Union`
+        accepts its members and a type accepts its subclasses.
+
+        Decisions are cached per tuple of argument types. Raises a TypeError
+        if an annotation given as a string couldn't be evaluated.
+        """
+        compiled = self.compile()
+        return _accepts_types(compiled.arity, compiled.dtype, tuple(map(type, args)))
+
+    def accepts_parameters_batch(self, params: Iterable[Iterable]) -> List[bool]:
+        """
+        The batch form of :func:`accepts_parameters`, which returns a list of
+        booleans for an iterable of argument tuples (eg. the rows of a table).
+        The signature is compiled only once and the decisions are looked up
+        by the types of the arguments, hence checking many tuples with only a
+        few distinct combinations of types costs about one dictionary lookup
+        per tuple.
+        """
+        compiled = self.compile()
+        arity, dtype = compiled.arity, compiled.dtype
+        decisions = {}
+        result = []
+        for args in params:
+            types = tuple(map(type, args))
+            try:
+                result.append(decisions[types])
+            except KeyError:
+                decision = decisions[types] = _accepts_types(arity, dtype, types)
+                result.append(decision)
+        return result
+
+
+class Dispatcher:
+    """
+    A multiple-dispatch registry of functions, which selects an
+    implementation for a call based on the types of the positional
+    arguments and the signatures of the registered functions.
+
+    The registered functions are indexed by arity. Functions annotated with
+    plain types only are also indexed by their exact type tuples, and the
+    implementation selected for a tuple of argument types is cached, hence
+    repeated calls with the same types of arguments are resolved with a
+    single dictionary lookup. The cache holds at most `CACHE_SIZE` entries,
+    the oldest ones are evicted first.
+
+    Arguments annotated with `Any`, or not annotated at all, accept anything,
+    while a `Union` accepts any of its members, as in
+    :func:`~sigmaepsilon.core.signature.Signature.compatible_function`.
+    Subclasses of the annotated types are accepted as well, if several
+    implementations match a call, the most specific one is selected, and
+    the one registered first in case of a tie.
+
+    Parameters
+    ----------
+    name: str, Optional
+        The name of the dispatcher, used in error messages. Default is None.
+
+    Examples
+    --------
+    >>> from typing import Union
+    >>> from sigmaepsilon.core.signature import Dispatcher
+    >>> add = Dispatcher("add")
+    >>> @add.register
+    ... def _(a: int, b: int) -> int:
+    ...     return a + b
+    >>> @add.register
+    ... def _(a: str, b: Union[int, str]) -> str:
+    ...     return a + str(b)
+    >>> add(1, 2)
+    3
+    >>> add("a", 2)
+    'a2'
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name
+        self._functions = []
+        # arity -> list of (compiled signature, function)
+        self._registry = {}
+        # exact tuple of types -> function
+        self._exact = {}
+        # tuple of argument types -> function
+        self._cache = {}
+        self._lock = threading.RLock()
+
+    def register(self, funcobj: Callable) -> Callable:
+        """
+        Registers a function and returns it unchanged, so it can be used as
+        a decorator.
+
+        Annotations given as strings (eg. with `from __future__ import
+        annotations`) are evaluated. Raises a TypeError if an annotation of
+        an argument can't be evaluated or it is not a type, a `Union` of types
+        or `Any`.
+        """
+        try:
+            name, arity, dtype, rtype = _inspect_function_uncached(
+                funcobj, eval_str=True
+            )
+        except TypeError:
+            raise
+        except Exception as e:
+            raise TypeError(
+                f"Unable to evaluate the annotations of {funcobj!r}: {e}"
+            ) from e
+        for annotation in dtype:
+            try:
+                tp = normalize_type(annotation)
+                valid = tp is Any or all(isinstance(t, type) for t in tp)
+            except TypeError:
+                valid = False
+            if not valid:
+                raise TypeError(
+                    f"Unable to dispatch on the annotation {annotation!r} of "
+                    f"{funcobj!r}, it must be a type, a Union of types or Any."
+                )
+        compiled = _compile(name, arity, dtype, rtype, frozenset(), False)
+        with self._lock:
+            self._functions.append(funcobj)
+            self._registry.setdefault(compiled.arity, []).append((compiled, funcobj))
+            if all(tp is not Any and len(tp) == 1 for tp in compiled.dtype):
+                key = tuple(next(iter(tp)) for tp in compiled.dtype)
+                self._exact.setdefault(key, funcobj)
+            self._cache.clear()
+        return funcobj
+
+    @property
+    def functions(self) -> Tuple[Callable, ...]:
+        """
+        Returns the registered functions in the order of registration.
+        """
+        return tuple(self._functions)
+
+    def clear_cache(self) -> None:
+        """
+        Clears the cache of resolved implementations.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def resolve(self, *types: type) -> Callable:
+        """
+        Returns the implementation to call for arguments of the specified
+        types. Raises a TypeError if there is no suitable implementation.
+        """
+        try:
+            return self._cache[types]
+        except KeyError:
+            pass
+        # resolved under the lock, so that the result is not cached after
+        # a concurrent registration invalidated it
+        with self._lock:
+            funcobj = self._resolve(types)
+            cache = self._cache
+            if len(cache) >= CACHE_SIZE:
+                # dictionaries preserve the order of insertion
+                del cache[next(iter(cache))]
+            cache[types] = funcobj
+        return funcobj
+
+    def _resolve(self, types: Tuple[type, ...]) -> Callable:
+        funcobj = self._exact.get(types, None)
+        if funcobj is not None:
+            return funcobj
+
+        best, best_score = None, None
+        for compiled, candidate in self._registry.get(len(types), ()):
+            score = 0
+            for tp, cls in zip(compiled.dtype, types):
+                distance = _type_distance(tp, cls)
+                if distance is None:
+                    break
+                score += distance
             else:
-                if self["rtype"] != type(value):
-                    return False
-        elif self["rtype"] != Any:
-            if self["rtype"] != type(value):
-                return False
-        return True
+                if best_score is None or score < best_score:
+                    best, best_score = candidate, score
+
+        if best is None:
+            typenames = ", ".join(cls.__name__ for cls in types)
+            raise TypeError(
+                f"No implementation of {self.name or 'the dispatcher'} "
+                f"found for argument types ({typenames})."
+            )
+        return best
+
+    def __call__(self, *args, **kwargs) -> Any:
+        types = tuple(map(type, args))
+        try:
+            funcobj = self._cache[types]
+        except KeyError:
+            funcobj = self.resolve(*types)
+        return funcobj(*args, **kwargs)
 
-    def accepts_parameters(self, *args):
-        raise NotImplementedError
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
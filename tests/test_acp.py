@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import unittest
+import timeit
+from unittest.mock import patch
+
+from sigmaepsilon.core.acp import (
+    abstract_class_property,
+    get_validation_mode,
+    set_validation_mode,
+)
+import sigmaepsilon.core.acp as acp
+
+
+class TestAbstractClassProperty(unittest.TestCase):
+
+    def test_abstract_class_property(self):
+
+        @abstract_class_property(a=int, b=str)
+        class Base:
+            ...
+
+        class Valid(Base):
+            a = 1
+            b = "b"
+
+        class Invalid(Base):
+            a = 1
+
+        class WrongType(Base):
+            a = 1
+            b = 2
+
+        Valid()
+        self.assertRaises(AttributeError, Invalid)
+        self.assertRaises(TypeError, WrongType)
+
+    def test_absclsprops_are_cached(self):
+
+        @abstract_class_property(a=int)
+        class Base:
+            ...
+
+        class Child(Base):
+            a = 1
+
+        class GrandChild(Child):
+            b: str = "b"
+
+        props = Child.__absclsprops__()
+        self.assertEqual(dict(props), {"a": int})
+        self.assertIs(Child.__absclsprops__(), props)
+        # subclasses have their own tables
+        self.assertEqual(dict(GrandChild.__absclsprops__()), {"a": int, "b": str})
+
+        Child()
+        with patch.object(acp, "MappingProxyType", side_effect=AssertionError):
+            Child()
+
+    def test_class_level_validation_mode(self):
+
+        @abstract_class_property(a=int, b=str)
+        class Base:
+            __absclsprops_mode__ = "class"
+
+            def __init__(self):
+                self.b = "b"
+
+        class Child(Base):
+            a = 1
+
+        obj = Child()
+        self.assertEqual(dict(Child.__instance_absclsprops__()), {"b": str})
+        obj.b = 2
+        self.assertRaises(TypeError, obj.__check_absclsprops__)
+
+    def test_argument_forwarding(self):
+
+        @abstract_class_property(a=int)
+        class Base:
+            def __init__(self, a, *, b=None):
+                self.a = a
+                self.b = b
+
+        obj = Base(1, b=2)
+        self.assertEqual((obj.a, obj.b), (1, 2))
+        self.assertRaises(TypeError, Base, "1")
+
+    def test_validation_modes(self):
+
+        @abstract_class_property(a=int)
+        class Base:
+            def __init__(self, a):
+                self.a = a
+
+        class Child(Base):
+            ...
+
+        mode = get_validation_mode()
+        try:
+            set_validation_mode("off")
+            Base("a")
+
+            set_validation_mode("first")
+            Base(1)
+            Base("a")
+            self.assertRaises(TypeError, Child, "a")
+            Child(1)
+
+            set_validation_mode("always")
+            self.assertRaises(TypeError, Base, "a")
+
+            # the mode of a class takes precedence
+            Child.__absclsprops_mode__ = "off"
+            Child("a")
+            self.assertRaises(TypeError, Base, "a")
+
+            self.assertRaises(ValueError, set_validation_mode, "never")
+        finally:
+            set_validation_mode(mode)
+
+    def test_validation_benchmark(self):
+        """
+        Measures the per-instantiation overhead of the validation modes.
+        """
+        props = {f"a{i}": int for i in range(10)}
+
+        @abstract_class_property(**props)
+        class Base:
+            ...
+
+        Child = type("Child", (Base,), {key: 1 for key in props})
+
+        def run(mode):
+            Child.__absclsprops_mode__ = mode
+            return min(timeit.repeat(Child, number=2000, repeat=5))
+
+        timings = {mode: run(mode) for mode in ("always", "class", "first", "off")}
+        self.assertLess(timings["class"], timings["always"])
+        self.assertLess(timings["first"], timings["always"])
+        self.assertLess(timings["off"], timings["always"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
-import unittest, os
+import unittest, os, json, tempfile, operator
 from os.path import dirname, abspath
+from unittest.mock import patch
 
 import sigmaepsilon.core as sc
 from sigmaepsilon.core.config import (
     find_pyproject_toml,
     load_pyproject_config,
     namespace_package_name,
+    package_metadata,
 )
+import sigmaepsilon.core.config as config
 from sigmaepsilon.core.testing import SigmaEpsilonTestCase
 
 
@@ -44,7 +47,52 @@ class TestConfig(SigmaEpsilonTestCase):
             ValueError, namespace_package_name, start_dir, max_depth=-1
         )
         self.assertFailsProperly(TypeError, namespace_package_name, 1, max_depth=-1)
-        
+
+    def test_namespace_package_name_is_memoized(self):
+        start_dir = dirname(abspath(sc.__file__))
+        namespace_package_name(start_dir, 10)
+        with patch.object(config.os.path, "isdir", side_effect=AssertionError):
+            package_name = namespace_package_name(start_dir, 10)
+        self.assertEqual(package_name, "sigmaepsilon.core")
+
+    def test_package_metadata(self):
+        package_metadata.cache_clear()
+        metadata = package_metadata("sigmaepsilon.core")
+        self.assertEqual(metadata["version"], sc.__version__)
+        self.assertEqual(metadata["summary"], sc.__description__)
+        self.assertIs(package_metadata("sigmaepsilon.core"), metadata)
+        self.assertFailsProperly(TypeError, operator.setitem, metadata, "a", "")
+
+    def test_package_metadata_disk_cache(self):
+        install_path = dirname(abspath(sc.__file__))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, "metadata.json")
+            package_metadata.cache_clear()
+            metadata = package_metadata("sigmaepsilon.core", install_path, cache_path)
+            self.assertTrue(os.path.isfile(cache_path))
+            with open(cache_path, "r") as f:
+                cache = json.load(f)
+            self.assertEqual(len(cache), 1)
+
+            # the second process reads the metadata from the disk
+            package_metadata.cache_clear()
+            with patch.object(
+                config, "_read_package_metadata", side_effect=AssertionError
+            ):
+                cached = package_metadata("sigmaepsilon.core", install_path, cache_path)
+            self.assertEqual(dict(cached), dict(metadata))
+
+            # a stale entry is refreshed
+            entry = next(iter(cache.values()))
+            entry["install_path"][1] = -1
+            entry["metadata"]["version"] = "0.0.0"
+            with open(cache_path, "w") as f:
+                json.dump(cache, f)
+            package_metadata.cache_clear()
+            cached = package_metadata("sigmaepsilon.core", install_path, cache_path)
+            self.assertEqual(cached["version"], metadata["version"])
+        package_metadata.cache_clear()
+
 
 if __name__ == "__main__":
     unittest.main()
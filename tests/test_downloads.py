@@ -0,0 +1,1067 @@
+# -*- coding: utf-8 -*-
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import time
+import json
+import io
+import shutil
+import pathlib
+from contextlib import redirect_stdout, redirect_stderr
+import hashlib
+import base64
+import zipfile
+import tempfile
+import threading
+import subprocess
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+import http.client
+
+import numpy as np
+
+from sigmaepsilon.core import downloads
+
+
+class _DataRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the files of the server from memory, optionally honouring range
+    requests, delaying the responses and truncating some of them. The
+    entity tags of the files are derived from their contents.
+    """
+
+    def do_GET(self):
+        server = self.server
+        name = self.path.lstrip("/")
+        range_header = self.headers.get("Range", None)
+        with server.lock:
+            server.requests.append((name, range_header))
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            self.respond(name, range_header)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def respond(self, name, range_header):
+        server = self.server
+        if server.delay:
+            time.sleep(server.delay)
+        with server.lock:
+            stall = server.stalls.get(name, 0) > 0
+            if stall:
+                server.stalls[name] -= 1
+        if stall:
+            # the client times out before receiving the headers
+            time.sleep(0.5)
+            self.close_connection = True
+            return
+
+        if name.startswith("redirect/"):
+            self.send_response(302)
+            self.send_header("Location", "/" + name[len("redirect/") :])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        data = server.files.get(name, None)
+        if data is None:
+            self.send_error(404)
+            return
+
+        etag = '"' + hashlib.sha256(data).hexdigest()[:16] + '"'
+        if self.headers.get("If-Range", etag) != etag:
+            # the content has changed, it is sent as a whole
+            range_header = None
+        start = 0
+        if range_header is not None and server.ranges:
+            start = int(range_header.split("=")[1].split("-")[0])
+            if start >= len(data):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+            )
+        else:
+            self.send_response(200)
+        body = data[start:]
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        with server.lock:
+            truncate = server.failures.get(name, 0) > 0
+            if truncate:
+                server.failures[name] -= 1
+        if truncate:
+            # the connection is closed after sending half of the content
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _KeepAliveDataRequestHandler(_DataRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+
+class _ProxyRequestHandler(BaseHTTPRequestHandler):
+    """
+    A forwarding http proxy, that records the requested urls and headers.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        parts = urlsplit(self.path)
+        headers = {
+            name: self.headers[name]
+            for name in ["Range", "If-Range"]
+            if name in self.headers
+        }
+        connection = http.client.HTTPConnection(parts.netloc, timeout=10)
+        try:
+            connection.request("GET", parts.path, headers=headers)
+            response = connection.getresponse()
+            length = response.getheader("Content-Length")
+            try:
+                body = response.read()
+            except http.client.IncompleteRead as e:
+                # the truncated response is relayed as it is
+                body = e.partial
+                self.close_connection = True
+            self.send_response(response.status)
+            for name in ["Content-Range", "Location", "ETag"]:
+                if response.getheader(name) is not None:
+                    self.send_header(name, response.getheader(name))
+        finally:
+            connection.close()
+        self.send_header("Content-Length", length)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DataServerTestCase(unittest.TestCase):
+    """
+    Starts a local HTTP server standing in for the data repository and
+    redirects the downloads to a temporary examples directory.
+    """
+
+    handler_class = _DataRequestHandler
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler_class)
+        self.server.files = {
+            f"file_{i}.txt": os.urandom(1000 + 997 * i) for i in range(8)
+        }
+        self.server.failures = {}
+        self.server.stalls = {}
+        self.server.requests = []
+        self.server.connections = set()
+        self.server.ranges = True
+        self.server.delay = 0
+        self.server.active = 0
+        self.server.max_active = 0
+        self.server.lock = threading.Lock()
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self.thread.start()
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.examples_path = self.tmpdir.name
+        host, port = self.server.server_address
+        self.patcher = patch.multiple(
+            downloads,
+            EXAMPLES_PATH=self.examples_path,
+            DATA_PATH=None,
+            DATA_URL=f"http://{host}:{port}",
+            CHUNK_SIZE=256,
+            RETRY_BACKOFF=0,
+        )
+        self.patcher.start()
+        # the test servers are accessed directly, whatever the environment is
+        env = {k: v for k, v in os.environ.items() if not k.lower().endswith("_proxy")}
+        self.env_patcher = patch.dict(os.environ, env, clear=True)
+        self.env_patcher.start()
+        self.retrievers = downloads.get_retrievers()
+
+    def tearDown(self):
+        downloads._retrievers[:] = self.retrievers
+        self.env_patcher.stop()
+        self.patcher.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmpdir.cleanup()
+
+    def assertDownloaded(self, path, name):
+        self.assertEqual(os.path.dirname(path), self.examples_path)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), self.server.files[name])
+
+
+class TestDownloads(DataServerTestCase):
+    def test_download_file(self):
+        path = downloads.download_file("file_1.txt")
+        self.assertDownloaded(path, "file_1.txt")
+        self.assertFalse(os.path.exists(path + ".part"))
+        # the second call is served from the disk
+        self.assertEqual(downloads.download_file("file_1.txt"), path)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_download_files(self):
+        names = list(self.server.files) + ["file_0.txt"]
+        paths = downloads.download_files(names, max_workers=4)
+        self.assertEqual(len(paths), len(names))
+        for path, name in zip(paths, names):
+            self.assertDownloaded(path, name)
+        # duplicates are only downloaded once
+        self.assertEqual(len(self.server.requests), len(self.server.files))
+        self.assertEqual(downloads.download_files([]), [])
+
+    def test_resume(self):
+        self.server.failures["file_5.txt"] = 2
+        path = downloads.download_file("file_5.txt")
+        self.assertDownloaded(path, "file_5.txt")
+        requests = self.server.requests
+        self.assertEqual(len(requests), 3)
+        self.assertIsNone(requests[0][1])
+        size = len(self.server.files["file_5.txt"])
+        self.assertEqual(requests[1][1], f"bytes={size // 2}-")
+
+    def test_restart_changed_content(self):
+        self.server.failures["file_5.txt"] = 1
+        with patch.object(downloads, "MAX_RETRIES", 0):
+            self.assertRaises(Exception, downloads.download_file, "file_5.txt")
+        part_path = os.path.join(self.examples_path, "file_5.txt.part")
+        self.assertTrue(os.path.exists(part_path))
+        # the file is updated upstream before the download is resumed
+        self.server.files["file_5.txt"] = os.urandom(5000)
+        path = downloads.download_file("file_5.txt")
+        self.assertDownloaded(path, "file_5.txt")
+        # the resumption has been attempted
+        self.assertIsNotNone(self.server.requests[1][1])
+        self.assertFalse(os.path.exists(part_path + ".validator"))
+
+    def test_restart_unknown_source(self):
+        # a partial file left by someone else, its source is unknown
+        part_path = os.path.join(self.examples_path, "file_5.txt.part")
+        with open(part_path, "wb") as f:
+            f.write(b"partial")
+        path = downloads.download_file("file_5.txt")
+        self.assertDownloaded(path, "file_5.txt")
+        self.assertIsNone(self.server.requests[0][1])
+
+    def test_restart_without_range_support(self):
+        self.server.ranges = False
+        self.server.failures["file_5.txt"] = 1
+        path = downloads.download_file("file_5.txt")
+        self.assertDownloaded(path, "file_5.txt")
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_retries_exhausted(self):
+        self.server.failures["file_2.txt"] = downloads.MAX_RETRIES + 1
+        with patch.object(downloads, "MAX_RETRIES", 1):
+            self.assertRaises(Exception, downloads.download_file, "file_2.txt")
+        self.assertFalse(
+            os.path.exists(os.path.join(self.examples_path, "file_2.txt"))
+        )
+
+    def test_not_found(self):
+        self.assertRaises(HTTPError, downloads.download_file, "missing.txt")
+        # client errors are not retried
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_concurrent_download_benchmark(self):
+        """
+        With a latency of 50 ms per request, downloading the files
+        concurrently must be faster than downloading them one by one.
+        """
+        self.server.delay = 0.05
+        names = list(self.server.files)
+        t0 = time.perf_counter()
+        for name in names[:4]:
+            downloads.download_file(name)
+        t_serial = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        downloads.download_files(names[4:], max_workers=4)
+        t_concurrent = time.perf_counter() - t0
+        self.assertLess(t_concurrent, t_serial)
+
+
+class TestManifest(DataServerTestCase):
+    def read_manifest(self):
+        path = os.path.join(self.examples_path, downloads.MANIFEST_FILENAME)
+        with open(path, "r") as f:
+            return json.load(f)["files"]
+
+    def test_manifest(self):
+        path = downloads.download_file("file_3.txt")
+        entry = self.read_manifest()["file_3.txt"]
+        data = self.server.files["file_3.txt"]
+        self.assertEqual(entry["path"], "file_3.txt")
+        self.assertEqual(entry["sha256"], hashlib.sha256(data).hexdigest())
+        self.assertEqual(entry["size"], len(data))
+        self.assertEqual(entry["url"], downloads._get_vtk_file_url("file_3.txt"))
+        self.assertLessEqual(entry["created"], entry["accessed"])
+        self.assertEqual(downloads._lookup_file("file_3.txt"), path)
+        self.assertIsNone(downloads._lookup_file("file_4.txt"))
+
+    def test_verify(self):
+        path = downloads.download_file("file_3.txt")
+        with open(path, "r+b") as f:
+            f.write(b"corrupted")
+        # without verification, the manifest is trusted
+        self.assertEqual(downloads.download_file("file_3.txt"), path)
+        self.assertEqual(len(self.server.requests), 1)
+        path = downloads.download_file("file_3.txt", verify=True)
+        self.assertDownloaded(path, "file_3.txt")
+        self.assertEqual(len(self.server.requests), 2)
+        # a missing file is downloaded again
+        os.remove(path)
+        path = downloads.download_files(["file_3.txt"], verify=True)[0]
+        self.assertDownloaded(path, "file_3.txt")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_files_downloaded_before_the_manifest(self):
+        path = os.path.join(self.examples_path, "file_6.txt")
+        with open(path, "wb") as f:
+            f.write(self.server.files["file_6.txt"])
+        self.assertEqual(downloads.download_file("file_6.txt"), path)
+        self.assertEqual(len(self.server.requests), 0)
+        entry = self.read_manifest()["file_6.txt"]
+        self.assertIsNone(entry["url"])
+        self.assertEqual(entry["size"], len(self.server.files["file_6.txt"]))
+
+    def test_access_time(self):
+        downloads.download_file("file_3.txt")
+        accessed = self.read_manifest()["file_3.txt"]["accessed"]
+        downloads.download_file("file_3.txt")
+        self.assertEqual(self.read_manifest()["file_3.txt"]["accessed"], accessed)
+        with patch.object(downloads, "ACCESS_TIME_RESOLUTION", 0):
+            time.sleep(0.01)
+            downloads.download_file("file_3.txt")
+        self.assertGreater(self.read_manifest()["file_3.txt"]["accessed"], accessed)
+
+    def test_shared_manifest(self):
+        """
+        Changes made to the manifest by other processes are picked up.
+        """
+        downloads.download_file("file_3.txt")
+        self.assertIsNotNone(downloads._lookup_file("file_3.txt"))
+        path = os.path.join(self.examples_path, downloads.MANIFEST_FILENAME)
+        with open(path, "w") as f:
+            json.dump({"version": 1, "files": {}}, f)
+        self.assertIsNone(downloads._lookup_file("file_3.txt"))
+        # a corrupted manifest is treated as an empty one
+        with open(path, "w") as f:
+            f.write("{")
+        self.assertIsNone(downloads._lookup_file("file_3.txt"))
+        downloads.download_file("file_3.txt")
+        self.assertIn("file_3.txt", self.read_manifest())
+
+
+class TestCachePolicy(DataServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.policy = downloads.get_cache_policy()
+
+    def tearDown(self):
+        downloads.set_cache_policy(*self.policy)
+        super().tearDown()
+
+    def size_of(self, *names):
+        return sum(len(self.server.files[name]) for name in names)
+
+    def set_access(self, name, accessed, hits):
+        def update(files):
+            files[name] = dict(files[name], accessed=accessed, hits=hits)
+
+        downloads._update_manifest(update)
+
+    def test_prune_lru(self):
+        names = ["file_0.txt", "file_1.txt", "file_2.txt", "file_3.txt"]
+        downloads.download_files(names)
+        for i, name in enumerate(names):
+            self.set_access(name, accessed=100 - i, hits=i)
+        self.assertEqual(downloads.prune_downloads(), [])
+        max_size = self.size_of("file_0.txt", "file_1.txt")
+        evicted = downloads.prune_downloads(max_size, "lru")
+        self.assertEqual(evicted, ["file_3.txt", "file_2.txt"])
+        for name in evicted:
+            self.assertFalse(os.path.exists(os.path.join(self.examples_path, name)))
+            self.assertIsNone(downloads._lookup_file(name))
+        self.assertIsNotNone(downloads._lookup_file("file_0.txt"))
+
+    def test_prune_skips_locked_files(self):
+        names = ["file_0.txt", "file_1.txt", "file_2.txt"]
+        downloads.download_files(names)
+        # another party is working on the file
+        with downloads._FileLock(downloads._lock_path("file_0.txt")):
+            evicted = downloads.prune_downloads(0)
+        self.assertEqual(sorted(evicted), ["file_1.txt", "file_2.txt"])
+        path = os.path.join(self.examples_path, "file_0.txt")
+        self.assertDownloaded(path, "file_0.txt")
+        self.assertEqual(list(downloads._load_manifest()), ["file_0.txt"])
+        self.assertEqual(downloads.prune_downloads(0), ["file_0.txt"])
+
+        # corrupted files are only removed while holding their locks
+        path = downloads.download_file("file_3.txt")
+        with open(path, "r+b") as f:
+            f.write(b"corrupted")
+        self.assertIsNone(downloads._lookup_file("file_3.txt", verify=True))
+        self.assertTrue(os.path.exists(path))
+        self.assertIn("file_3.txt", downloads._load_manifest())
+        with downloads._FileLock(downloads._lock_path("file_3.txt")):
+            lookup = downloads._lookup_file("file_3.txt", verify=True, locked=True)
+        self.assertIsNone(lookup)
+        self.assertFalse(os.path.exists(path))
+        self.assertNotIn("file_3.txt", downloads._load_manifest())
+
+    def test_delete_skips_locked_files(self):
+        names = ["file_0.txt", "file_1.txt"]
+        downloads.download_files(names)
+        # a file downloaded before the manifest existed
+        with open(os.path.join(self.examples_path, "legacy.txt"), "wb") as f:
+            f.write(b"legacy")
+        # another party is downloading a file meanwhile
+        part_path = os.path.join(self.examples_path, "file_2.txt.part")
+        with open(part_path, "wb") as f:
+            f.write(b"partial")
+        reserved = [
+            downloads.MANIFEST_FILENAME,
+            downloads.MANIFEST_LOCK_FILENAME,
+            downloads.LOCKS_DIRNAME,
+        ]
+        with downloads._FileLock(downloads._lock_path("file_0.txt")):
+            with downloads._FileLock(downloads._lock_path("file_2.txt")):
+                self.assertFalse(downloads.delete_downloads())
+        self.assertEqual(
+            sorted(os.listdir(self.examples_path)),
+            sorted(reserved + ["file_0.txt", "file_2.txt.part"]),
+        )
+        self.assertEqual(list(downloads._load_manifest()), ["file_0.txt"])
+        self.assertTrue(downloads.delete_downloads())
+        self.assertEqual(sorted(os.listdir(self.examples_path)), sorted(reserved))
+        self.assertEqual(downloads._load_manifest(), {})
+        path = downloads.download_file("file_0.txt")
+        self.assertDownloaded(path, "file_0.txt")
+
+    def test_prune_lfu(self):
+        names = ["file_0.txt", "file_1.txt", "file_2.txt", "file_3.txt"]
+        downloads.download_files(names)
+        for i, name in enumerate(names):
+            self.set_access(name, accessed=100 - i, hits=i)
+        evicted = downloads.prune_downloads(0, "lfu", keep=["file_1.txt"])
+        self.assertEqual(evicted, ["file_0.txt", "file_2.txt", "file_3.txt"])
+        self.assertRaises(ValueError, downloads.prune_downloads, 0, "fifo")
+
+    def test_max_size(self):
+        max_size = self.size_of("file_6.txt", "file_7.txt")
+        downloads.set_cache_policy(max_size, "lru")
+        self.assertEqual(downloads.get_cache_policy(), (max_size, "lru"))
+        downloads.download_file("file_6.txt")
+        downloads.download_file("file_7.txt")
+        self.set_access("file_6.txt", accessed=0, hits=1)
+        # the file that has just been downloaded is never evicted
+        downloads.download_file("file_0.txt")
+        self.assertIsNone(downloads._lookup_file("file_6.txt"))
+        self.assertIsNotNone(downloads._lookup_file("file_7.txt"))
+        self.assertIsNotNone(downloads._lookup_file("file_0.txt"))
+        self.assertRaises(ValueError, downloads.set_cache_policy, -1)
+        self.assertRaises(ValueError, downloads.set_cache_policy, None, "fifo")
+
+    def test_hits(self):
+        downloads.download_file("file_3.txt")
+        with patch.object(downloads, "ACCESS_TIME_RESOLUTION", 0):
+            downloads.download_file("file_3.txt")
+            downloads.download_file("file_3.txt")
+        self.assertEqual(downloads._load_manifest()["file_3.txt"]["hits"], 3)
+
+
+DOWNLOAD_SCRIPT = """
+import sys
+import numpy as np
+
+from sigmaepsilon.core import downloads
+downloads.EXAMPLES_PATH = sys.argv[1]
+downloads.DATA_PATH = None
+downloads.DATA_URL = sys.argv[2]
+print(downloads.download_file(sys.argv[3]))
+"""
+
+
+class TestConcurrency(DataServerTestCase):
+    def test_threads(self):
+        self.server.delay = 0.1
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(downloads.download_file, ["file_4.txt"] * 8))
+        self.assertEqual(len(set(paths)), 1)
+        self.assertDownloaded(paths[0], "file_4.txt")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_processes(self):
+        self.server.delay = 0.2
+        env = dict(os.environ, SIGMAEPSILON_USERDATA_PATH=self.examples_path)
+        args = [self.examples_path, downloads.DATA_URL, "file_4.txt"]
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", DOWNLOAD_SCRIPT] + args,
+                env=env,
+                stdout=subprocess.PIPE,
+            )
+            for _ in range(4)
+        ]
+        paths = set()
+        for process in processes:
+            out, _ = process.communicate(timeout=60)
+            self.assertEqual(process.returncode, 0)
+            paths.add(out.decode().strip())
+        self.assertEqual(len(paths), 1)
+        self.assertDownloaded(paths.pop(), "file_4.txt")
+        self.assertEqual(len(self.server.requests), 1)
+        # all the entries of the processes made it into the manifest
+        self.assertEqual(list(downloads._load_manifest()), ["file_4.txt"])
+
+    def test_manifest_updates(self):
+        names = [f"name_{i}.txt" for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for name in names:
+                path = os.path.join(self.examples_path, name)
+                with open(path, "wb") as f:
+                    f.write(b"data")
+            list(
+                executor.map(
+                    lambda name: downloads._record_file(
+                        name, os.path.join(self.examples_path, name), None
+                    ),
+                    names,
+                )
+            )
+        self.assertEqual(sorted(downloads._load_manifest()), sorted(names))
+
+    def test_publish_from_data_repository(self):
+        with tempfile.TemporaryDirectory() as data_path:
+            os.makedirs(os.path.join(data_path, "Data", "folder"))
+            with open(os.path.join(data_path, "Data", "file.txt"), "wb") as f:
+                f.write(b"file")
+            with open(os.path.join(data_path, "Data", "folder", "a.txt"), "wb") as f:
+                f.write(b"a")
+            with patch.object(downloads, "DATA_PATH", data_path):
+                path = downloads.download_file("file.txt")
+                folder = downloads.download_file("folder")
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"file")
+            self.assertTrue(os.path.isfile(os.path.join(folder, "a.txt")))
+            # the sources are left untouched
+            source = os.path.join(data_path, "Data", "file.txt")
+            self.assertTrue(os.path.isfile(source))
+        # no temporary files are left behind
+        expected = [
+            downloads.LOCKS_DIRNAME,
+            downloads.MANIFEST_FILENAME,
+            downloads.MANIFEST_LOCK_FILENAME,
+            "file.txt",
+            "folder",
+        ]
+        self.assertEqual(sorted(os.listdir(self.examples_path)), sorted(expected))
+
+
+def _zip_bytes(members: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        for name, data in members.items():
+            zip_ref.writestr(name, data)
+    return buffer.getvalue()
+
+    def test_reserved_names(self):
+        # a dataset with the name of the manifest of earlier versions
+        self.server.files["manifest.json"] = b"{}"
+        path = downloads.download_file("manifest.json")
+        self.assertDownloaded(path, "manifest.json")
+        self.assertIn("manifest.json", downloads._load_manifest())
+        for name in [
+            downloads.MANIFEST_FILENAME,
+            downloads.MANIFEST_LOCK_FILENAME,
+            downloads.LOCKS_DIRNAME,
+            ".tmp_file.txt",
+        ]:
+            self.server.files[name] = b"{}"
+            self.assertRaises(ValueError, downloads.download_file, name)
+        self.assertEqual(len(self.server.requests), 1)
+
+
+class TestArchives(DataServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.members = {
+            "bundle/a.txt": b"a" * 1000,
+            "bundle/sub/b.txt": os.urandom(5000),
+            "bundle/c.bin": os.urandom(3000),
+        }
+        self.server.files["bundle.zip"] = _zip_bytes(self.members)
+
+    def test_download_archive(self):
+        calls = []
+        path = downloads.download_file(
+            "bundle.zip", progress=lambda done, total: calls.append((done, total))
+        )
+        self.assertEqual(path, os.path.join(self.examples_path, "bundle"))
+        for name, data in self.members.items():
+            with open(os.path.join(self.examples_path, name), "rb") as f:
+                self.assertEqual(f.read(), data)
+        total = sum(len(data) for data in self.members.values())
+        self.assertEqual(calls[0], (0, total))
+        self.assertEqual(calls[-1], (total, total))
+        self.assertEqual(calls, sorted(calls))
+        # served from the manifest
+        self.assertEqual(downloads.download_file("bundle.zip"), path)
+        self.assertEqual(len(self.server.requests), 1)
+        entry = downloads._load_manifest()["bundle.zip"]
+        self.assertEqual(entry["path"], "bundle.zip")
+        self.assertEqual(entry["extracted"], "bundle")
+
+    def test_lazy_archive(self):
+        with downloads.open_archive("bundle.zip") as archive:
+            self.assertEqual(sorted(archive.namelist()), sorted(self.members))
+            self.assertEqual(archive.read("bundle/a.txt"), self.members["bundle/a.txt"])
+            with archive.open("bundle/c.bin") as f:
+                self.assertEqual(f.read(), self.members["bundle/c.bin"])
+            self.assertFalse(os.path.exists(os.path.join(self.examples_path, "bundle")))
+
+            path = archive.extract("bundle/c.bin")
+            self.assertEqual(path, os.path.join(self.examples_path, "bundle", "c.bin"))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), self.members["bundle/c.bin"])
+            self.assertFalse(
+                os.path.exists(os.path.join(self.examples_path, "bundle", "a.txt"))
+            )
+            self.assertEqual(archive.extract("bundle/c.bin"), path)
+
+            path = archive.extract("bundle/sub/")
+            self.assertTrue(os.path.isfile(os.path.join(path, "b.txt")))
+            self.assertRaises(KeyError, archive.extract, "bundle/missing.txt")
+            self.assertRaises(ValueError, archive.extract, "../outside.txt")
+
+        # the archive is extracted without downloading it again
+        path = downloads.download_file("bundle.zip")
+        self.assertTrue(os.path.isfile(os.path.join(path, "a.txt")))
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertRaises(ValueError, downloads.open_archive, "file_0.txt")
+
+    def test_reserved_members(self):
+        members = {
+            "reserved/a.txt": b"a",
+            downloads.MANIFEST_FILENAME: b"{}",
+            downloads.LOCKS_DIRNAME + "/other.lock": b"",
+        }
+        self.server.files["reserved.zip"] = _zip_bytes(members)
+        downloads.download_file("file_0.txt")
+        manifest = dict(downloads._load_manifest())
+        with self.assertWarns(UserWarning):
+            path = downloads.download_file("reserved.zip")
+        self.assertTrue(os.path.isfile(os.path.join(path, "a.txt")))
+        expected = sorted(manifest) + ["reserved.zip"]
+        self.assertEqual(sorted(downloads._load_manifest()), expected)
+        lock_path = os.path.join(self.examples_path, downloads.LOCKS_DIRNAME)
+        self.assertNotIn("other.lock", os.listdir(lock_path))
+        with downloads.open_archive("reserved.zip") as archive:
+            self.assertRaises(
+                ValueError, archive.extract, downloads.MANIFEST_FILENAME
+            )
+
+
+class TestMappedFiles(DataServerTestCase):
+    def test_map_file(self):
+        data = self.server.files["file_7.txt"]
+        with downloads.map_file("file_7.txt") as mapped:
+            self.assertEqual(len(mapped), len(data))
+            self.assertEqual(mapped.mmap[:10], data[:10])
+            view = mapped.memoryview()
+            self.assertTrue(view.readonly)
+            self.assertEqual(view.tobytes(), data)
+            with self.assertRaises(TypeError):
+                view[0] = 0
+            view.release()
+            array = mapped.asarray()
+            self.assertIsInstance(array, np.memmap)
+            self.assertTrue(np.array_equal(array, np.frombuffer(data, dtype=np.uint8)))
+            self.assertFalse(array.flags.writeable)
+            del array
+        self.assertTrue(mapped.closed)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_asarray(self):
+        values = np.arange(24, dtype=np.float64)
+        self.server.files["values.bin"] = values.tobytes()
+        mapped = downloads.map_file("values.bin")
+        array = mapped.asarray(dtype=np.float64, shape=(4, 6))
+        self.assertTrue(np.array_equal(array, values.reshape(4, 6)))
+        array = mapped.asarray(dtype=np.float64, offset=8 * 6)
+        self.assertTrue(np.array_equal(array, values[6:]))
+        del array
+        mapped.close()
+
+    def test_empty_file(self):
+        self.server.files["empty.bin"] = b""
+        with downloads.map_file("empty.bin") as mapped:
+            self.assertIsNone(mapped.mmap)
+            self.assertEqual(len(mapped), 0)
+            self.assertEqual(mapped.memoryview().tobytes(), b"")
+
+    def test_map_directory(self):
+        self.server.files["bundle.zip"] = _zip_bytes({"bundle/a.txt": b"a"})
+        self.assertRaises(IsADirectoryError, downloads.map_file, "bundle.zip")
+
+
+class TestRetrievers(DataServerTestCase):
+    handler_class = _KeepAliveDataRequestHandler
+
+    def make_mirror(self, *names):
+        mirror = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, mirror, True)
+        for name in names:
+            with open(os.path.join(mirror, name), "wb") as f:
+                f.write(self.server.files[name])
+        return mirror
+
+    def test_mirror_directory(self):
+        mirror = self.make_mirror("file_0.txt")
+        downloads.register_retriever(downloads.mirror_retriever(mirror))
+        path = downloads.download_file("file_0.txt")
+        self.assertDownloaded(path, "file_0.txt")
+        self.assertEqual(len(self.server.requests), 0)
+        entry = downloads._load_manifest()["file_0.txt"]
+        self.assertEqual(entry["url"], os.path.join(mirror, "file_0.txt"))
+        # the mirror doesn't have the file, falls back to the repository
+        path = downloads.download_file("file_1.txt")
+        self.assertDownloaded(path, "file_1.txt")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_file_url(self):
+        mirror = self.make_mirror("file_2.txt")
+        url = pathlib.Path(mirror).as_uri()
+        downloads.register_retriever(downloads.mirror_retriever(url))
+        path = downloads.download_file("file_2.txt")
+        self.assertDownloaded(path, "file_2.txt")
+        self.assertEqual(len(self.server.requests), 0)
+
+    def test_http_mirror_and_redirects(self):
+        mirror = downloads.DATA_URL + "/redirect"
+        downloads.register_retriever(downloads.mirror_retriever(mirror + "/"))
+        path = downloads.download_file("file_3.txt")
+        self.assertDownloaded(path, "file_3.txt")
+        names = [name for name, _ in self.server.requests]
+        self.assertEqual(names, ["redirect/file_3.txt", "file_3.txt"])
+
+        # the mirror is missing a file, falls back to the repository
+        downloads.register_retriever(
+            downloads.mirror_retriever(downloads.DATA_URL + "/missing")
+        )
+        path = downloads.download_file("file_4.txt")
+        self.assertDownloaded(path, "file_4.txt")
+
+    def test_retriever_order(self):
+        calls = []
+
+        def first(filename):
+            calls.append("first")
+            return None
+
+        def last(filename):
+            calls.append("last")
+            return None
+
+        downloads.register_retriever(first)
+        downloads.register_retriever(last, index=len(downloads.get_retrievers()))
+        self.assertIs(downloads.get_retrievers()[0], first)
+        self.assertIs(downloads.get_retrievers()[-1], last)
+        downloads.download_file("file_5.txt")
+        self.assertEqual(calls, ["first"])
+
+        downloads.unregister_retriever(first)
+        self.assertNotIn(first, downloads.get_retrievers())
+        self.assertRaises(HTTPError, downloads.download_file, "missing.txt")
+        self.assertEqual(calls, ["first", "last"])
+        downloads._retrievers[:] = [first]
+        self.assertRaises(FileNotFoundError, downloads.download_file, "missing.txt")
+
+    def test_connection_pool(self):
+        for name in ["file_0.txt", "file_1.txt", "file_2.txt", "file_3.txt"]:
+            path = downloads.download_file(name)
+            self.assertDownloaded(path, name)
+        self.assertEqual(len(self.server.connections), 1)
+        # a broken connection is not reused
+        self.server.failures["file_4.txt"] = 1
+        path = downloads.download_file("file_4.txt")
+        self.assertDownloaded(path, "file_4.txt")
+        self.assertEqual(len(self.server.connections), 2)
+
+    def test_proxy(self):
+        proxy = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyRequestHandler)
+        proxy.requests = []
+        thread = threading.Thread(
+            target=proxy.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(proxy.server_close)
+        self.addCleanup(proxy.shutdown)
+        host, port = proxy.server_address
+        proxy_url = f"http://user:secret@{host}:{port}"
+
+        with patch.dict(os.environ, {"HTTP_PROXY": proxy_url}):
+            path = downloads.download_file("file_0.txt")
+            self.assertDownloaded(path, "file_0.txt")
+            self.server.failures["file_1.txt"] = 1
+            path = downloads.download_file("file_1.txt")
+            self.assertDownloaded(path, "file_1.txt")
+        url = downloads.DATA_URL + "/file_0.txt"
+        self.assertEqual(proxy.requests[0][0], url)
+        auth = "Basic " + base64.b64encode(b"user:secret").decode()
+        self.assertEqual(proxy.requests[0][1]["Proxy-Authorization"], auth)
+        # the resumed download went through the proxy as well
+        self.assertEqual(len(proxy.requests), 3)
+        offset = len(self.server.files["file_1.txt"]) // 2
+        self.assertEqual(proxy.requests[2][1]["Range"], f"bytes={offset}-")
+        self.assertEqual(len(proxy.requests), len(self.server.requests))
+
+        env = {"HTTP_PROXY": proxy_url, "NO_PROXY": "127.0.0.1"}
+        with patch.dict(os.environ, env):
+            path = downloads.download_file("file_2.txt")
+            self.assertDownloaded(path, "file_2.txt")
+        self.assertEqual(len(proxy.requests), 3)
+
+        # https is tunneled through the proxy
+        with patch.dict(os.environ, {"HTTPS_PROXY": f"{host}:{port}"}):
+            connection, headers = downloads._get_connection("https", "example.com")
+        self.assertIsInstance(connection, http.client.HTTPSConnection)
+        self.assertEqual((connection.host, connection.port), (host, port))
+        self.assertEqual(connection._tunnel_host, "example.com")
+        self.assertIsNone(headers)
+
+    def test_timeout(self):
+        self.server.stalls["file_0.txt"] = 1
+        with patch.object(downloads, "TIMEOUT", 0.1):
+            path = downloads.download_file("file_0.txt")
+        self.assertDownloaded(path, "file_0.txt")
+        self.assertEqual(len(self.server.requests), 2)
+        # the pooled connection is usable for later downloads
+        path = downloads.download_file("file_1.txt")
+        self.assertDownloaded(path, "file_1.txt")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_prefetch(self):
+        result = downloads.prefetch(["file_0.txt", "missing.txt", "file_0.txt"])
+        self.assertEqual(list(result), ["file_0.txt", "missing.txt"])
+        self.assertDownloaded(result["file_0.txt"], "file_0.txt")
+        self.assertIsInstance(result["missing.txt"], HTTPError)
+        self.assertEqual(downloads.prefetch([]), {})
+
+    def test_command_line(self):
+        mirror = self.make_mirror("file_6.txt", "file_7.txt")
+        list_path = os.path.join(mirror, "files.txt")
+        with open(list_path, "w") as f:
+            f.write("# files to prefetch\nfile_6.txt\n\nfile_7.txt\n")
+        with redirect_stdout(io.StringIO()) as out:
+            code = downloads.main(["-m", mirror, "-f", list_path, "-j", "2"])
+        self.assertEqual(code, 0)
+        self.assertIn("file_6.txt", out.getvalue())
+        self.assertEqual(len(self.server.requests), 0)
+        self.assertIsNotNone(downloads._lookup_file("file_7.txt"))
+        with redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(downloads.main(["missing.txt"]), 1)
+        self.assertIn("missing.txt", err.getvalue())
+
+
+class TestPopulate(DataServerTestCase):
+    def setUp(self):
+        super().setUp()
+        # on the filesystem of the examples directory, hard links are allowed
+        self.data_path = tempfile.mkdtemp(dir=os.path.dirname(self.examples_path))
+        self.addCleanup(shutil.rmtree, self.data_path, True)
+        os.makedirs(os.path.join(self.data_path, "Data", "folder"))
+        for name in ["file_0.txt", "file_1.txt", "folder/a.txt"]:
+            with open(os.path.join(self.data_path, "Data", name), "wb") as f:
+                f.write(self.server.files.get(name, b"a"))
+        patcher = patch.object(downloads, "DATA_PATH", self.data_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def source(self, name):
+        return os.path.join(self.data_path, "Data", name)
+
+    def test_hardlink(self):
+        path = downloads.download_file("file_0.txt", strategy="hardlink")
+        self.assertDownloaded(path, "file_0.txt")
+        self.assertTrue(os.path.samefile(path, self.source("file_0.txt")))
+        entry = downloads.get_cache_entry("file_0.txt")
+        self.assertEqual(entry["strategy"], "hardlink")
+        folder = downloads.download_file("folder", strategy="hardlink")
+        a_path = os.path.join(folder, "a.txt")
+        self.assertTrue(os.path.samefile(a_path, self.source("folder/a.txt")))
+        self.assertEqual(len(self.server.requests), 0)
+
+    def test_symlink(self):
+        path = downloads.download_file("file_0.txt", strategy="symlink")
+        self.assertTrue(os.path.islink(path))
+        self.assertDownloaded(path, "file_0.txt")
+        entry = downloads.get_cache_entry("file_0.txt")
+        self.assertEqual(entry["strategy"], "symlink")
+        # evicting the file removes the link, but not the source
+        downloads.prune_downloads(0)
+        self.assertFalse(os.path.lexists(path))
+        self.assertTrue(os.path.isfile(self.source("file_0.txt")))
+
+    def test_copy(self):
+        path = downloads.download_file("file_1.txt", strategy="copy")
+        self.assertDownloaded(path, "file_1.txt")
+        self.assertFalse(os.path.samefile(path, self.source("file_1.txt")))
+        entry = downloads.get_cache_entry("file_1.txt")
+        self.assertEqual(entry["strategy"], "copy")
+
+    def test_fallback(self):
+        def unsupported(path, local_path):
+            raise OSError("not supported")
+
+        functions = dict(downloads._POPULATE_FUNCTIONS, hardlink=unsupported)
+        with patch.dict(downloads._POPULATE_FUNCTIONS, functions):
+            path = downloads.download_file("file_0.txt")
+            strategies = ["symlink", "copy", "hardlink"]
+            path_1 = downloads.download_file("file_1.txt", strategy=strategies)
+        self.assertDownloaded(path, "file_0.txt")
+        self.assertDownloaded(path_1, "file_1.txt")
+        strategy = downloads.get_cache_entry("file_0.txt")["strategy"]
+        self.assertIn(strategy, ["reflink", "symlink"])
+        entry = downloads.get_cache_entry("file_1.txt")
+        self.assertEqual(entry["strategy"], "symlink")
+        with patch.dict(downloads._POPULATE_FUNCTIONS, functions):
+            self.assertRaises(
+                OSError, downloads.download_file, "folder", strategy="hardlink"
+            )
+        # no temporary files are left behind
+        expected = [
+            downloads.LOCKS_DIRNAME,
+            downloads.MANIFEST_FILENAME,
+            downloads.MANIFEST_LOCK_FILENAME,
+            "file_0.txt",
+            "file_1.txt",
+        ]
+        self.assertEqual(sorted(os.listdir(self.examples_path)), sorted(expected))
+
+    def test_invalid_strategy(self):
+        self.assertRaises(
+            ValueError, downloads.download_file, "file_0.txt", strategy="move"
+        )
+        self.assertRaises(
+            ValueError, downloads.download_file, "file_0.txt", strategy=[]
+        )
+        self.assertIsNone(downloads.get_cache_entry("file_0.txt"))
+
+    def test_downloaded_files(self):
+        # not in the data repository, downloaded from the server
+        path = downloads.download_file("file_2.txt", strategy="hardlink")
+        self.assertDownloaded(path, "file_2.txt")
+        entry = downloads.get_cache_entry("file_2.txt")
+        self.assertEqual(entry["strategy"], "download")
+        with self.assertRaises(TypeError):
+            entry["strategy"] = "copy"
+
+
+class TestAsync(DataServerTestCase):
+    def test_adownload_file(self):
+        self.server.delay = 0.3
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticker = asyncio.create_task(tick())
+            try:
+                return await downloads.adownload_file("file_0.txt")
+            finally:
+                ticker.cancel()
+
+        path = asyncio.run(run())
+        self.assertDownloaded(path, "file_0.txt")
+        # the event loop kept running while the file was being downloaded
+        self.assertGreater(len(ticks), 10)
+        # the cache is shared with the synchronous api
+        self.assertEqual(downloads.download_file("file_0.txt"), path)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(asyncio.run(downloads.adownload_file("file_0.txt")), path)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_adownload_files(self):
+        self.server.delay = 0.1
+        names = [f"file_{i}.txt" for i in range(6)]
+        paths = asyncio.run(downloads.adownload_files(names + names[:2], 2))
+        self.assertEqual(len(paths), 8)
+        for path, name in zip(paths, names + names[:2]):
+            self.assertDownloaded(path, name)
+        self.assertEqual(len(self.server.requests), 6)
+        self.assertEqual(self.server.max_active, 2)
+        self.assertEqual(asyncio.run(downloads.adownload_files([])), [])
+        with self.assertRaises(ValueError):
+            asyncio.run(downloads.adownload_files(names, 0))
+
+    def test_same_file(self):
+        """
+        Concurrent coroutines retrieving the same file share the download.
+        """
+        self.server.delay = 0.1
+
+        async def run():
+            return await asyncio.gather(
+                *(downloads.adownload_file("file_1.txt") for _ in range(4))
+            )
+
+        paths = asyncio.run(run())
+        self.assertEqual(len(set(paths)), 1)
+        self.assertDownloaded(paths[0], "file_1.txt")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_errors(self):
+        with self.assertRaises(HTTPError):
+            asyncio.run(downloads.adownload_files(["file_0.txt", "missing.txt"]))
+        with self.assertRaises(ValueError):
+            asyncio.run(downloads.adownload_file("file_2.txt", strategy="move"))
+
+    def test_benchmark(self):
+        """
+        Bounded concurrency must be faster than downloading the files one by
+        one.
+        """
+        self.server.delay = 0.05
+        names = [f"file_{i}.txt" for i in range(8)]
+        t0 = time.perf_counter()
+        asyncio.run(downloads.adownload_files(names[:4], max_workers=1))
+        t_serial = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        asyncio.run(downloads.adownload_files(names[4:], max_workers=4))
+        t_concurrent = time.perf_counter() - t0
+        self.assertLess(t_concurrent, t_serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+import sigmaepsilon.core as sc
+
+
+# modules that must not be imported by a plain `import sigmaepsilon.core`
+HEAVY_MODULES = [
+    "appdirs",
+    "toml",
+    "importlib.metadata",
+    "sigmaepsilon.core.wrapping",
+    "sigmaepsilon.core.cp",
+    "sigmaepsilon.core.infix",
+    "sigmaepsilon.core.attr",
+    "sigmaepsilon.core.config",
+]
+
+LAZY_ATTRS = [
+    "__version__",
+    "__description__",
+    "SIGMAEPSILON_DATA_PATH",
+    "USER_DATA_PATH",
+    "EXAMPLES_PATH",
+] + sc.__all__
+
+IMPORT_SCRIPT = """
+import sys, time, json
+t0 = time.perf_counter()
+import sigmaepsilon.core as sc
+t1 = time.perf_counter()
+if {eager}:
+    for name in {attrs!r}:
+        getattr(sc, name)
+t2 = time.perf_counter()
+print(json.dumps({{"modules": list(sys.modules), "time": t2 - t0}}))
+"""
+
+
+def _run_import(eager: bool, data_home: str) -> dict:
+    env = dict(os.environ)
+    env.pop("SIGMAEPSILON_USERDATA_PATH", None)
+    env.pop("SIGMAEPSILON_DATA_PATH", None)
+    env["XDG_DATA_HOME"] = data_home
+    script = IMPORT_SCRIPT.format(eager=eager, attrs=LAZY_ATTRS)
+    out = subprocess.check_output([sys.executable, "-c", script], env=env)
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+class TestImport(unittest.TestCase):
+    def test_lazy_import(self):
+        with tempfile.TemporaryDirectory() as data_home:
+            res = _run_import(False, data_home)
+            for module in HEAVY_MODULES:
+                self.assertNotIn(module, res["modules"])
+            # no filesystem I/O at import time
+            self.assertEqual(os.listdir(data_home), [])
+
+            res = _run_import(True, data_home)
+            self.assertIn("sigmaepsilon.core.wrapping", res["modules"])
+            self.assertTrue(os.path.isdir(os.path.join(data_home, "SIGMAEPSILON")))
+
+    def test_lazy_attributes(self):
+        for name in LAZY_ATTRS:
+            self.assertTrue(hasattr(sc, name))
+            self.assertIn(name, dir(sc))
+        from sigmaepsilon.core.wrapping import Wrapper
+
+        self.assertIs(sc.Wrapper, Wrapper)
+        self.assertIn("Wrapper", vars(sc))
+        self.assertEqual(sc.__pkg_name__, "sigmaepsilon.core")
+        self.assertTrue(isinstance(sc.__version__, str))
+        self.assertRaises(AttributeError, getattr, sc, "_not_an_attribute_")
+
+    def test_import_benchmark(self):
+        """
+        The lazy import must be faster than resolving everything eagerly.
+        The best of a few runs is compared to reduce noise.
+        """
+        with tempfile.TemporaryDirectory() as data_home:
+            t_lazy = min(_run_import(False, data_home)["time"] for _ in range(3))
+            t_eager = min(_run_import(True, data_home)["time"] for _ in range(3))
+        self.assertLess(t_lazy, t_eager)
+
+
+if __name__ == "__main__":
+    unittest.main()
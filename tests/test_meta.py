@@ -1,12 +1,41 @@
 # -*- coding: utf-8 -*-
 import unittest
-from abc import abstractmethod
+import timeit
+import os
+import sys
+import subprocess
+from abc import abstractmethod, ABCMeta
 
 from sigmaepsilon.core.abstract import ABC_Safe, ABC_Weak, ABC_Strong
+from sigmaepsilon.core.meta import (
+    ABCMeta_Safe,
+    ABCMeta_Strong,
+    checks_enabled,
+    set_checks_enabled,
+)
+
+
+def _deep_hierarchy(metaclass, depth: int = 30, n_methods: int = 10) -> type:
+    base = ABCMeta("Base", (), {})
+    for d in range(depth):
+        namespace = {f"m{d}_{i}": lambda self: None for i in range(n_methods)}
+        # strong classes must delay the abstracts of their parents
+        for k in range(0 if metaclass is ABCMeta_Strong else d, d + 1):
+            namespace[f"abstract_{k}"] = abstractmethod(lambda self: None)
+        base = metaclass(f"Base{d}", (base,), namespace)
+    return base
 
 
 class TestMeta(unittest.TestCase):
 
+    def setUp(self):
+        # the tests run with strict checks, even if Python runs with -O
+        self._checks_enabled = checks_enabled()
+        set_checks_enabled(True)
+
+    def tearDown(self):
+        set_checks_enabled(self._checks_enabled)
+
     def test_meta_weak(self):
         """
         Explicit notation of an abstract method in a base class is
@@ -138,7 +167,165 @@ class TestMeta(unittest.TestCase):
         except:
             has_error = True
         assert has_error
-        
-        
+
+
+    def test_meta_strong_reports_missing_abstracts(self):
+
+        class ABC_Parent_Strong(ABC_Strong):
+
+            @abstractmethod
+            def b(self):
+                pass
+
+            @abstractmethod
+            def a(self):
+                pass
+
+        with self.assertRaises(TypeError) as cm:
+
+            class ABC_Child_Strong(ABC_Parent_Strong):
+                pass
+
+        self.assertIn("abstract method a of class ABC_Parent_Strong", str(cm.exception))
+
+    def test_meta_safe_inherited_and_metaclass_attributes(self):
+
+        class ABC_Parent_Safe(ABC_Safe):
+            value = 1
+
+        class ABC_Child_Safe(ABC_Parent_Safe):
+            pass
+
+        for method in ["value", "register", "mro"]:
+            with self.assertRaises(TypeError):
+                ABCMeta_Safe("ABC_GrandChild_Safe", (ABC_Child_Safe,), {method: print})
+
+    def test_meta_safe_modified_bases(self):
+
+        class ABC_Parent_Safe(ABC_Safe):
+            def a(self):
+                pass
+
+        class ABC_Child_Safe(ABC_Parent_Safe):
+            pass
+
+        ABCMeta_Safe("ABC_GrandChild_Safe", (ABC_Child_Safe,), {"b": print})
+        # attributes added to a base after it has been used are found
+        ABC_Parent_Safe.b = lambda self: None
+        with self.assertRaises(TypeError):
+            ABCMeta_Safe("ABC_GrandChild_Safe", (ABC_Child_Safe,), {"b": print})
+        # and removed attributes can be defined again
+        del ABC_Parent_Safe.a
+        ABCMeta_Safe("ABC_GrandChild_Safe", (ABC_Child_Safe,), {"a": print})
+
+        class ABC_Other_Safe(ABC_Safe):
+            def g(self):
+                pass
+
+        ABCMeta_Safe("ABC_GrandChild_Safe", (ABC_Child_Safe,), {"g": print})
+        # so are the attributes of new bases
+        ABC_Child_Safe.__bases__ = (ABC_Other_Safe,)
+        with self.assertRaises(TypeError):
+            ABCMeta_Safe("ABC_GrandChild_Safe", (ABC_Child_Safe,), {"g": print})
+
+        class Meta(ABCMeta_Safe):
+            def __getattr__(cls, name):
+                if name == "dynamic":
+                    return 1
+                raise AttributeError(name)
+
+        class ABC_Dynamic_Safe(metaclass=Meta):
+            pass
+
+        with self.assertRaises(TypeError):
+            Meta("ABC_Child_Safe", (ABC_Dynamic_Safe,), {"dynamic": print})
+
+        class Mixin:
+            pass
+
+        class ABC_Mixed_Safe(ABC_Safe, Mixin):
+            pass
+
+        ABCMeta_Safe("ABC_Child_Safe", (ABC_Mixed_Safe,), {"c": print})
+        Mixin.c = 1
+        with self.assertRaises(TypeError):
+            ABCMeta_Safe("ABC_Child_Safe", (ABC_Mixed_Safe,), {"c": print})
+
+    def test_class_creation_benchmark(self):
+        """
+        Measures the overhead of the strong and safe metaclasses over ABCMeta
+        when subclassing a deep hierarchy.
+        """
+        namespace = {f"x_{i}": lambda self: None for i in range(20)}
+
+        def run(metaclass, namespace):
+            base = _deep_hierarchy(metaclass)
+            create = lambda: metaclass("Child", (base,), dict(namespace))
+            return min(timeit.repeat(create, number=200, repeat=5))
+
+        t_abc = run(ABCMeta, namespace)
+        t_safe = run(ABCMeta_Safe, namespace)
+        namespace.update({f"abstract_{d}": lambda self: None for d in range(30)})
+        t_strong = run(ABCMeta_Strong, namespace)
+        self.assertLess(t_safe, 3 * t_abc)
+        self.assertLess(t_strong, 3 * t_abc)
+
+    def test_disable_checks(self):
+
+        class ABC_Parent_Strong(ABC_Strong):
+
+            @abstractmethod
+            def abcParentStrong(self):
+                pass
+
+        class ABC_Parent_Safe(ABC_Safe):
+
+            def funcParentSafe(self):
+                pass
+
+        enabled = checks_enabled()
+        try:
+            set_checks_enabled(False)
+            self.assertFalse(checks_enabled())
+
+            class ABC_Child_Strong(ABC_Parent_Strong):
+                pass
+
+            class ABC_Child_Safe(ABC_Parent_Safe):
+
+                def funcParentSafe(self):
+                    pass
+
+            # the behaviour of ABCMeta is kept
+            self.assertRaises(TypeError, ABC_Child_Strong)
+
+            set_checks_enabled(True)
+            with self.assertRaises(TypeError):
+
+                class ABC_Child_Safe(ABC_Parent_Safe):
+
+                    def funcParentSafe(self):
+                        pass
+
+        finally:
+            set_checks_enabled(enabled)
+
+    def test_checks_default(self):
+        script = "from sigmaepsilon.core.meta import checks_enabled; print(checks_enabled())"
+
+        def run(*flags, value=None):
+            env = dict(os.environ)
+            env.pop("SIGMAEPSILON_METACLASS_CHECKS", None)
+            if value is not None:
+                env["SIGMAEPSILON_METACLASS_CHECKS"] = value
+            cmd = [sys.executable, *flags, "-c", script]
+            return subprocess.check_output(cmd, env=env).decode().strip()
+
+        self.assertEqual(run(), "True")
+        self.assertEqual(run("-O"), "False")
+        self.assertEqual(run("-O", value="1"), "True")
+        self.assertEqual(run(value="0"), "False")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 import unittest
+import gc
 
-from sigmaepsilon.core.cp import classproperty
+from abc import ABCMeta
+
+from sigmaepsilon.core.cp import classproperty, ClassPropertyMeta, cachedproperty
 
 
 class TestProperty(unittest.TestCase):
@@ -16,6 +19,271 @@ class TestProperty(unittest.TestCase):
 
         self.assertEqual(TestClasss.prop, 1)
 
+    def test_lazy_class_property(self):
+        calls = []
+
+        class TestClass:
+
+            @classproperty(lazy=True)
+            def prop(cls):
+                calls.append(cls)
+                return len(calls)
+
+        class TestSubClass(TestClass):
+            ...
+
+        prop = vars(TestClass)["prop"]
+        self.assertEqual(TestClass.prop, 1)
+        self.assertEqual(TestClass.prop, 1)
+        self.assertEqual(TestSubClass.prop, 2)
+
+        prop.invalidate(TestClass)
+        self.assertEqual(TestClass.prop, 3)
+        self.assertEqual(TestSubClass.prop, 2)
+
+        prop.invalidate_all()
+        self.assertEqual(TestSubClass.prop, 4)
+        self.assertEqual(TestClass.prop, 5)
+
+    def test_lazy_class_property_hit_path_is_lock_free(self):
+
+        class TestClass:
+
+            @classproperty(lazy=True)
+            def prop(cls):
+                return 1
+
+        class FailingLock:
+            def __enter__(self):
+                raise AssertionError("the lock must not be acquired")
+
+            def __exit__(self, *args):
+                pass
+
+        prop = vars(TestClass)["prop"]
+        self.assertEqual(TestClass.prop, 1)
+        prop._lock = FailingLock()
+        self.assertEqual(TestClass.prop, 1)
+
+    def test_lazy_class_property_does_not_leak(self):
+
+        class TestClass:
+
+            @classproperty(lazy=True)
+            def prop(cls):
+                return 1
+
+        prop = vars(TestClass)["prop"]
+        self.assertEqual(TestClass.prop, 1)
+        for _ in range(10):
+            subclass = type("TestSubClass", (TestClass,), {})
+            self.assertEqual(subclass.prop, 1)
+        del subclass
+        gc.collect()
+        self.assertEqual(len(prop._cache), 1)
+
+    def test_writable_class_property(self):
+
+        class TestClass(metaclass=ClassPropertyMeta):
+            _value = 1
+
+            @classproperty
+            def prop(cls):
+                return cls._value
+
+            @prop.setter
+            def prop(cls, value):
+                cls._value = value
+
+            @prop.deleter
+            def prop(cls):
+                cls._value = None
+
+            @classproperty
+            def readonly(cls):
+                return 1
+
+        TestClass.prop = 2
+        self.assertEqual(TestClass.prop, 2)
+        self.assertEqual(TestClass()._value, 2)
+        del TestClass.prop
+        self.assertIsNone(TestClass.prop)
+        self.assertTrue(isinstance(vars(TestClass)["prop"], classproperty))
+
+        self.assertRaises(AttributeError, setattr, TestClass, "readonly", 2)
+        self.assertRaises(AttributeError, delattr, TestClass, "readonly")
+        self.assertRaises(AttributeError, setattr, TestClass(), "prop", 2)
+        self.assertRaises(AttributeError, delattr, TestClass(), "prop")
+
+        TestClass.other = 1
+        self.assertEqual(TestClass.other, 1)
+        del TestClass.other
+        self.assertFalse(hasattr(TestClass, "other"))
+
+    def test_writable_class_property_requires_metaclass(self):
+        # the error raised by __set_name__ is wrapped in a RuntimeError
+        # before Python 3.12
+        with self.assertRaises((TypeError, RuntimeError)) as cm:
+
+            class TestClass:
+                @classproperty
+                def prop(cls):
+                    return 1
+
+                @prop.setter
+                def prop(cls, value):
+                    pass
+
+        error = cm.exception
+        if isinstance(error, RuntimeError):
+            error = error.__cause__
+        self.assertIsInstance(error, TypeError)
+        self.assertIn("ClassPropertyMeta", str(error))
+
+        with self.assertRaises((TypeError, RuntimeError)):
+
+            class TestClass:
+                prop = classproperty(lambda cls: 1, fdel=lambda cls: None)
+
+        class TestClass:
+            @classproperty
+            def prop(cls):
+                return 1
+
+        self.assertEqual(TestClass.prop, 1)
+
+    def test_lazy_writable_class_property(self):
+        calls = []
+
+        class Meta(ClassPropertyMeta, ABCMeta):
+            ...
+
+        class TestClass(metaclass=Meta):
+            _value = 1
+            _factor = 1
+
+            @classproperty(lazy=True, depends_on=["_factor"])
+            def prop(cls):
+                calls.append(cls)
+                return cls._value * cls._factor
+
+            @prop.setter
+            def prop(cls, value):
+                cls._value = value
+
+        class TestSubClass(TestClass):
+            ...
+
+        self.assertEqual(TestClass.prop, 1)
+        self.assertEqual(TestSubClass.prop, 1)
+        self.assertEqual(len(calls), 2)
+
+        # the setter invalidates the cache of the class and its subclasses
+        TestClass.prop = 2
+        self.assertEqual(TestClass.prop, 2)
+        self.assertEqual(TestSubClass.prop, 2)
+        self.assertEqual(len(calls), 4)
+
+        # changing a dependency invalidates the cache
+        TestSubClass._factor = 3
+        self.assertEqual(TestSubClass.prop, 6)
+        self.assertEqual(TestClass.prop, 2)
+        self.assertEqual(len(calls), 5)
+
+        # other attributes don't
+        TestClass._other = 1
+        self.assertEqual(TestClass.prop, 2)
+        self.assertEqual(len(calls), 5)
+
+    def test_cached_property(self):
+        calls = []
+
+        class TestClass:
+            def __init__(self, a, b):
+                self.a = a
+                self.b = b
+
+            @cachedproperty(depends_on=["a"])
+            def prop(self):
+                calls.append(self)
+                return self.a * self.b
+
+        class TestSubClass(TestClass):
+            @cachedproperty(depends_on=["b"])
+            def other(self):
+                return self.b + 1
+
+        obj = TestClass(1, 2)
+        self.assertEqual(obj.prop, 2)
+        self.assertEqual(obj.prop, 2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(obj.__dict__["prop"], 2)
+
+        # reassigning a dependency invalidates the cache
+        obj.a = 2
+        self.assertEqual(obj.prop, 4)
+        self.assertEqual(len(calls), 2)
+
+        # other attributes don't
+        obj.b = 3
+        self.assertEqual(obj.prop, 4)
+        self.assertEqual(len(calls), 2)
+
+        vars(TestClass)["prop"].invalidate(obj)
+        self.assertEqual(obj.prop, 6)
+        self.assertEqual(len(calls), 3)
+
+        obj = TestSubClass(1, 2)
+        self.assertEqual(obj.prop, 2)
+        self.assertEqual(obj.other, 3)
+        obj.b = 3
+        self.assertEqual(obj.other, 4)
+        obj.a = 2
+        self.assertEqual(obj.prop, 6)
+        del obj.a
+        self.assertNotIn("prop", obj.__dict__)
+
+    def test_cached_property_assigned_later(self):
+        class TestClass:
+            pass
+
+        TestClass.prop = cachedproperty(lambda self: 1)
+        obj = TestClass()
+        self.assertRaises(TypeError, getattr, obj, "prop")
+        self.assertEqual(vars(obj), {})
+
+        # calling __set_name__ explicitly makes it work
+        TestClass.prop.__set_name__(TestClass, "prop")
+        self.assertEqual(obj.prop, 1)
+        self.assertEqual(vars(obj), {"prop": 1})
+
+    def test_slotted_cached_property(self):
+        calls = []
+
+        class TestClass:
+            __slots__ = ("a", "_prop")
+
+            def __init__(self, a):
+                self.a = a
+
+            @cachedproperty(depends_on=["a"], slot="_prop")
+            def prop(self):
+                calls.append(self)
+                return self.a * 2
+
+            @cachedproperty
+            def unslotted(self):
+                return 1
+
+        obj = TestClass(1)
+        self.assertEqual(obj.prop, 2)
+        self.assertEqual(obj.prop, 2)
+        self.assertEqual(len(calls), 1)
+        obj.a = 2
+        self.assertEqual(obj.prop, 4)
+        self.assertEqual(len(calls), 2)
+        self.assertRaises(TypeError, getattr, obj, "unslotted")
+
 
 if __name__ == "__main__":
     unittest.main()
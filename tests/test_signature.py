@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+import unittest
+import gc
+import weakref
+import timeit
+import threading
+import numbers
+from collections.abc import Sequence
+from typing import List
+from unittest.mock import patch
+from typing import Any, Union, Optional
+
+from sigmaepsilon.core.signature import (
+    Signature,
+    CompiledSignature,
+    normalize_type,
+    Dispatcher,
+)
+from sigmaepsilon.core import signature as sigmodule
+
+
+def f_int(x: int, y: float) -> int:
+    return int(x + y)
+
+
+def f_union(x: Union[int, str], y: Any) -> Union[int, str]:
+    return x
+
+
+def f_plain(x, y):
+    return x
+
+
+class TestSignature(unittest.TestCase):
+    def test_normalize_type(self):
+        self.assertIs(normalize_type(Any), Any)
+        self.assertEqual(normalize_type(int), frozenset({int}))
+        self.assertEqual(normalize_type(Union[int, str]), frozenset({int, str}))
+        self.assertEqual(normalize_type(int | str), frozenset({int, str}))
+        self.assertEqual(normalize_type(Optional[int]), frozenset({int, type(None)}))
+
+    def test_from_function(self):
+        sig = Signature.from_function(f_int, "a")
+        self.assertEqual(sig["name"], "f_int")
+        self.assertEqual(sig["arity"], 2)
+        self.assertEqual(sig["dtype"], [int, float])
+        self.assertEqual(sig["rtype"], int)
+        self.assertEqual(sig["attrs"], frozenset({"a"}))
+        # the returned signatures are independent of each other
+        sig["dtype"].append(str)
+        self.assertEqual(Signature.from_function(f_int)["dtype"], [int, float])
+
+    def test_compile(self):
+        sig = Signature.from_function(f_union)
+        compiled = sig.compile()
+        self.assertIsInstance(compiled, CompiledSignature)
+        self.assertEqual(compiled.dtype, (frozenset({int, str}), Any))
+        self.assertEqual(compiled.rtype, frozenset({int, str}))
+        hash(compiled)
+        self.assertIs(compiled, Signature.from_function(f_union).compile())
+
+    def test_compatible_function(self):
+        s_int = Signature.from_function(f_int)
+        s_union = Signature.from_function(f_union)
+        s_plain = Signature.from_function(f_plain)
+        self.assertTrue(s_plain.compatible_function(s_int))
+        self.assertTrue(s_plain.compatible_function(s_union))
+        self.assertFalse(s_int.compatible_function(s_plain))
+        self.assertFalse(s_int.compatible_function(s_union))
+        self.assertTrue(s_union.compatible_function(s_union))
+        self.assertFalse(s_int.compatible_function(None))
+
+        def g(x: int, y: float) -> float:
+            ...
+
+        self.assertFalse(s_union.compatible_function(Signature.from_function(g)))
+
+        def h(x: int, y: float) -> int:
+            ...
+
+        self.assertTrue(s_union.compatible_function(Signature.from_function(h)))
+
+    def test_unhashable_annotations(self):
+        def f(a: [int]) -> int:
+            ...
+
+        def g(a: [int]) -> int:
+            ...
+
+        s_f = Signature.from_function(f)
+        s_int = Signature.from_function(f_int)
+        self.assertFalse(s_f.compatible_function(s_int))
+        self.assertFalse(s_int.compatible_function(s_f))
+        self.assertTrue(s_f.compatible_function(Signature.from_function(g)))
+        self.assertTrue(Signature.from_function(f_plain).compatible_function(s_f))
+        self.assertRaises(TypeError, s_f.compile)
+        self.assertRaises(TypeError, normalize_type, [int])
+        self.assertFalse(Signature("abstract", rtype=[int]).accepts_property(1))
+
+    def test_caches_are_bounded(self):
+        for cache in [
+            sigmodule._normalize_type_cached,
+            sigmodule._compatible_types,
+            sigmodule._compatible_signatures,
+            sigmodule._compile,
+            sigmodule._accepts_types,
+        ]:
+            self.assertEqual(cache.cache_info().maxsize, sigmodule.CACHE_SIZE)
+
+    def test_accepts_property(self):
+        sig = Signature("abstract", rtype=Union[int, str])
+        self.assertTrue(sig.accepts_property(1))
+        self.assertTrue(sig.accepts_property("a"))
+        self.assertFalse(sig.accepts_property(1.0))
+        self.assertFalse(sig.accepts_property(None))
+        self.assertTrue(Signature("abstract", rtype=Any).accepts_property(1.0))
+        self.assertFalse(Signature(rtype=Any).accepts_property(1.0))
+
+    def test_accepts_parameters(self):
+        sig = Signature.from_function(f_union)
+        self.assertTrue(sig.accepts_parameters(1, None))
+        self.assertTrue(sig.accepts_parameters("a", 1.0))
+        self.assertTrue(sig.accepts_parameters(True, 1.0))
+        self.assertFalse(sig.accepts_parameters(1.0, 1.0))
+        self.assertFalse(sig.accepts_parameters(1))
+        self.assertFalse(sig.accepts_parameters(1, 2, 3))
+        sig = Signature.from_function(f_int)
+        self.assertTrue(sig.accepts_parameters(1, 1.0))
+        self.assertFalse(sig.accepts_parameters(1, 1))
+
+        def noargs():
+            ...
+
+        self.assertTrue(Signature.from_function(noargs).accepts_parameters())
+
+    def test_accepts_parameters_batch(self):
+        sig = Signature.from_function(f_int)
+        rows = [(1, 1.0), (1, 1), ("a", 1.0), (1,), (2, 3.0)]
+        self.assertEqual(
+            sig.accepts_parameters_batch(rows),
+            [sig.accepts_parameters(*row) for row in rows],
+        )
+        self.assertEqual(sig.accepts_parameters_batch(iter(rows[:2])), [True, False])
+        self.assertEqual(sig.accepts_parameters_batch([]), [])
+
+    def test_abstract_base_classes(self):
+        def f(x: numbers.Number, y: Sequence) -> None:
+            ...
+
+        sig = Signature.from_function(f)
+        self.assertTrue(sig.accepts_parameters(1.5, (1,)))
+        self.assertTrue(sig.accepts_parameters(1, [1]))
+        self.assertFalse(sig.accepts_parameters("a", (1,)))
+        self.assertFalse(sig.accepts_parameters(1, {1}))
+        self.assertEqual(
+            sig.accepts_parameters_batch([(1.5, (1,)), ("a", (1,))]), [True, False]
+        )
+
+    def test_string_annotations(self):
+        def f(x: "int", y: "Union[str, None]") -> "int":
+            ...
+
+        sig = Signature.from_function(f)
+        self.assertEqual(sig["dtype"], [int, Union[str, None]])
+        self.assertTrue(sig.accepts_parameters(1, "x"))
+        self.assertFalse(sig.accepts_parameters("x", "x"))
+        rows = [(1, "x"), (1, 1)]
+        self.assertEqual(sig.accepts_parameters_batch(rows), [True, False])
+
+        def g(x: int, y: "Undefined"):
+            ...
+
+        sig = Signature.from_function(g)
+        self.assertEqual(sig["dtype"], [int, "Undefined"])
+        self.assertRaises(TypeError, sig.accepts_parameters, 1, "x")
+        self.assertRaises(TypeError, sig.accepts_parameters_batch, [(1, "x")])
+
+    def test_accepts_parameters_batch_benchmark(self):
+        """
+        The batch form must be faster than checking the argument tuples
+        one by one.
+        """
+        sig = Signature.from_function(f_union)
+        rows = [(1, 2.0), ("a", None), (1.0, 2)] * 1000
+        t_batch = min(
+            timeit.repeat(lambda: sig.accepts_parameters_batch(rows), number=3, repeat=5)
+        )
+        t_single = min(
+            timeit.repeat(
+                lambda: [sig.accepts_parameters(*row) for row in rows],
+                number=3,
+                repeat=5,
+            )
+        )
+        self.assertLess(t_batch, t_single)
+
+    def test_function_cache_is_weak(self):
+        def tmp(x: int) -> int:
+            return x
+
+        Signature.from_function(tmp)
+        self.assertIn(tmp, sigmodule._function_data_cache)
+        ref = weakref.ref(tmp)
+        del tmp
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_benchmark(self):
+        """
+        Comparing compiled signatures must be faster than comparing the
+        signatures, which includes compiling them.
+        """
+        s1 = Signature.from_function(f_plain)
+        s2 = Signature.from_function(f_union)
+        c1, c2 = s1.compile(), s2.compile()
+        t_sig = min(
+            timeit.repeat(lambda: s1.compatible_function(s2), number=2000, repeat=5)
+        )
+        t_compiled = min(
+            timeit.repeat(lambda: c1.compatible_function(c2), number=2000, repeat=5)
+        )
+        self.assertLess(t_compiled, t_sig)
+
+
+class TestDispatcher(unittest.TestCase):
+    def setUp(self):
+        add = Dispatcher("add")
+
+        @add.register
+        def add_int(a: int, b: int) -> int:
+            return "int"
+
+        @add.register
+        def add_num(a: Union[int, float], b: Union[int, float]) -> float:
+            return "num"
+
+        @add.register
+        def add_str(a: str, b: Any) -> str:
+            return "str"
+
+        @add.register
+        def add_any(a, b, c):
+            return "any3"
+
+        @add.register
+        def add_none():
+            return "none"
+
+        self.add = add
+
+    def test_dispatch(self):
+        add = self.add
+        self.assertEqual(add(1, 2), "int")
+        self.assertEqual(add(1, 2.0), "num")
+        self.assertEqual(add(1.0, 2.0), "num")
+        self.assertEqual(add("a", None), "str")
+        self.assertEqual(add(1, "a", None), "any3")
+        self.assertEqual(add(), "none")
+        # subclasses are accepted
+        self.assertEqual(add(True, False), "int")
+        self.assertRaises(TypeError, add, None, None)
+        self.assertRaises(TypeError, add, 1)
+        self.assertEqual(len(add.functions), 5)
+        self.assertIn("add", repr(add))
+
+    def test_cache(self):
+        add = self.add
+        self.assertIs(add.resolve(int, float), add.resolve(int, float))
+        self.assertIn((int, float), add._cache)
+
+        @add.register
+        def add_mixed(a: int, b: float) -> float:
+            return "mixed"
+
+        # registration invalidates the cache
+        self.assertNotIn((int, float), add._cache)
+        self.assertEqual(add(1, 2.0), "mixed")
+        add.clear_cache()
+        self.assertEqual(len(add._cache), 0)
+
+    def test_abstract_base_classes(self):
+        d = Dispatcher("d")
+
+        @d.register
+        def d_number(a: numbers.Number, b: Sequence) -> str:
+            return "number"
+
+        @d.register
+        def d_integral(a: numbers.Integral, b: Sequence) -> str:
+            return "integral"
+
+        @d.register
+        def d_object(a: object, b: object) -> str:
+            return "object"
+
+        self.assertEqual(d(1.5, (1,)), "number")
+        self.assertEqual(d(1, [1]), "integral")
+        self.assertEqual(d(1.5, {1}), "object")
+
+    def test_cache_is_bounded(self):
+        add = self.add
+        classes = [type(f"C{i}", (int,), {}) for i in range(10)]
+        with patch.object(sigmodule, "CACHE_SIZE", 4):
+            for cls in classes:
+                self.assertEqual(add(cls(1), cls(2)), "int")
+        self.assertEqual(len(add._cache), 4)
+        self.assertEqual(list(add._cache), [(cls, cls) for cls in classes[-4:]])
+
+    def test_string_annotations(self):
+        add = Dispatcher("add")
+
+        @add.register
+        def add_int(a: "int", b: "Union[int, float]") -> "int":
+            return "int"
+
+        self.assertEqual(add(1, 2.0), "int")
+        self.assertRaises(TypeError, add, 1.0, 2.0)
+
+        def undefined(a: "Undefined"):
+            ...
+
+        def generic(a: List[int]):
+            ...
+
+        def unhashable(a: [int]):
+            ...
+
+        for funcobj in [undefined, generic, unhashable]:
+            with self.assertRaises(TypeError):
+                add.register(funcobj)
+        self.assertEqual(len(add.functions), 1)
+
+    def test_concurrent_registration(self):
+        """
+        A registration during the resolution of an implementation must not
+        leave the outdated result in the cache.
+        """
+        add = self.add
+        resolve = add._resolve
+        threads = []
+
+        def add_mixed(a: int, b: float) -> float:
+            return "mixed"
+
+        def resolve_and_register(types):
+            result = resolve(types)
+            thread = threading.Thread(target=add.register, args=(add_mixed,))
+            thread.start()
+            thread.join(0.1)
+            threads.append(thread)
+            return result
+
+        with patch.object(add, "_resolve", resolve_and_register):
+            self.assertEqual(add.resolve(int, float)(1, 2.0), "num")
+        threads[0].join()
+        self.assertEqual(add(1, 2.0), "mixed")
+
+    def test_benchmark(self):
+        """
+        Cached dispatch must be faster than resolving an implementation
+        for every call.
+        """
+        add = self.add
+        args = (1, 2.0)
+        types = (int, float)
+        add(*args)
+        t_cached = min(timeit.repeat(lambda: add(*args), number=2000, repeat=5))
+        t_resolve = min(
+            timeit.repeat(lambda: add._resolve(types), number=2000, repeat=5)
+        )
+        self.assertLess(t_cached, t_resolve)
+
+
+if __name__ == "__main__":
+    unittest.main()
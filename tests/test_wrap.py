@@ -1,7 +1,21 @@
 # -*- coding: utf-8 -*-
 import unittest
+import timeit
+import tracemalloc
+import weakref
+import gc
 
-from sigmaepsilon.core.wrapping import Wrapper, customwrapper, wrap, wrapper
+import numpy as np
+
+from sigmaepsilon.core.wrapping import (
+    Wrapper,
+    customwrapper,
+    wrap,
+    wrapper,
+    proxyclass,
+    SlottedWrapper,
+    WrapperBase,
+)
 
 
 class TestWrap(unittest.TestCase):
@@ -65,7 +79,244 @@ class TestWrap(unittest.TestCase):
         
         obj = CustomWrapper(a=2)
         assert obj['a'] == 2
-        
+
+    def test_fast_delegation(self):
+        @customwrapper(wraptype=np.ndarray, fastdelegation=True)
+        class FastWrapper:
+            def trace(self):
+                return "trace in wrapper"
+
+        arr = np.eye(3)
+        w = FastWrapper(arr)
+        self.assertEqual(w.sum(), 3.0)
+        self.assertIn("sum", w.__dict__)
+        self.assertEqual(w.shape, (3, 3))
+        self.assertNotIn("shape", w.__dict__)
+        self.assertEqual(w.trace(), "trace in wrapper")
+        self.assertEqual(w[0, 0], 1.0)
+        w[0, 0] = 2.0
+        self.assertEqual(arr[0, 0], 2.0)
+        self.assertRaises(AttributeError, getattr, w, "_not_an_attribute_")
+
+        # the cache is invalidated when a new object is wrapped
+        w.wrap(np.zeros((2, 2)))
+        self.assertNotIn("sum", w.__dict__)
+        self.assertEqual(w.sum(), 0.0)
+        self.assertEqual(w.shape, (2, 2))
+
+        class DictWrapper(Wrapper):
+            fastdelegation = True
+
+        w = DictWrapper(wrap=dict(a=1))
+        self.assertEqual(w["a"], 1)
+        self.assertRaises(KeyError, w.__getitem__, "b")
+        w.wrap(1)
+        self.assertRaises(TypeError, w.__getitem__, "a")
+        self.assertRaises(TypeError, w.__setitem__, "a", 1)
+
+        class ListBase:
+            def __getitem__(self, index):
+                return "base"
+
+        @customwrapper(fastdelegation=True)
+        class ItemWrapper(ListBase):
+            ...
+
+        w = ItemWrapper(wrap=[1, 2])
+        self.assertEqual(w[0], "base")
+        w[0] = 3
+        self.assertEqual(w.wrapped, [3, 2])
+
+    def test_proxy(self):
+        @customwrapper(wraptype=np.ndarray, proxy=True)
+        class ArrayWrapper:
+            def trace(self):
+                return "trace in wrapper"
+
+        self.assertIs(proxyclass(np.ndarray), proxyclass(np.ndarray))
+        self.assertIn(proxyclass(np.ndarray), ArrayWrapper.__mro__)
+
+        w = ArrayWrapper(np.ones(3))
+        self.assertEqual(w.trace(), "trace in wrapper")
+        self.assertTrue(np.all(w + 1 == 2))
+        self.assertTrue(np.all(1 + w == 2))
+        self.assertEqual(len(w), 3)
+        self.assertEqual(list(w), [1.0, 1.0, 1.0])
+        self.assertEqual(np.sum(w), 3.0)
+        self.assertEqual(w @ w, 3.0)
+        self.assertTrue(isinstance(np.asarray(w), np.ndarray))
+        self.assertEqual(w.shape, (3,))
+        w.shape = (3, 1)
+        self.assertEqual(w.wrapped.shape, (3, 1))
+        w[0, 0] = 5.0
+        self.assertEqual(w[0, 0], 5.0)
+
+        # in-place operators keep the wrapper
+        w_ = w
+        w += 1
+        self.assertIs(w, w_)
+        self.assertEqual(w[0, 0], 6.0)
+
+        class DictWrapper(Wrapper, proxyclass(dict)):
+            wraptype = dict
+
+        w = DictWrapper(dict(a=1))
+        self.assertTrue("a" in w)
+        self.assertEqual(list(w.keys()), ["a"])
+        self.assertRaises(TypeError, hash, w)
+
+        self.assertRaises(ValueError, customwrapper, proxy=True)
+
+    def test_proxy_registry_is_weak(self):
+        Dynamic = type("Dynamic", (), {"method": lambda self: 1})
+        proxy = proxyclass(Dynamic)
+        self.assertIs(proxy.proxiedtype, Dynamic)
+        self.assertIs(proxyclass(Dynamic), proxy)
+        refs = weakref.ref(Dynamic), weakref.ref(proxy)
+        del Dynamic, proxy
+        # the proxy class becomes garbage once the type has been collected
+        gc.collect()
+        gc.collect()
+        self.assertIsNone(refs[0]())
+        self.assertIsNone(refs[1]())
+
+    def test_slotted_wrapper(self):
+        @customwrapper(wraptype=np.ndarray, slots=True)
+        class ArrayWrapper:
+            __slots__ = ()
+
+            def trace(self):
+                return "trace in wrapper"
+
+        w = ArrayWrapper(np.eye(3))
+        self.assertTrue(isinstance(w, SlottedWrapper))
+        self.assertTrue(isinstance(w, WrapperBase))
+        self.assertFalse(hasattr(w, "__dict__"))
+        self.assertEqual(w.trace(), "trace in wrapper")
+        self.assertEqual(w.sum(), 3.0)
+        self.assertEqual(w[0, 0], 1.0)
+        self.assertRaises(TypeError, weakref.ref, w)
+        self.assertRaises(AttributeError, getattr, w, "_not_an_attribute_")
+
+        @customwrapper(wraptype=np.ndarray, slots=True, weakref=True, fastdelegation=True)
+        class ArrayWrapper:
+            __slots__ = ()
+
+        w = ArrayWrapper(np.eye(3))
+        self.assertIs(weakref.ref(w)(), w)
+        self.assertEqual(w.sum(), 3.0)
+        w.wrap(np.zeros(3))
+        self.assertEqual(w.sum(), 0.0)
+
+    def test_layout_of_bases(self):
+        """
+        Wrappers can extend types with an instance layout of their own.
+        """
+
+        class Slotted:
+            __slots__ = ("a",)
+
+        for base in (dict, list, Slotted):
+            w = wrapper(base)(wrap=np.eye(3))
+            self.assertIsInstance(w, base)
+            self.assertEqual(w.sum(), 3.0)
+            w = customwrapper(wraptype=np.ndarray)(base)(np.eye(3))
+            self.assertIsInstance(w, base)
+            self.assertEqual(w.sum(), 3.0)
+            self.assertEqual(len(w.wrap_many([np.eye(2)])), 1)
+
+        w = wrapper(Slotted)(wrap=1)
+        w.a = 2
+        self.assertEqual((w.a, w.wrapped), (2, 1))
+        self.assertNotIn("_wrapped", Wrapper.__dict__)
+        self.assertNotIn("_wrapped", WrapperBase.__dict__)
+
+    def test_memory_benchmark(self):
+        """
+        Compares the memory footprint of wrappers with and without slots.
+        """
+
+        class SlottedArrayWrapper(SlottedWrapper):
+            __slots__ = ()
+
+        def footprint(cls, n=1000):
+            arr = np.eye(3)
+            tracemalloc.start()
+            try:
+                wrappers = [cls(wrap=arr) for _ in range(n)]
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            del wrappers
+            return size / n
+
+        self.assertLess(footprint(SlottedArrayWrapper), footprint(Wrapper))
+
+    def test_wrap_many(self):
+        class ArrayWrapper(Wrapper):
+            wraptype = np.ndarray
+
+        arrays = [np.eye(3) for _ in range(10)]
+        wrappers = ArrayWrapper.wrap_many(arrays)
+        self.assertTrue(isinstance(wrappers, tuple))
+        self.assertEqual(len(wrappers), 10)
+        self.assertTrue(all(w.wrapped is a for w, a in zip(wrappers, arrays)))
+        self.assertEqual(wrappers[0].sum(), 3.0)
+
+        wrappers = ArrayWrapper.iwrap_many(iter(arrays))
+        self.assertIs(next(wrappers).wrapped, arrays[0])
+
+        self.assertRaises(TypeError, ArrayWrapper.wrap_many, arrays + [1])
+
+        class SlottedArrayWrapper(SlottedWrapper):
+            __slots__ = ()
+            wraptype = np.ndarray
+
+        wrappers = SlottedArrayWrapper.wrap_many(arrays)
+        self.assertEqual(wrappers[-1].sum(), 3.0)
+
+        wrappers = Wrapper.wrap_many([1, "a", None])
+        self.assertEqual([w.wrapped for w in wrappers], [1, "a", None])
+
+    def test_wrap_many_benchmark(self):
+        """
+        Compares wrapping objects one by one with the batch API.
+        """
+
+        class ArrayWrapper(Wrapper):
+            wraptype = np.ndarray
+
+        arrays = [np.eye(3) for _ in range(1000)]
+        t_init = min(
+            timeit.repeat(
+                lambda: [ArrayWrapper(a) for a in arrays], number=10, repeat=5
+            )
+        )
+        t_batch = min(
+            timeit.repeat(lambda: ArrayWrapper.wrap_many(arrays), number=10, repeat=5)
+        )
+        self.assertLess(t_batch, t_init)
+
+    def test_delegation_benchmark(self):
+        """
+        Compares method calls on a NumPy array directly, through a
+        wrapper and through a wrapper in fast delegation mode.
+        """
+
+        class FastWrapper(Wrapper):
+            fastdelegation = True
+
+        arr = np.eye(3)
+        w = wrap(arr)
+        fw = FastWrapper(wrap=arr)
+        number = 20000
+        t_direct = min(timeit.repeat(arr.copy, number=number, repeat=5))
+        t_wrapper = min(timeit.repeat(lambda: w.copy(), number=number, repeat=5))
+        t_fast = min(timeit.repeat(lambda: fw.copy(), number=number, repeat=5))
+        self.assertLess(t_direct, t_wrapper)
+        self.assertLess(t_fast, t_wrapper)
+
+
 if __name__ == "__main__":
     
     unittest.main()